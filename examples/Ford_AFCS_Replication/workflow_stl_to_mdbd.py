@@ -3,76 +3,39 @@
 """
 
 import pyvista as pv
-from SPI2py.models.mechanics.maximal_disjoint_ball_decomposition import mdbd
+from SPI2py.models.geometry.mdbd_cache import convert_stl_files_to_mdbd
+from SPI2py.models.utilities.input_and_output import write_xyzr_file
 
-# Create an STL file for each part
-radiator_and_ion_exchanger = pv.Cube(bounds=(0.0, 2.850, 0.0, 0.830, 0.0, 0.830))
-radiator_and_ion_exchanger.save('models/stl/radiator_and_ion_exchanger.stl')
+part_names = ['radiator_and_ion_exchanger', 'pump', 'particle_filter',
+              'fuel_cell_stack', 'WEG_heater_and_pump', 'heater_core']
 
-pump = pv.Cube(bounds=(0.0, 0.450, 0.0, 0.450, 0.0, 0.450))
-pump.save('models/stl/pump.stl')
+# The conversion workers re-import this module, so only the main process may write the STL files
+if __name__ == '__main__':
 
-particle_filter = pv.Cube(bounds=(0.0, 0.489, 0.0, 0.330, 0.0, 0.330))
-particle_filter.save('models/stl/particle_filter.stl')
+    # Create an STL file for each part
+    radiator_and_ion_exchanger = pv.Cube(bounds=(0.0, 2.850, 0.0, 0.830, 0.0, 0.830))
+    radiator_and_ion_exchanger.save('models/stl/radiator_and_ion_exchanger.stl')
 
-fuel_cell_stack = pv.Cube(bounds=(0.0, 1.800, 0.0, 1.600, 0.0, 1.600))
-fuel_cell_stack.save('models/stl/fuel_cell_stack.stl')
+    pump = pv.Cube(bounds=(0.0, 0.450, 0.0, 0.450, 0.0, 0.450))
+    pump.save('models/stl/pump.stl')
 
-WEG_heater_and_pump = pv.Cube(bounds=(0.0, 1.655, 0.0, 1.833, 0.0, 1.833))
-WEG_heater_and_pump.save('models/stl/WEG_heater_and_pump.stl')
+    particle_filter = pv.Cube(bounds=(0.0, 0.489, 0.0, 0.330, 0.0, 0.330))
+    particle_filter.save('models/stl/particle_filter.stl')
 
-heater_core = pv.Cube(bounds=(0.0, 1.345, 0.0, 0.460, 0.0, 0.460))
-heater_core.save('models/stl/heater_core.stl')
+    fuel_cell_stack = pv.Cube(bounds=(0.0, 1.800, 0.0, 1.600, 0.0, 1.600))
+    fuel_cell_stack.save('models/stl/fuel_cell_stack.stl')
 
-# Perform MDBD on each part
-num_spheres = 1000
-min_radius = 0.001
-meshgrid_increment = 100
+    WEG_heater_and_pump = pv.Cube(bounds=(0.0, 1.655, 0.0, 1.833, 0.0, 1.833))
+    WEG_heater_and_pump.save('models/stl/WEG_heater_and_pump.stl')
 
-mdbd('models/',
-     'stl/radiator_and_ion_exchanger.stl',
-     'mdbd/radiator_and_ion_exchanger.xyzr',
-     num_spheres=num_spheres,
-     min_radius=min_radius,
-     meshgrid_increment=meshgrid_increment,
-     plot=False)
+    heater_core = pv.Cube(bounds=(0.0, 1.345, 0.0, 0.460, 0.0, 0.460))
+    heater_core.save('models/stl/heater_core.stl')
 
-mdbd('models/',
-        'stl/pump.stl',
-        'mdbd/pump.xyzr',
-        num_spheres=num_spheres,
-        min_radius=min_radius,
-        meshgrid_increment=meshgrid_increment,
-        plot=False)
+    # Perform MDBD on each part, reusing the cached conversions of unchanged parts
+    sphere_sets = convert_stl_files_to_mdbd([f'models/stl/{name}.stl' for name in part_names],
+                                            'models/mdbd/cache',
+                                            n_spheres=1000,
+                                            n_steps=100)
 
-mdbd('models/',
-        'stl/particle_filter.stl',
-        'mdbd/particle_filter.xyzr',
-        num_spheres=num_spheres,
-        min_radius=min_radius,
-        meshgrid_increment=meshgrid_increment,
-        plot=False)
-
-mdbd('models/',
-        'stl/fuel_cell_stack.stl',
-        'mdbd/fuel_cell_stack.xyzr',
-        num_spheres=num_spheres,
-        min_radius=min_radius,
-        meshgrid_increment=meshgrid_increment,
-        plot=False)
-
-mdbd('models/',
-        'stl/WEG_heater_and_pump.stl',
-        'mdbd/WEG_heater_and_pump.xyzr',
-        num_spheres=num_spheres,
-        min_radius=min_radius,
-        meshgrid_increment=meshgrid_increment,
-        plot=False)
-
-mdbd('models/',
-        'stl/heater_core.stl',
-        'mdbd/heater_core.xyzr',
-        num_spheres=num_spheres,
-        min_radius=min_radius,
-        meshgrid_increment=meshgrid_increment,
-        plot=False)
\ No newline at end of file
+    for name, (sphere_points, sphere_radii) in zip(part_names, sphere_sets):
+        write_xyzr_file(f'models/mdbd/{name}.xyzr', sphere_points, sphere_radii)
@@ -0,0 +1,41 @@
+"""Benchmarks the throughput of the segment distance kernels in evaluations per second."""
+
+import time
+
+import numpy as np
+import jax
+import jax.numpy as jnp
+
+from SPI2py.models.mechanics.distance import minimum_distances_segments_segments, minimum_distances_points_segments
+
+
+def benchmark(name, function, *args, n_repeats=20):
+
+    # Compile and warm up
+    jax.block_until_ready(function(*args))
+
+    start = time.perf_counter()
+    for _ in range(n_repeats):
+        jax.block_until_ready(function(*args))
+    elapsed = (time.perf_counter() - start) / n_repeats
+
+    n_evaluations = args[0].shape[0]
+    print(f"{name:<45} {n_evaluations / elapsed:>14,.0f} evaluations/s")
+
+
+n = 1_000_000
+rng = np.random.default_rng(0)
+points, starts_1, stops_1, starts_2, stops_2 = (jnp.array(rng.normal(size=(n, 3))) for _ in range(5))
+
+segments_segments = jax.jit(minimum_distances_segments_segments)
+points_segments = jax.jit(minimum_distances_points_segments)
+segments_segments_grad = jax.jit(jax.grad(lambda *args: jnp.sum(minimum_distances_segments_segments(*args)),
+                                          argnums=(0, 1, 2, 3)))
+points_segments_grad = jax.jit(jax.grad(lambda *args: jnp.sum(minimum_distances_points_segments(*args)),
+                                        argnums=(0, 1, 2)))
+
+benchmark('segment-segment', segments_segments, starts_1, stops_1, starts_2, stops_2)
+benchmark('segment-segment with points as segments', segments_segments, points, points, starts_2, stops_2)
+benchmark('point-segment', points_segments, points, starts_2, stops_2)
+benchmark('segment-segment gradient', segments_segments_grad, starts_1, stops_1, starts_2, stops_2)
+benchmark('point-segment gradient', points_segments_grad, points, starts_2, stops_2)
@@ -1,29 +1,27 @@
 import numpy as np
 import pyvista as pv
-from SPI2py.models.projection.grid import create_grid
+from SPI2py.models.physics.distributed.mesh import generate_mesh_vec
 from SPI2py.models.mechanics.transformations_rigidbody import transform_points
 from SPI2py.models.projection.projection import project_component, combine_densities
 from SPI2py.models.utilities.visualization import plot_grid, plot_spheres, plot_AABB, plot_stl_file
-from SPI2py.models.projection.grid_kernels import create_uniform_kernel
+from SPI2py.models.projection.mesh_kernels import create_uniform_kernel
 
 # Create grid
 el_size = 0.25
-el_centers = create_grid(0, 2, 0, 6.5, 0,  4.5, element_size=el_size)
+_, _, el_centers, nx, ny, nz, _, _, _ = generate_mesh_vec(0, 2, 0, 6.5, 0, 4.5, element_size=el_size)
+el_centers = el_centers.reshape(nx, ny, nz, 1, 3)
 
 # Read the mesh kernel
 # Slice by minimum radius instead of length to maintain kernel symmetry
-# >=10.0e-2 for up to 9 points
-# >=9.0e-2 for up to 33 points
-# >=6.0e-2 for up to 72 points
-# >=4.0e-2 for up to 181 points
-# >=3.0e-2 for up to 326 points
-# >=2.0e-2 for up to 832 points
+# >=10.0e-2 for up to 36 points
+# >=6.0e-2 for up to 45 points
+# >=4.0e-2 for up to 229 points
+# >=3.0e-2 for up to 386 points
+# >=2.0e-2 for up to 595 points
 # S_k = 10.0e-2
 # S_k = 9.0e-2
-# xyzr_kernel = np.loadtxt('csvs/mdbd_kernel.csv', delimiter=',')
-# xyzr_kernel = xyzr_kernel[xyzr_kernel[:, 3] >= S_k]
-# kernel_pos = xyzr_kernel[:, :3]
-# kernel_rad = xyzr_kernel[:, 3:4]
+# from SPI2py.models.projection.kernel_library import get_kernel
+# kernel_pos, kernel_rad = get_kernel('mdbd', min_radius=S_k)
 kernel_pos, kernel_rad = create_uniform_kernel(1, mode='circumscription')
 kernel_pos = kernel_pos.reshape(-1, 3)
 kernel_rad = kernel_rad.reshape(-1, 1)
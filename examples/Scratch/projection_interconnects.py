@@ -1,8 +1,9 @@
 import numpy as np
 import pyvista as pv
 
-from SPI2py.models.projection.grid import create_grid
-from SPI2py.models.projection.grid_kernels import create_uniform_kernel
+from SPI2py.models.physics.distributed.mesh import generate_mesh_vec
+from SPI2py.models.projection.mesh_kernels import create_uniform_kernel
+from SPI2py.models.projection.kernel_library import get_kernel
 from SPI2py.models.projection.projection import project_interconnect
 from SPI2py.models.utilities.visualization import plot_grid, plot_spheres, plot_capsules, plot_AABB
 
@@ -11,19 +12,18 @@ from SPI2py.models.utilities.visualization import plot_grid, plot_spheres, plot_
 # el_size = 0.5
 el_size = 0.25
 n, m, o = 3, 6, 3
-el_centers = create_grid(0,4,0,6,0,2, element_size=el_size)
+_, _, el_centers, nx, ny, nz, _, _, _ = generate_mesh_vec(0, 4, 0, 6, 0, 2, element_size=el_size)
+el_centers = el_centers.reshape(nx, ny, nz, 1, 3)
 
 # Read the mesh kernel
 # Slice by minimum radius instead of length to maintain kernel symmetry
 # S_k = 9.0e-2  # >=9.0e-2 for up to 33 points
 # S_k = 6.0e-2  # >=6.0e-2 for up to 73 points
-# xyzr_kernel = np.loadtxt('csvs/mdbd_kernel.csv', delimiter=',')
-# # xyzr_kernel = xyzr_kernel[0:1]
-# xyzr_kernel = xyzr_kernel[0:6]
-# # xyzr_kernel = xyzr_kernel[xyzr_kernel[:, 3] >= S_k]
-# kernel_pos = xyzr_kernel[:, :3]
-# kernel_rad = xyzr_kernel[:, 3:4]
-kernel_pos, kernel_rad = create_uniform_kernel(1, mode='circumscription')
+S_k = None
+if S_k is not None:
+    kernel_pos, kernel_rad = get_kernel('mdbd', min_radius=S_k)
+else:
+    kernel_pos, kernel_rad = create_uniform_kernel(1, mode='circumscription')
 # kernel_pos, kernel_rad = create_uniform_kernel(3, mode='inscription')
 kernel_pos = kernel_pos.reshape(-1, 3)
 kernel_rad = kernel_rad.reshape(-1, 1)
@@ -1,8 +1,11 @@
 import jax.numpy as jnp
-from jax import jacfwd
+from jax import jacfwd, jacrev
 from openmdao.api import ExplicitComponent, Group
 
-from ..models.computational_geometry.distance_calculations import signed_distances_spheres_spheres
+from ..models.geometry.sphere_trees import create_sphere_tree, refit_sphere_tree
+from ..models.mechanics.collision import find_close_component_pairs
+from ..models.mechanics.distance import signed_distances_spheres_spheres, signed_distances_sphere_pairs
+from ..models.utilities.aggregation import kreisselmeier_steinhauser_max
 
 
 # class CombinatorialCollisionDetection(Group):
@@ -93,3 +96,98 @@ from ..models.computational_geometry.distance_calculations import signed_distanc
 #         signed_distances = signed_distances_spheres_spheres(positions_a, radii_a, positions_b, radii_b)
 #         return signed_distances
 
+
+class MinimumSeparation(ExplicitComponent):
+    """
+    Calculates how much the closest pair of components violates a minimum separation.
+
+    The sphere pairs are found with sphere trees, so only the pairs within min_separation + cutoff_margin
+    are evaluated instead of every pair of spheres of every pair of components. The output is the KS
+    maximum of min_separation - separation over those pairs, which is feasible when it is at most zero.
+    """
+
+    def initialize(self):
+        self.options.declare('n_components', types=int, desc='Number of components')
+        self.options.declare('min_separation', types=(int, float), default=0.0, desc='Minimum separation between components')
+        self.options.declare('cutoff_margin', types=(int, float), default=0.1, desc='Separation beyond the minimum at which pairs are ignored')
+        self.options.declare('rho', types=(int, float), default=100, desc='KS aggregation parameter')
+
+    def setup(self):
+        n_components = self.options['n_components']
+
+        for i in range(n_components):
+            self.add_input(f'sphere_positions_{i}', shape_by_conn=True)
+            self.add_input(f'sphere_radii_{i}', shape_by_conn=True)
+
+        self.add_output('separation_violation', shape=(1,))
+
+        self._sphere_trees = None
+        self._sweep_order = None
+        self._component_pairs = None
+
+    def setup_partials(self):
+        n_components = self.options['n_components']
+
+        for i in range(n_components):
+            self.declare_partials('separation_violation', f'sphere_positions_{i}')
+            self.declare_partials('separation_violation', f'sphere_radii_{i}')
+
+    def compute(self, inputs, outputs):
+
+        # Get the input variables
+        positions, radii = self._get_spheres(inputs)
+
+        # Find the sphere pairs near the minimum separation
+        self._update_component_pairs(positions, radii)
+
+        # Calculate the separation violation
+        outputs['separation_violation'] = self._separation_violation(positions, radii, self._component_pairs)
+
+    def compute_partials(self, inputs, partials):
+
+        # Get the input variables
+        positions, radii = self._get_spheres(inputs)
+
+        # Calculate the jacobian for the pairs found by compute
+        jac_positions, jac_radii = jacrev(self._separation_violation, argnums=(0, 1))(positions, radii,
+                                                                                      self._component_pairs)
+
+        # Set the outputs
+        for i in range(self.options['n_components']):
+            partials['separation_violation', f'sphere_positions_{i}'] = jac_positions[i].reshape(1, -1)
+            partials['separation_violation', f'sphere_radii_{i}'] = jac_radii[i].reshape(1, -1)
+
+    def _get_spheres(self, inputs):
+        n_components = self.options['n_components']
+
+        positions = [jnp.array(inputs[f'sphere_positions_{i}']).reshape(-1, 3) for i in range(n_components)]
+        radii = [jnp.array(inputs[f'sphere_radii_{i}']).reshape(-1, 1) for i in range(n_components)]
+
+        return positions, radii
+
+    def _update_component_pairs(self, positions, radii):
+
+        # Create the sphere trees once and refit them as the components move
+        if self._sphere_trees is None:
+            self._sphere_trees = [create_sphere_tree(p, r) for p, r in zip(positions, radii)]
+        else:
+            self._sphere_trees = [refit_sphere_tree(sphere_tree, p, r)
+                                  for sphere_tree, p, r in zip(self._sphere_trees, positions, radii)]
+
+        cutoff = self.options['min_separation'] + self.options['cutoff_margin']
+        self._component_pairs, self._sweep_order = find_close_component_pairs(self._sphere_trees, cutoff,
+                                                                              order=self._sweep_order)
+
+    def _separation_violation(self, positions, radii, component_pairs):
+        min_separation = self.options['min_separation']
+
+        # Without nearby pairs, every separation exceeds the cutoff
+        if not component_pairs:
+            return jnp.array([-self.options['cutoff_margin']])
+
+        violations = [min_separation + signed_distances_sphere_pairs(positions[i], radii[i],
+                                                                     positions[j], radii[j], pair_list)
+                      for i, j, pair_list in component_pairs]
+
+        return kreisselmeier_steinhauser_max(jnp.concatenate(violations), rho=self.options['rho']).reshape(1)
+
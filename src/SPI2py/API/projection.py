@@ -9,7 +9,8 @@ from ..models.physics.distributed.mesh import generate_mesh_vec
 from ..models.projection.projection import project_component
 from ..models.projection.projection import project_interconnect
 from ..models.utilities.aggregation import kreisselmeier_steinhauser_max
-from ..models.projection.grid_kernels import create_uniform_kernel, apply_kernel
+from ..models.projection.mesh_kernels import create_uniform_kernel, apply_kernel
+from ..models.projection.kernel_accuracy import get_default_kernels, select_kernel
 
 
 
@@ -18,6 +19,8 @@ class Mesh(IndepVarComp):
 
         self.options.declare('bounds', types=tuple, desc='Bounds of the mesh')
         self.options.declare('n_elements_per_unit_length', types=float, desc='Number of elements per unit length')
+        self.options.declare('kernel_volume_tolerance', types=(int, float), default=None, allow_none=True,
+                             desc='If given, use the cheapest kernel whose volume error is within this tolerance')
 
     def setup(self):
 
@@ -65,7 +68,12 @@ class Mesh(IndepVarComp):
         # element_bounds = jnp.stack((x_min_element, x_max_element, y_min_element, y_max_element, z_min_element, z_max_element), axis=-1)
 
         # Read the MDBD kernel
-        uniform_8_kernel_positions, uniform_8_kernel_radii = create_uniform_kernel(1, mode='circumscription')
+        kernel_volume_tolerance = self.options['kernel_volume_tolerance']
+        if kernel_volume_tolerance is None:
+            uniform_8_kernel_positions, uniform_8_kernel_radii = create_uniform_kernel(1, mode='circumscription')
+        else:
+            kernel_name = select_kernel(kernel_volume_tolerance, element_size=element_size)
+            uniform_8_kernel_positions, uniform_8_kernel_radii = get_default_kernels()[kernel_name]
         kernel_positions = jnp.array(uniform_8_kernel_positions)
         kernel_radii = jnp.array(uniform_8_kernel_radii).reshape(-1, 1)
 
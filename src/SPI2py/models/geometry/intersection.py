@@ -1,5 +1,10 @@
+import numpy as np
 import jax.numpy as jnp
-from chex import assert_shape, assert_type
+from jax import jit
+from scipy.spatial import cKDTree
+
+from ..utilities.precision import get_kernel_dtype
+from ..utilities.validation import assert_shape, assert_type
 
 
 def volume_intersection_two_spheres(radii_1: jnp.ndarray,
@@ -10,9 +15,9 @@ def volume_intersection_two_spheres(radii_1: jnp.ndarray,
     # assert_shape(radii_1, (None, 1))
     # assert_shape(radii_2, (None, 1))
     # assert_shape(distances, (None, 1))
-    assert_type(radii_1, 'float64')
-    assert_type(radii_2, 'float64')
-    assert_type(distances, 'float64')
+    assert_type(radii_1, get_kernel_dtype())
+    assert_type(radii_2, get_kernel_dtype())
+    assert_type(distances, get_kernel_dtype())
 
     # Calculate volumes for all spheres
     volume_1 = (4 / 3) * jnp.pi * radii_1 ** 3
@@ -37,14 +42,61 @@ def volume_intersection_two_spheres(radii_1: jnp.ndarray,
     return overlap_volume
 
 
+def volume_intersection_two_spheres_derivative(radii_1: jnp.ndarray,
+                                               radii_2: jnp.ndarray,
+                                               distances: jnp.ndarray) -> jnp.ndarray:
+    """
+    Calculates the derivative of the intersection volume of two spheres with respect to the distance
+    between their centers.
+
+    While the spheres partially overlap, moving them apart removes a slab whose area is the circle of
+    intersection, so dV/dd = -pi * a^2, where a is the radius of that circle. The derivative is zero
+    when the spheres do not overlap or one is fully inside the other.
+    """
+
+    # Validate the inputs
+    assert_type(radii_1, get_kernel_dtype())
+    assert_type(radii_2, get_kernel_dtype())
+    assert_type(distances, get_kernel_dtype())
+
+    # Avoid dividing by zero for concentric spheres, which are always fully inside one another
+    safe_distances = jnp.where(distances > 0, distances, 1.0)
+
+    # Calculate the squared radius of the circle of intersection
+    circle_radii_squared = (4 * safe_distances ** 2 * radii_1 ** 2 - (safe_distances ** 2 - radii_2 ** 2 + radii_1 ** 2) ** 2) / (4 * safe_distances ** 2)
+    derivative = -jnp.pi * circle_radii_squared
+
+    # Zero the derivative when one sphere is fully inside the other or when they do not overlap
+    fully_inside = distances + jnp.minimum(radii_1, radii_2) <= jnp.maximum(radii_1, radii_2)
+    no_overlap = distances >= (radii_1 + radii_2)
+    derivative = jnp.where(fully_inside | no_overlap, jnp.zeros_like(derivative), derivative)
+
+    return derivative
+
+
 def total_overlap_volume(centers: jnp.ndarray,
-                         radii: jnp.ndarray) -> jnp.ndarray:
+                         radii: jnp.ndarray,
+                         method: str = 'dense') -> jnp.ndarray:
+    """
+    Calculates the total intersection volume of every pair of spheres.
+
+    Methods:
+    - 'dense': Compares every pair of spheres, which takes quadratic memory but can be jitted.
+    - 'neighbors': Only compares the pairs found by create_overlap_pair_list, which scales to large sphere sets.
+      Use create_overlap_pair_list and total_overlap_volume_pairs directly to differentiate.
+    """
+
+    if method == 'neighbors':
+        pair_list = create_overlap_pair_list(centers, radii)
+        return total_overlap_volume_pairs(centers, radii, pair_list)
+    elif method != 'dense':
+        raise ValueError("Invalid method. Use 'dense' or 'neighbors'.")
 
     # Validate the inputs
     assert_shape(centers, (None, 3))
     assert_shape(radii, (None, 1))
-    assert_type(centers, 'float64')
-    assert_type(radii, 'float64')
+    assert_type(centers, get_kernel_dtype())
+    assert_type(radii, get_kernel_dtype())
 
     # Reshape the arrays for broadcasting
     centers_a = centers.reshape(-1, 1, 3)
@@ -67,5 +119,106 @@ def total_overlap_volume(centers: jnp.ndarray,
     return total_overlap
 
 
+def create_overlap_pair_list(centers, radii):
+    """
+    Finds the pairs of spheres that overlap.
+
+    Two spheres can only overlap if their distance is less than twice the larger radius, so each sphere
+    only searches a KD-tree within twice its own radius and keeps the smaller neighbors. The cost scales
+    with the number of nearby pairs instead of the square of the number of spheres.
+
+    Parameters:
+    - centers: The sphere centers, shape (n, 3).
+    - radii: The sphere radii, shape (n, 1).
+
+    Returns:
+    - first: The index of the larger sphere of each pair, shape (n_pairs,).
+    - second: The index of the smaller sphere of each pair, shape (n_pairs,).
+    """
+
+    centers = np.asarray(centers, dtype=float).reshape(-1, 3)
+    radii = np.asarray(radii, dtype=float).reshape(-1)
+
+    # Find the candidates within twice the radius of each sphere
+    tree = cKDTree(centers)
+    neighbors = tree.query_ball_point(centers, 2 * radii, return_sorted=False)
+    counts = np.array([len(sphere_neighbors) for sphere_neighbors in neighbors])
+    first = np.repeat(np.arange(len(centers)), counts)
+    second = np.concatenate(neighbors).astype(int) if counts.sum() > 0 else np.zeros(0, dtype=int)
+
+    # Keep each pair once, from the larger sphere, breaking ties by index
+    is_smaller = (radii[second] < radii[first]) | ((radii[second] == radii[first]) & (second > first))
+    first = first[is_smaller]
+    second = second[is_smaller]
+
+    # Keep the pairs that overlap
+    distances = np.linalg.norm(centers[first] - centers[second], axis=1)
+    is_overlapping = distances < radii[first] + radii[second]
+
+    return first[is_overlapping], second[is_overlapping]
+
+
+def total_overlap_volume_pairs(centers: jnp.ndarray,
+                               radii: jnp.ndarray,
+                               pair_list: tuple,
+                               chunk_size: int = None) -> jnp.ndarray:
+    """
+    Calculates the total intersection volume of a list of sphere pairs.
+
+    The result and its derivatives with respect to the centers and radii match total_overlap_volume as
+    long as the pair list was created for the same spheres.
+
+    Parameters:
+    - centers: The sphere centers, shape (n, 3).
+    - radii: The sphere radii, shape (n, 1).
+    - pair_list: The output of create_overlap_pair_list.
+    - chunk_size: If given, the pairs are evaluated in chunks of this size to bound the memory use.
+
+    Returns:
+    - The total intersection volume.
+    """
+
+    # Validate the inputs
+    assert_shape(centers, (None, 3))
+    assert_shape(radii, (None, 1))
+    assert_type(centers, get_kernel_dtype())
+    assert_type(radii, get_kernel_dtype())
+
+    first, second = pair_list
+    n_pairs = len(first)
+
+    if n_pairs == 0:
+        return jnp.zeros((), dtype=radii.dtype)
+
+    if chunk_size is None:
+        chunk_size = n_pairs
+
+    # Pad the pairs to a whole number of chunks
+    n_chunks = -(-n_pairs // chunk_size)
+    n_padding = n_chunks * chunk_size - n_pairs
+    first = jnp.pad(jnp.asarray(first), (0, n_padding)).reshape(n_chunks, chunk_size)
+    second = jnp.pad(jnp.asarray(second), (0, n_padding)).reshape(n_chunks, chunk_size)
+    mask = jnp.pad(jnp.ones(n_pairs, dtype=bool), (0, n_padding)).reshape(n_chunks, chunk_size)
+
+    # Evaluate one chunk at a time, so the compiled chunk is reused for any number of pairs
+    return sum(_chunk_overlap_volume(centers, radii, first[i], second[i], mask[i]) for i in range(n_chunks))
+
+
+@jit
+def _chunk_overlap_volume(centers, radii, first, second, mask):
+    """
+    Calculates the total intersection volume of a chunk of sphere pairs, ignoring the masked pairs.
+    """
+
+    # Offset the padded pairs so that their distances stay differentiable
+    offsets = centers[first] - centers[second]
+    offsets = jnp.where(mask[:, None], offsets, 1.0)
+    distances = jnp.linalg.norm(offsets, axis=1)
+
+    volumes = volume_intersection_two_spheres(radii[first, 0], radii[second, 0], distances)
+
+    return jnp.sum(jnp.where(mask, volumes, 0.0))
+
+
 def volume_sphere_cap():
     raise NotImplementedError
@@ -0,0 +1,104 @@
+"""MDBD conversion cache
+
+Converts libraries of STL files to MDBD sphere sets in parallel and stores each result on disk under a
+key derived from the STL's contents and the conversion parameters, so unchanged parts are not converted again.
+"""
+
+import hashlib
+import json
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from .spheres import convert_stl_to_mdbd
+from ..utilities.input_and_output import read_xyzr_file, write_xyzr_file
+
+# Increment whenever the MDBD packing or SDF code changes its output, so older cache entries are not reused
+MDBD_CACHE_VERSION = 2
+
+
+def get_conversion_key(stl_path, **parameters):
+    """
+    Returns a key that changes whenever the STL file's contents, the conversion parameters, or
+    MDBD_CACHE_VERSION change.
+
+    Parameters:
+    - stl_path: The path of the STL file.
+    - parameters: The keyword arguments of convert_stl_to_mdbd.
+
+    Returns:
+    - A hexadecimal SHA-256 digest.
+    """
+
+    digest = hashlib.sha256()
+
+    with open(stl_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+
+    digest.update(json.dumps({'version': MDBD_CACHE_VERSION, **parameters}, sort_keys=True).encode())
+
+    return digest.hexdigest()
+
+
+def _convert_and_store(stl_path, cache_path, parameters):
+    """
+    Converts one STL file and writes the spheres to the cache.
+    """
+
+    sphere_points, sphere_radii = convert_stl_to_mdbd('', stl_path, **parameters)
+
+    # Write to a temporary file first so that an interrupted run never leaves a partial entry
+    temporary_path = f'{cache_path}.{os.getpid()}.tmp'
+    write_xyzr_file(temporary_path, sphere_points, sphere_radii)
+    os.replace(temporary_path, cache_path)
+
+    return cache_path
+
+
+def convert_stl_files_to_mdbd(stl_paths, cache_directory,
+                              n_spheres=1000, n_steps=25, scale=1, sdf_method='batch',
+                              max_workers=None):
+    """
+    Converts STL files to MDBD sphere sets, reusing cached conversions.
+
+    Parts that are not in the cache are converted in a process pool, one part per process.
+
+    Parameters:
+    - stl_paths: The paths of the STL files.
+    - cache_directory: The directory that stores the converted sphere sets as <key>.xyzr files.
+    - n_spheres, n_steps, scale, sdf_method: The parameters of convert_stl_to_mdbd.
+    - max_workers: The number of processes, which defaults to the number of CPUs.
+
+    Returns:
+    - A list with the (sphere_points (n, 3), sphere_radii (n, 1)) of each STL file.
+    """
+
+    os.makedirs(cache_directory, exist_ok=True)
+
+    parameters = {'n_spheres': n_spheres, 'n_steps': n_steps, 'scale': scale, 'sdf_method': sdf_method}
+    cache_paths = [os.path.join(cache_directory, get_conversion_key(stl_path, **parameters) + '.xyzr')
+                   for stl_path in stl_paths]
+
+    # Convert the parts that are not cached yet, skipping duplicates
+    missing = {cache_path: stl_path for stl_path, cache_path in zip(stl_paths, cache_paths)
+               if not os.path.isfile(cache_path)}
+
+    if missing:
+        # Spawn the workers, since forking a process that has already started JAX's threads is unsafe
+        context = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(max_workers=max_workers, mp_context=context) as executor:
+            futures = [executor.submit(_convert_and_store, stl_path, cache_path, parameters)
+                       for cache_path, stl_path in missing.items()]
+            for future in futures:
+                future.result()
+
+    # Read every part from the cache
+    sphere_sets = []
+    for cache_path in cache_paths:
+        positions, radii = read_xyzr_file(cache_path, num_spheres=None)
+        sphere_sets.append((np.array(positions).reshape(-1, 3), np.array(radii).reshape(-1, 1)))
+
+    return sphere_sets
@@ -0,0 +1,237 @@
+"""Sphere trees
+
+Arranges a set of spheres, such as an MDBD set, in a hierarchy where each parent sphere bounds its children.
+Each level of the tree covers the whole object, from a single bounding sphere at the root to the original
+spheres at the leaves, so a coarse level can stand in for the object and the leaves are only expanded where
+more detail is needed.
+"""
+
+from typing import NamedTuple
+
+import numpy as np
+
+
+class SphereTree(NamedTuple):
+    """
+    A hierarchy of bounding spheres, stored level by level from the root to the leaves.
+
+    The children of node i at level l are the nodes child_starts[l][i]:child_starts[l][i + 1] at level l + 1.
+    A node with a single leaf sphere is repeated at every finer level.
+
+    Attributes:
+    - centers: The sphere centers of each level, a list of arrays with shape (n_l, 3).
+    - radii: The sphere radii of each level, a list of arrays with shape (n_l, 1).
+    - child_starts: The offsets of the children of each level, a list of arrays with shape (n_l + 1,).
+      The finest level has no children, so the list is one shorter than centers.
+    - leaf_indices: The index of each leaf in the original set of spheres, shape (n,).
+    """
+
+    centers: list
+    radii: list
+    child_starts: list
+    leaf_indices: np.ndarray
+
+
+def _split_group(indices, points, branching):
+    """
+    Splits a group of sphere indices into up to branching groups by repeated median splits along the
+    longest axis.
+    """
+
+    groups = [indices]
+
+    while len(groups) < branching and any(len(group) > 1 for group in groups):
+
+        split_groups = []
+        for group in groups:
+            if len(group) == 1:
+                split_groups.append(group)
+                continue
+
+            group_points = points[group]
+            axis = np.argmax(np.ptp(group_points, axis=0))
+            order = group[np.argsort(group_points[:, axis], kind='stable')]
+            half = len(order) // 2
+            split_groups.extend([order[:half], order[half:]])
+
+        groups = split_groups
+
+    return groups
+
+
+def bound_spheres(centers, radii, starts):
+    """
+    Calculates a sphere that bounds each contiguous group of spheres.
+
+    The bounding sphere is centered on the AABB of the group, which is not the smallest bounding sphere
+    but is close to it for compact groups.
+
+    Parameters:
+    - centers: The sphere centers, shape (n, 3).
+    - radii: The sphere radii, shape (n, 1).
+    - starts: The offsets of the groups, shape (m + 1,).
+
+    Returns:
+    - bounding_centers: The bounding sphere centers, shape (m, 3).
+    - bounding_radii: The bounding sphere radii, shape (m, 1).
+    """
+
+    # Center each bounding sphere on the AABB of its group
+    group_min = np.minimum.reduceat(centers - radii, starts[:-1], axis=0)
+    group_max = np.maximum.reduceat(centers + radii, starts[:-1], axis=0)
+    bounding_centers = (group_min + group_max) / 2
+
+    # Extend each bounding sphere to the farthest point of its group
+    group_indices = np.repeat(np.arange(len(starts) - 1), np.diff(starts))
+    extents = np.linalg.norm(centers - bounding_centers[group_indices], axis=1, keepdims=True) + radii
+    bounding_radii = np.maximum.reduceat(extents, starts[:-1], axis=0)
+
+    return bounding_centers, bounding_radii
+
+
+def create_sphere_tree(positions, radii, branching=8):
+    """
+    Creates a sphere tree from a set of spheres.
+
+    The spheres are split top-down, so each level has up to branching times as many nodes as the level
+    above it, and the bounding spheres are then computed bottom-up so that each parent bounds its
+    children.
+
+    Parameters:
+    - positions: The sphere centers, shape (n, 3).
+    - radii: The sphere radii, shape (n, 1).
+    - branching: The largest number of children of each node, a power of two.
+
+    Returns:
+    - The SphereTree of the spheres.
+    """
+
+    positions = np.asarray(positions, dtype=float).reshape(-1, 3)
+    radii = np.asarray(radii, dtype=float).reshape(-1, 1)
+
+    if branching < 2 or branching & (branching - 1):
+        raise ValueError('branching must be a power of two greater than one.')
+
+    # Split the spheres top-down, recording the groups of each level
+    groups = [np.arange(len(positions))]
+    child_starts = []
+
+    while any(len(group) > 1 for group in groups):
+
+        children = [_split_group(group, positions, branching) for group in groups]
+        child_counts = [len(group_children) for group_children in children]
+        child_starts.append(np.concatenate([[0], np.cumsum(child_counts)]))
+
+        groups = [child for group_children in children for child in group_children]
+
+    # The finest level holds the original spheres
+    leaf_indices = np.concatenate(groups)
+    sphere_tree = SphereTree([], [], child_starts, leaf_indices)
+
+    return refit_sphere_tree(sphere_tree, positions, radii)
+
+
+def refit_sphere_tree(sphere_tree, positions, radii):
+    """
+    Recalculates the bounding spheres of a sphere tree for new sphere positions and radii.
+
+    The hierarchy is kept, so refitting is much cheaper than creating a new tree. It stays valid for any
+    motion, although the bounding spheres become loose if the spheres move far relative to each other.
+
+    Parameters:
+    - sphere_tree: The SphereTree to refit.
+    - positions: The sphere centers in their original order, shape (n, 3).
+    - radii: The sphere radii in their original order, shape (n, 1).
+
+    Returns:
+    - The refitted SphereTree.
+    """
+
+    positions = np.asarray(positions, dtype=float).reshape(-1, 3)
+    radii = np.asarray(radii, dtype=float).reshape(-1, 1)
+
+    centers = [positions[sphere_tree.leaf_indices]]
+    level_radii = [radii[sphere_tree.leaf_indices]]
+
+    # Bound the children of each level from the bottom up
+    for starts in reversed(sphere_tree.child_starts):
+        bounding_centers, bounding_radii = bound_spheres(centers[0], level_radii[0], starts)
+        centers.insert(0, bounding_centers)
+        level_radii.insert(0, bounding_radii)
+
+    return SphereTree(centers, level_radii, sphere_tree.child_starts, sphere_tree.leaf_indices)
+
+
+def get_sphere_tree_level(sphere_tree, max_spheres):
+    """
+    Returns the finest level of a sphere tree with at most max_spheres spheres.
+
+    Parameters:
+    - sphere_tree: The SphereTree.
+    - max_spheres: The largest acceptable number of spheres, at least one.
+
+    Returns:
+    - level: The index of the level.
+    - centers: The sphere centers of the level, shape (n_l, 3).
+    - radii: The sphere radii of the level, shape (n_l, 1).
+    """
+
+    level = 0
+    while level + 1 < len(sphere_tree.centers) and len(sphere_tree.centers[level + 1]) <= max_spheres:
+        level += 1
+
+    return level, sphere_tree.centers[level], sphere_tree.radii[level]
+
+
+def refine_sphere_tree(sphere_tree, refine, level=0):
+    """
+    Selects spheres from a sphere tree, expanding nodes only where more detail is needed.
+
+    Starting from a coarse level, the nodes for which refine returns True are replaced by their children
+    until no node is refined or the leaves are reached. The selected spheres still bound the object.
+
+    Parameters:
+    - sphere_tree: The SphereTree.
+    - refine: A callable that maps sphere centers (m, 3) and radii (m, 1) to a boolean mask (m,) of the
+      spheres to expand, for example spheres within a distance of an active constraint.
+    - level: The level to start from.
+
+    Returns:
+    - centers: The selected sphere centers, shape (n, 3).
+    - radii: The selected sphere radii, shape (n, 1).
+    """
+
+    n_levels = len(sphere_tree.centers)
+
+    selected_centers = []
+    selected_radii = []
+
+    nodes = np.arange(len(sphere_tree.centers[level]))
+
+    while nodes.size > 0:
+
+        centers = sphere_tree.centers[level][nodes]
+        radii = sphere_tree.radii[level][nodes]
+
+        if level == n_levels - 1:
+            is_refined = np.zeros(nodes.size, dtype=bool)
+        else:
+            is_refined = np.asarray(refine(centers, radii), dtype=bool).reshape(-1)
+
+        # Keep the spheres that are not expanded
+        selected_centers.append(centers[~is_refined])
+        selected_radii.append(radii[~is_refined])
+
+        if level == n_levels - 1:
+            break
+
+        # Expand the rest into the contiguous ranges of their children
+        refined_nodes = nodes[is_refined]
+        starts = sphere_tree.child_starts[level][refined_nodes]
+        counts = sphere_tree.child_starts[level][refined_nodes + 1] - starts
+        positions = np.arange(np.sum(counts)) - np.repeat(np.cumsum(counts) - counts, counts)
+        nodes = np.repeat(starts, counts) + positions
+
+        level += 1
+
+    return np.concatenate(selected_centers), np.concatenate(selected_radii)
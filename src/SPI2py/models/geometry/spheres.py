@@ -2,8 +2,14 @@
 """
 
 import numpy as np
+import jax.numpy as jnp
 import pyvista as pv
 import vtk
+from vtk.util.numpy_support import numpy_to_vtk, vtk_to_numpy
+from scipy.ndimage import distance_transform_edt
+from scipy.spatial import cKDTree
+
+from ..physics.distributed.mesh import create_grid_descriptor
 
 
 def compute_distances_to_faces(points, x_min, x_max, y_min, y_max, z_min, z_max):
@@ -16,7 +22,19 @@ def compute_distances_to_faces(points, x_min, x_max, y_min, y_max, z_min, z_max)
     return np.minimum(np.minimum(x_distances, y_distances), z_distances)
 
 
-def compute_signed_distance(mesh, points, invert=True):
+def compute_signed_distance(mesh, points, invert=True, method='batch'):
+    """
+    Calculate the signed distance from each point to the surface of a mesh.
+
+    Parameters:
+    - mesh: The surface mesh.
+    - points: The query points, shape (n, 3).
+    - invert: If True, interior points have positive distances.
+    - method: 'batch' evaluates all points in one VTK call, 'loop' evaluates them one at a time.
+
+    Returns:
+    - The signed distances, shape (n,).
+    """
 
     # Convert PyVista mesh to VTK polydata
     mesh_vtk = mesh
@@ -26,7 +44,15 @@ def compute_signed_distance(mesh, points, invert=True):
     implicit_distance.SetInput(mesh_vtk)
 
     # Calculate the signed distance for each point
-    signed_distances = np.array([implicit_distance.EvaluateFunction(point) for point in points])
+    if method == 'batch':
+        vtk_points = numpy_to_vtk(np.ascontiguousarray(points, dtype=np.float64), deep=True)
+        vtk_distances = vtk.vtkDoubleArray()
+        implicit_distance.FunctionValue(vtk_points, vtk_distances)
+        signed_distances = vtk_to_numpy(vtk_distances).copy()
+    elif method == 'loop':
+        signed_distances = np.array([implicit_distance.EvaluateFunction(point) for point in points])
+    else:
+        raise ValueError("Invalid method. Use 'batch' or 'loop'.")
 
     # Invert the distances if needed
     if invert:
@@ -35,14 +61,75 @@ def compute_signed_distance(mesh, points, invert=True):
     return signed_distances
 
 
-def recurse_mdbd(n_spheres, distances_filtered_sorted, points_filtered_sorted):
+def compute_signed_distance_edt(mesh, x, y, z, invert=True):
+    """
+    Approximate the signed distance on a regular grid with a Euclidean distance transform.
+
+    Only the inside/outside classification of the grid points is computed with VTK. The distances
+    are then measured between grid points, so they are accurate to about one grid spacing.
+
+    Parameters:
+    - mesh: The closed surface mesh.
+    - x, y, z: The grid coordinates along each axis, each uniformly spaced.
+    - invert: If True, interior points have positive distances.
+
+    Returns:
+    - The signed distances, shape (len(x), len(y), len(z)).
+    """
+
+    # Classify the grid points
+    xx, yy, zz = np.meshgrid(x, y, z, indexing='ij')
+    points = pv.PolyData(np.stack([xx.ravel(), yy.ravel(), zz.ravel()], axis=1))
+
+    enclosed_points = vtk.vtkSelectEnclosedPoints()
+    enclosed_points.SetInputData(points)
+    enclosed_points.SetSurfaceData(mesh)
+    enclosed_points.Update()
+
+    selected_points = enclosed_points.GetOutput().GetPointData().GetArray('SelectedPoints')
+    inside = vtk_to_numpy(selected_points).astype(bool).reshape(xx.shape)
+
+    # Measure the distance to the nearest point on the other side, and place the surface halfway between
+    spacing = tuple(np.ptp(coordinates) / max(len(coordinates) - 1, 1) for coordinates in (x, y, z))
+    half_spacing = 0.5 * np.min(spacing)
+    inside_distances = distance_transform_edt(inside, sampling=spacing) - half_spacing
+    outside_distances = distance_transform_edt(~inside, sampling=spacing) - half_spacing
+    signed_distances = np.where(inside, inside_distances, -outside_distances)
+
+    # The distances are positive inside, so invert them to match VTK's convention if needed
+    if not invert:
+        signed_distances *= -1
+
+    return signed_distances
+
+
+def recurse_mdbd(n_spheres, distances_filtered_sorted, points_filtered_sorted, method='kdtree'):
+    """
+    Greedily packs spheres at the candidate points farthest from the surface and the existing spheres.
+
+    Parameters:
+    - n_spheres: The maximum number of spheres.
+    - distances_filtered_sorted: The distance of each candidate point from the surface, in descending order, shape (n,).
+    - points_filtered_sorted: The candidate points in the same order, shape (n, 3).
+    - method: 'kdtree' queries a KD-tree of the candidates and flags removed points,
+      'dense' compares every remaining candidate with each new sphere and compacts the arrays.
+
+    Returns:
+    - The number of spheres, the sphere centers (n_spheres, 3), and the sphere radii (n_spheres, 1).
+    """
+
+    if method == 'kdtree':
+        return _recurse_mdbd_kdtree(n_spheres, distances_filtered_sorted, points_filtered_sorted)
+    elif method != 'dense':
+        raise ValueError("Invalid method. Use 'kdtree' or 'dense'.")
 
     # Preallocate arrays for sphere centers and radii
     sphere_points = np.zeros((n_spheres, 3))
     sphere_radii = np.zeros((n_spheres, 1))
 
     # Iterate to pack spheres until reaching the limit or the smallest sphere is smaller than min_radius
-    for i in range(n_spheres):
+    i = 0
+    while i < n_spheres:
 
         if distances_filtered_sorted.size == 0:
             break
@@ -54,6 +141,7 @@ def recurse_mdbd(n_spheres, distances_filtered_sorted, points_filtered_sorted):
         # Update lists of points and distances
         sphere_points[i] = sphere_center
         sphere_radii[i] = sphere_radius
+        i += 1
 
         # Update distances considering the newly added sphere
         point_distances_to_new_sphere = np.linalg.norm(points_filtered_sorted - sphere_center, axis=1)
@@ -68,19 +156,153 @@ def recurse_mdbd(n_spheres, distances_filtered_sorted, points_filtered_sorted):
     return i, sphere_points, sphere_radii
 
 
-def convert_primitive_to_mdbd(x_min, x_max, y_min, y_max, z_min, z_max,
-                              n_spheres=1000, min_radius=1e-3,
-                              meshgrid_increment=30):
+def _recurse_mdbd_kdtree(n_spheres, distances_filtered_sorted, points_filtered_sorted):
+    """
+    Greedy sphere packing with a KD-tree over the candidate points and lazy deletion flags.
 
-    # Create a 3D meshgrid within the specified bounds
-    x = np.linspace(x_min, x_max, meshgrid_increment)
-    y = np.linspace(y_min, y_max, meshgrid_increment)
-    z = np.linspace(z_min, z_max, meshgrid_increment)
-    xx, yy, zz = np.meshgrid(x, y, z, indexing='ij')
-    all_points = np.vstack([xx.ravel(), yy.ravel(), zz.ravel()]).T
+    Every remaining candidate is at most as far from the surface as the newest sphere's radius r, so
+    the candidates that a new sphere removes (distance < r + d) all lie within 2r of its center.
+    """
+
+    # Preallocate arrays for sphere centers and radii
+    sphere_points = np.zeros((n_spheres, 3))
+    sphere_radii = np.zeros((n_spheres, 1))
+
+    # Index the candidates once and flag removed points instead of compacting the arrays
+    tree = cKDTree(points_filtered_sorted)
+    is_available = np.ones(len(distances_filtered_sorted), dtype=bool)
+    next_index = 0
+
+    i = 0
+    while i < n_spheres:
+
+        # Skip to the remaining point with the maximum distance from any surface or existing sphere
+        while next_index < len(is_available) and not is_available[next_index]:
+            next_index += 1
+
+        if next_index == len(is_available):
+            break
+
+        sphere_center = points_filtered_sorted[next_index]
+        sphere_radius = distances_filtered_sorted[next_index]
+
+        sphere_points[i] = sphere_center
+        sphere_radii[i] = sphere_radius
+        i += 1
+
+        # Remove the remaining candidates that would overlap the new sphere
+        neighbors = np.asarray(tree.query_ball_point(sphere_center, 2 * sphere_radius), dtype=int)
+        neighbors = neighbors[is_available[neighbors]]
+        neighbor_distances = np.linalg.norm(points_filtered_sorted[neighbors] - sphere_center, axis=1)
+        within_new_sphere = neighbor_distances < sphere_radius + distances_filtered_sorted[neighbors]
+        is_available[neighbors[within_new_sphere]] = False
+
+    # Trim the arrays to remove unused entries
+    sphere_points = sphere_points[:i]
+    sphere_radii = sphere_radii[:i]
+
+    return i, sphere_points, sphere_radii
+
+
+def sample_octree_points(signed_distance, bounds, n_steps=16, max_depth=4, max_points=100_000,
+                         refinement_ratio=2.0):
+    """
+    Samples candidate sphere centers on an adaptively refined octree instead of a uniform grid.
+
+    The bounds are split into n_steps cells along each axis, like the uniform sampling, and the signed distance is
+    evaluated at each cell center. Cells that lie entirely outside are dropped, and cells whose distance
+    to the surface is within refinement_ratio half-diagonals are split into eight children. This refines
+    near the surface and throughout thin features, whose whole interior is near the surface, while deep
+    interior cells stay coarse.
+
+    Parameters:
+    - signed_distance: A callable that maps points (n, 3) to signed distances (n,), positive inside.
+    - bounds: The bounds (x_min, x_max, y_min, y_max, z_min, z_max) to sample.
+    - n_steps: The number of coarsest cells along each axis.
+    - max_depth: The maximum number of refinements.
+    - max_points: The maximum number of signed distance evaluations, although the coarsest cells are always evaluated.
+    - refinement_ratio: Cells with |distance| < refinement_ratio * half-diagonal are refined.
+
+    Returns:
+    - points: The interior cell centers, shape (n, 3).
+    - distances: The signed distance of each point, shape (n,).
+    """
+
+    x_min, x_max, y_min, y_max, z_min, z_max = bounds
+    origin = np.array([x_min, y_min, z_min])
+    lengths = np.array([x_max - x_min, y_max - y_min, z_max - z_min])
+
+    # Create the coarsest cells
+    cell_size = lengths / n_steps
+    steps = np.arange(n_steps)
+    ii, jj, kk = np.meshgrid(steps, steps, steps, indexing='ij')
+    points = origin + (np.stack([ii.ravel(), jj.ravel(), kk.ravel()], axis=1) + 0.5) * cell_size
+    distances = signed_distance(points)
+    is_newest = np.ones(len(points), dtype=bool)
+    n_evaluations = len(points)
+
+    # The offsets of the eight children of a unit cell
+    child_offsets = np.array(np.meshgrid([-0.25, 0.25], [-0.25, 0.25], [-0.25, 0.25], indexing='ij')).reshape(3, -1).T
+
+    for _ in range(max_depth):
+
+        half_diagonal = 0.5 * np.linalg.norm(cell_size)
+
+        # Drop the cells that lie entirely outside
+        is_inside = distances > -half_diagonal
+        points, distances, is_newest = points[is_inside], distances[is_inside], is_newest[is_inside]
+
+        # Rank the newest cells by how close they are to the surface
+        ratios = np.where(is_newest, np.abs(distances) / half_diagonal, np.inf)
+        candidates = np.flatnonzero(ratios < refinement_ratio)
+
+        # Each refined cell costs eight evaluations
+        n_refine = min(len(candidates), (max_points - n_evaluations) // 8)
+        if n_refine <= 0:
+            break
+        refine = candidates[np.argsort(ratios[candidates], kind='stable')[:n_refine]]
+
+        # Split the cells and evaluate the signed distance at the new centers
+        children = (points[refine][:, None, :] + child_offsets[None, :, :] * cell_size).reshape(-1, 3)
+        child_distances = signed_distance(children)
+        n_evaluations += len(children)
+
+        is_kept = np.ones(len(points), dtype=bool)
+        is_kept[refine] = False
+        points = np.concatenate([points[is_kept], children])
+        distances = np.concatenate([distances[is_kept], child_distances])
+        is_newest = np.concatenate([np.zeros(np.sum(is_kept), dtype=bool), np.ones(len(children), dtype=bool)])
+
+        cell_size /= 2
+
+    # Only interior points can become sphere centers
+    is_interior = distances > 0
+
+    return points[is_interior], distances[is_interior]
 
-    # Calculate the distances from each point to the nearest face of the prism
-    distances_to_faces = compute_distances_to_faces(all_points, x_min, x_max, y_min, y_max, z_min, z_max)
+
+def convert_primitive_to_mdbd(x_min, x_max, y_min, y_max, z_min, z_max,
+                              n_spheres=1000, min_radius=1e-3,
+                              meshgrid_increment=30,
+                              sampling='uniform', max_points=100_000):
+
+    if sampling == 'octree':
+        # Sample adaptively, see sample_octree_points
+        all_points, distances_to_faces = sample_octree_points(
+            lambda points: compute_distances_to_faces(points, x_min, x_max, y_min, y_max, z_min, z_max),
+            (x_min, x_max, y_min, y_max, z_min, z_max), n_steps=meshgrid_increment, max_points=max_points)
+    elif sampling == 'uniform':
+        # Create a 3D meshgrid within the specified bounds
+        x = np.linspace(x_min, x_max, meshgrid_increment)
+        y = np.linspace(y_min, y_max, meshgrid_increment)
+        z = np.linspace(z_min, z_max, meshgrid_increment)
+        xx, yy, zz = np.meshgrid(x, y, z, indexing='ij')
+        all_points = np.vstack([xx.ravel(), yy.ravel(), zz.ravel()]).T
+
+        # Calculate the distances from each point to the nearest face of the prism
+        distances_to_faces = compute_distances_to_faces(all_points, x_min, x_max, y_min, y_max, z_min, z_max)
+    else:
+        raise ValueError("Invalid sampling. Use 'uniform' or 'octree'.")
 
     # Sort points by their distance to the surface (descending order)
     sorted_indices = np.argsort(distances_to_faces)[::-1]
@@ -100,20 +322,38 @@ def convert_stl_to_mdbd(directory,
                         filename,
                         n_spheres=1000,
                         n_steps=25,
-                        scale=1):
+                        scale=1,
+                        sdf_method='batch',
+                        sampling='uniform',
+                        max_points=100_000):
 
     # Read the mesh
     mesh = pv.read(directory+filename)
 
-    # Create a meshgrid of points
-    x_min, x_max, y_min, y_max, z_min, z_max = mesh.bounds
-    x = np.linspace(x_min, x_max, n_steps)
-    y = np.linspace(y_min, y_max, n_steps)
-    z = np.linspace(z_min, z_max, n_steps)
-    all_points = np.array(np.meshgrid(x, y, z)).reshape(3, -1).T
-
     # Calculate inverted signed distances for all points
-    signed_distances = compute_signed_distance(mesh, all_points, invert=True)
+    if sampling == 'octree':
+        if sdf_method == 'edt':
+            raise ValueError("The 'edt' signed distance requires uniform sampling.")
+
+        # Sample adaptively, see sample_octree_points
+        all_points, signed_distances = sample_octree_points(
+            lambda points: compute_signed_distance(mesh, points, invert=True, method=sdf_method),
+            mesh.bounds, n_steps=n_steps, max_points=max_points)
+    elif sampling == 'uniform':
+        # Create a meshgrid of points
+        x_min, x_max, y_min, y_max, z_min, z_max = mesh.bounds
+        x = np.linspace(x_min, x_max, n_steps)
+        y = np.linspace(y_min, y_max, n_steps)
+        z = np.linspace(z_min, z_max, n_steps)
+        all_points = np.array(np.meshgrid(x, y, z)).reshape(3, -1).T
+
+        if sdf_method == 'edt':
+            # Match the point order of the (y, x, z) meshgrid above
+            signed_distances = compute_signed_distance_edt(mesh, x, y, z, invert=True).transpose(1, 0, 2).ravel()
+        else:
+            signed_distances = compute_signed_distance(mesh, all_points, invert=True, method=sdf_method)
+    else:
+        raise ValueError("Invalid sampling. Use 'uniform' or 'octree'.")
 
     # Remove points outside the mesh
     mask_interior = signed_distances > 0
@@ -149,40 +389,70 @@ def get_aabb_bounds(centers, radii):
     return x_min, x_max, y_min, y_max, z_min, z_max
 
 
-def get_aabb_indices(el_centers, el_size, obj_centers, obj_radii):
+def get_aabb_index_range(grid, obj_min, obj_max):
     """
-    Get the indices of the AABB bounds in the grid
+    Get the unclamped indices of the first and last grid elements that overlap an AABB.
+
+    Parameters:
+    - grid: The GridDescriptor of a uniform grid.
+    - obj_min: The lower corner of the AABB, shape (3,).
+    - obj_max: The upper corner of the AABB, shape (3,).
+
+    Returns:
+    - first: The index of the first overlapping element along each axis, shape (3,).
+    - last: The index of the last overlapping element along each axis, shape (3,).
+      Indices outside [0, n - 1] mean that the AABB extends past the grid.
     """
 
-    aabb_bounds = get_aabb_bounds(obj_centers, obj_radii)
+    # Element i overlaps [obj_min, obj_max] if origin + i * spacing <= obj_max and origin + (i + 1) * spacing >= obj_min
+    first = jnp.ceil((obj_min - grid.origin) / grid.spacing - 1).astype(int)
+    last = jnp.floor((obj_max - grid.origin) / grid.spacing).astype(int)
+
+    return first, last
 
-    obj_x_min, obj_x_max, obj_y_min, obj_y_max, obj_z_min, obj_z_max = aabb_bounds
 
-    element_half_size = el_size / 2
+def get_aabb_indices_from_grid(grid, obj_centers, obj_radii):
+    """
+    Get the indices of the AABB bounds in a uniform grid.
+
+    The indices are calculated in closed form, so the cost does not depend on the size of the grid
+    and the function can be jitted. Indices are clamped to the grid.
 
-    el_x_min = el_centers[:, :, :, :, 0].squeeze() - element_half_size
-    el_x_max = el_centers[:, :, :, :, 0].squeeze() + element_half_size
-    el_y_min = el_centers[:, :, :, :, 1].squeeze() - element_half_size
-    el_y_max = el_centers[:, :, :, :, 1].squeeze() + element_half_size
-    el_z_min = el_centers[:, :, :, :, 2].squeeze() - element_half_size
-    el_z_max = el_centers[:, :, :, :, 2].squeeze() + element_half_size
+    Parameters:
+    - grid: The GridDescriptor of a uniform grid, see create_grid_descriptor.
+    - obj_centers: Object points, shape (..., 3).
+    - obj_radii: Radii of the object points, shape (..., 1).
 
-    # Find the overlapping elements along each dimension
-    x_overlap = (obj_x_min <= el_x_max) & (obj_x_max >= el_x_min)
-    y_overlap = (obj_y_min <= el_y_max) & (obj_y_max >= el_y_min)
-    z_overlap = (obj_z_min <= el_z_max) & (obj_z_max >= el_z_min)
+    Returns:
+    - The inclusive element indices i1, i2, j1, j2, k1, k2.
+    """
 
-    # Combine overlaps to get the AABB
-    overlap = x_overlap & y_overlap & z_overlap
+    obj_centers = jnp.reshape(obj_centers, (-1, 3))
+    obj_radii = jnp.reshape(obj_radii, (-1, 1))
+
+    obj_min = jnp.min(obj_centers - obj_radii, axis=0)
+    obj_max = jnp.max(obj_centers + obj_radii, axis=0)
+
+    first, last = get_aabb_index_range(grid, obj_min, obj_max)
+
+    upper = jnp.array(grid.shape) - 1
+    first = jnp.clip(first, 0, upper)
+    last = jnp.clip(last, 0, upper)
+
+    return first[0], last[0], first[1], last[1], first[2], last[2]
+
+
+def get_aabb_indices(el_centers, el_size, obj_centers, obj_radii):
+    """
+    Get the indices of the AABB bounds in the grid
+
+    The grid must be uniform, as created by generate_mesh_vec. See get_aabb_indices_from_grid.
+    """
 
-    # Get indices of overlapping elements
-    indices = np.argwhere(overlap)
+    grid = create_grid_descriptor(el_centers, el_size)
+    indices = get_aabb_indices_from_grid(grid, obj_centers, obj_radii)
 
-    i1 = np.min(indices[:, 0])
-    i2 = np.max(indices[:, 0])
-    j1 = np.min(indices[:, 1])
-    j2 = np.max(indices[:, 1])
-    k1 = np.min(indices[:, 2])
-    k2 = np.max(indices[:, 2])
+    # Transfer the indices in one call so they can be used to slice
+    i1, i2, j1, j2, k1, k2 = np.asarray(jnp.stack(indices))
 
     return i1, i2, j1, j2, k1, k2
@@ -0,0 +1,265 @@
+"""Collision detection
+
+Finds the objects whose AABBs overlap with a sweep-and-prune broad phase, and the nearby sphere pairs of two
+components by traversing their sphere trees together, so that only the pairs that can affect a gap constraint
+are passed to the signed distance calculations.
+
+The separation of two spheres is the distance between their surfaces, |c_a - c_b| - r_a - r_b, which is
+the negative of the signed distance of signed_distances_spheres_spheres.
+"""
+
+import numpy as np
+
+from ..geometry.spheres import get_aabb_bounds
+
+
+def get_object_aabbs(centers_list, radii_list):
+    """
+    Calculates the AABB of each object, such as a component's spheres or an interconnect's control points.
+
+    Parameters:
+    - centers_list: The sphere centers of each object, each with shape (n_i, 3).
+    - radii_list: The sphere radii of each object, each with shape (n_i, 1) or a scalar for an interconnect.
+
+    Returns:
+    - aabb_min: The lower corner of each AABB, shape (n_objects, 3).
+    - aabb_max: The upper corner of each AABB, shape (n_objects, 3).
+    """
+
+    bounds = np.array([get_aabb_bounds(np.asarray(centers), np.asarray(radii))
+                       for centers, radii in zip(centers_list, radii_list)]).reshape(-1, 6)
+
+    return bounds[:, 0::2], bounds[:, 1::2]
+
+
+def sweep_and_prune(aabb_min, aabb_max, margin=0.0, order=None):
+    """
+    Finds the pairs of objects whose AABBs overlap.
+
+    The AABBs are sorted by their lower bound along the axis with the largest spread, and each AABB is only
+    compared with the AABBs that start before it ends. The remaining axes are then checked for the candidates.
+
+    Pass the returned order back on the next call to exploit temporal coherence: objects move little
+    between optimizer iterations, so the previous order is nearly sorted and is re-sorted in about
+    linear time.
+
+    Parameters:
+    - aabb_min: The lower corner of each AABB, shape (n, 3).
+    - aabb_max: The upper corner of each AABB, shape (n, 3).
+    - margin: A gap between AABBs below which pairs are also returned.
+    - order: The order returned by the previous call, or None.
+
+    Returns:
+    - pairs: The object indices (first, second) of the overlapping pairs, with first < second.
+    - order: The sweep axis and the sorted object indices, to pass to the next call.
+    """
+
+    aabb_min = np.asarray(aabb_min, dtype=float).reshape(-1, 3) - margin / 2
+    aabb_max = np.asarray(aabb_max, dtype=float).reshape(-1, 3) + margin / 2
+    n_objects = aabb_min.shape[0]
+
+    # Choose the sweep axis once, or keep the previous one along with its order
+    if order is None or len(order[1]) != n_objects:
+        axis = int(np.argmax(np.var(aabb_min + aabb_max, axis=0)))
+        sorted_indices = np.arange(n_objects)
+    else:
+        axis, sorted_indices = order
+
+    # Re-sort the previous order, which the stable sort finishes in about linear time if it is nearly sorted
+    sorted_indices = sorted_indices[np.argsort(aabb_min[sorted_indices, axis], kind='stable')]
+    sorted_min = aabb_min[sorted_indices, axis]
+    sorted_max = aabb_max[sorted_indices, axis]
+
+    # Pair each AABB with the following AABBs that start before it ends
+    ends = np.searchsorted(sorted_min, sorted_max, side='right')
+    counts = np.maximum(ends - np.arange(n_objects) - 1, 0)
+    positions = np.arange(np.sum(counts)) - np.repeat(np.cumsum(counts) - counts, counts)
+    first = sorted_indices[np.repeat(np.arange(n_objects), counts)]
+    second = sorted_indices[np.repeat(np.arange(n_objects), counts) + 1 + positions]
+
+    # Check the other axes
+    is_overlapping = np.all((aabb_min[first] <= aabb_max[second]) & (aabb_min[second] <= aabb_max[first]), axis=1)
+    first = first[is_overlapping]
+    second = second[is_overlapping]
+
+    pairs = (np.minimum(first, second), np.maximum(first, second))
+
+    return pairs, (axis, sorted_indices)
+
+
+def _get_first_leaves(sphere_tree):
+    """
+    Returns the first leaf below each node of each level of a sphere tree.
+    """
+
+    first_leaves = [np.arange(len(sphere_tree.centers[-1]))]
+
+    for starts in reversed(sphere_tree.child_starts):
+        first_leaves.insert(0, first_leaves[0][starts[:-1]])
+
+    return first_leaves
+
+
+def _get_children(sphere_tree, level, nodes):
+    """
+    Returns the first child and the number of children of each node, where a leaf is its own child.
+    """
+
+    if level == len(sphere_tree.centers) - 1:
+        return nodes, np.ones_like(nodes)
+
+    starts = sphere_tree.child_starts[level][nodes]
+    counts = sphere_tree.child_starts[level][nodes + 1] - starts
+
+    return starts, counts
+
+
+def _get_separations(sphere_tree_a, level_a, nodes_a, sphere_tree_b, level_b, nodes_b):
+    """
+    Returns the separations between pairs of nodes.
+    """
+
+    centers_a = sphere_tree_a.centers[level_a][nodes_a]
+    centers_b = sphere_tree_b.centers[level_b][nodes_b]
+    radii_a = sphere_tree_a.radii[level_a][nodes_a, 0]
+    radii_b = sphere_tree_b.radii[level_b][nodes_b, 0]
+
+    return np.linalg.norm(centers_a - centers_b, axis=1) - radii_a - radii_b
+
+
+def _traverse_sphere_trees(sphere_tree_a, sphere_tree_b, get_threshold):
+    """
+    Traverses two sphere trees level by level, pruning the pairs of nodes that are farther apart than a threshold.
+
+    The separation of two nodes is a lower bound of the separations of their leaves, and the separation of
+    their first leaves is an upper bound of the smallest one. get_threshold maps the upper bounds of the
+    current pairs to the largest separation that is still needed.
+
+    Returns:
+    - leaves_a: The leaf indices of the first tree, shape (n_pairs,).
+    - leaves_b: The leaf indices of the second tree, shape (n_pairs,).
+    - separations: The separations of the leaf pairs, shape (n_pairs,).
+    """
+
+    n_levels_a = len(sphere_tree_a.centers)
+    n_levels_b = len(sphere_tree_b.centers)
+    first_leaves_a = _get_first_leaves(sphere_tree_a)
+    first_leaves_b = _get_first_leaves(sphere_tree_b)
+
+    nodes_a = np.zeros(1, dtype=int)
+    nodes_b = np.zeros(1, dtype=int)
+    level = 0
+
+    while True:
+
+        level_a = min(level, n_levels_a - 1)
+        level_b = min(level, n_levels_b - 1)
+
+        # Bound the separations of the leaves of each pair
+        lower_bounds = _get_separations(sphere_tree_a, level_a, nodes_a, sphere_tree_b, level_b, nodes_b)
+        upper_bounds = _get_separations(sphere_tree_a, n_levels_a - 1, first_leaves_a[level_a][nodes_a],
+                                        sphere_tree_b, n_levels_b - 1, first_leaves_b[level_b][nodes_b])
+
+        # Prune the pairs that cannot contain a needed leaf pair
+        is_kept = lower_bounds <= get_threshold(upper_bounds)
+        nodes_a = nodes_a[is_kept]
+        nodes_b = nodes_b[is_kept]
+
+        if level_a == n_levels_a - 1 and level_b == n_levels_b - 1:
+            return nodes_a, nodes_b, lower_bounds[is_kept]
+
+        # Expand each pair into the pairs of their children
+        starts_a, counts_a = _get_children(sphere_tree_a, level_a, nodes_a)
+        starts_b, counts_b = _get_children(sphere_tree_b, level_b, nodes_b)
+        counts = counts_a * counts_b
+
+        pair_indices = np.repeat(np.arange(len(counts)), counts)
+        positions = np.arange(np.sum(counts)) - np.repeat(np.cumsum(counts) - counts, counts)
+        nodes_a = starts_a[pair_indices] + positions // counts_b[pair_indices]
+        nodes_b = starts_b[pair_indices] + positions % counts_b[pair_indices]
+
+        level += 1
+
+
+def find_sphere_pairs_within(sphere_tree_a, sphere_tree_b, cutoff):
+    """
+    Finds the pairs of spheres of two components whose separation is at most a cutoff.
+
+    Parameters:
+    - sphere_tree_a: The SphereTree of the first component.
+    - sphere_tree_b: The SphereTree of the second component.
+    - cutoff: The largest separation of the returned pairs.
+
+    Returns:
+    - indices_a: The sphere indices of the first component, shape (n_pairs,).
+    - indices_b: The sphere indices of the second component, shape (n_pairs,).
+    """
+
+    leaves_a, leaves_b, _ = _traverse_sphere_trees(sphere_tree_a, sphere_tree_b, lambda upper_bounds: cutoff)
+
+    return sphere_tree_a.leaf_indices[leaves_a], sphere_tree_b.leaf_indices[leaves_b]
+
+
+def find_closest_sphere_pairs(sphere_tree_a, sphere_tree_b, k):
+    """
+    Finds the k pairs of spheres of two components with the smallest separations.
+
+    Parameters:
+    - sphere_tree_a: The SphereTree of the first component.
+    - sphere_tree_b: The SphereTree of the second component.
+    - k: The number of pairs.
+
+    Returns:
+    - indices_a: The sphere indices of the first component, shape (k,).
+    - indices_b: The sphere indices of the second component, shape (k,).
+    """
+
+    def get_threshold(upper_bounds):
+        # The pairs hold distinct leaf pairs, so k of them bound the k smallest separations
+        if len(upper_bounds) < k:
+            return np.inf
+        return np.partition(upper_bounds, k - 1)[k - 1]
+
+    leaves_a, leaves_b, separations = _traverse_sphere_trees(sphere_tree_a, sphere_tree_b, get_threshold)
+
+    order = np.argsort(separations, kind='stable')[:k]
+
+    return sphere_tree_a.leaf_indices[leaves_a[order]], sphere_tree_b.leaf_indices[leaves_b[order]]
+
+
+def find_close_component_pairs(sphere_trees, cutoff, order=None):
+    """
+    Finds the pairs of spheres within a cutoff separation for every pair of components.
+
+    The candidate component pairs are found by sweep-and-prune over the AABBs of the root spheres, and only
+    the pairs whose root spheres are within the cutoff are traversed.
+
+    Parameters:
+    - sphere_trees: The SphereTree of each component.
+    - cutoff: The largest separation of the returned pairs.
+    - order: The order returned by the previous call, see sweep_and_prune.
+
+    Returns:
+    - component_pairs: A list of (i, j, (indices_a, indices_b)) for each pair of components i < j with at
+      least one pair of spheres within the cutoff.
+    - order: The sweep order to pass to the next call.
+    """
+
+    root_centers = np.concatenate([sphere_tree.centers[0] for sphere_tree in sphere_trees])
+    root_radii = np.concatenate([sphere_tree.radii[0] for sphere_tree in sphere_trees]).reshape(-1)
+
+    # Find the candidate pairs of components
+    (first, second), order = sweep_and_prune(root_centers - root_radii[:, None], root_centers + root_radii[:, None],
+                                             margin=cutoff, order=order)
+
+    # Compare their root spheres
+    separations = np.linalg.norm(root_centers[first] - root_centers[second], axis=1) - root_radii[first] - root_radii[second]
+    is_close = separations <= cutoff
+
+    component_pairs = []
+    for i, j in sorted(zip(first[is_close], second[is_close])):
+        pair_list = find_sphere_pairs_within(sphere_trees[i], sphere_trees[j], cutoff)
+        if len(pair_list[0]) > 0:
+            component_pairs.append((int(i), int(j), pair_list))
+
+    return component_pairs, order
@@ -4,7 +4,10 @@ Provides functions to calculate the distance between classes in various ways.
 """
 
 import jax.numpy as jnp
-from chex import assert_shape, assert_type
+from jax import custom_jvp, jit
+
+from ..utilities.precision import get_kernel_dtype
+from ..utilities.validation import assert_shape, assert_type
 
 
 def distances_points_points(a: jnp.ndarray,
@@ -13,8 +16,8 @@ def distances_points_points(a: jnp.ndarray,
     # Validate the inputs
     assert_shape(a, (None, 3))
     assert_shape(b, (None, 3))
-    assert_type(a, 'float64')
-    assert_type(b, 'float64')
+    assert_type(a, get_kernel_dtype())
+    assert_type(b, get_kernel_dtype())
 
     # Reshape the arrays for broadcasting
     aa = a.reshape(-1, 1, 3)
@@ -44,8 +47,8 @@ def distances_radii_radii(radii_1: jnp.ndarray,
     # Validate the inputs
     assert_shape(radii_1, (None, 1))
     assert_shape(radii_2, (None, 1))
-    assert_type(radii_1, 'float64')
-    assert_type(radii_2, 'float64')
+    assert_type(radii_1, get_kernel_dtype())
+    assert_type(radii_2, get_kernel_dtype())
 
     # Reshape the arrays for broadcasting
     aa = radii_1.reshape(-1, 1)
@@ -57,6 +60,137 @@ def distances_radii_radii(radii_1: jnp.ndarray,
     return c
 
 
+def _get_segment_parameters(start_1, stop_1, start_2, stop_2):
+    """
+    Returns the parameters (s, t) of the closest points start_1 + s * (stop_1 - start_1) and
+    start_2 + t * (stop_2 - start_2) of two sets of line segments, each with shape (..., 1).
+
+    Based on the closest point algorithm of Ericson, Real-Time Collision Detection, 2004. Segments that
+    degenerate into points have a zero parameter, and the divisions are guarded so that no branch
+    produces a NaN.
+    """
+
+    d1 = stop_1 - start_1
+    d2 = stop_2 - start_2
+    r = start_1 - start_2
+
+    a = jnp.sum(d1 * d1, axis=-1, keepdims=True)
+    e = jnp.sum(d2 * d2, axis=-1, keepdims=True)
+    b = jnp.sum(d1 * d2, axis=-1, keepdims=True)
+    c = jnp.sum(d1 * r, axis=-1, keepdims=True)
+    f = jnp.sum(d2 * r, axis=-1, keepdims=True)
+    den = a * e - b ** 2
+
+    is_point_1 = a == 0.
+    is_point_2 = e == 0.
+    safe_a = jnp.where(is_point_1, 1., a)
+    safe_e = jnp.where(is_point_2, 1., e)
+    safe_den = jnp.where(den > 0., den, 1.)
+
+    # Find the closest point of the first line to the second, or any point if they are parallel
+    s = jnp.where(den > 0., jnp.clip((b * f - c * e) / safe_den, 0., 1.), 0.)
+
+    # Find the closest point of the second segment to it, then move the first point back within its segment
+    t = (b * s + f) / safe_e
+    s = jnp.where(t < 0., jnp.clip(-c / safe_a, 0., 1.), s)
+    s = jnp.where(t > 1., jnp.clip((b - c) / safe_a, 0., 1.), s)
+    t = jnp.clip(t, 0., 1.)
+
+    # Handle the segments that degenerate into points
+    s = jnp.where(is_point_2, jnp.clip(-c / safe_a, 0., 1.), s)
+    t = jnp.where(is_point_2, 0., t)
+    t = jnp.where(is_point_1, jnp.clip(f / safe_e, 0., 1.), t)
+    s = jnp.where(is_point_1, 0., s)
+
+    return s, t
+
+
+def _get_point_segment_parameter(point, start, stop):
+    """
+    Returns the parameter t of the closest point start + t * (stop - start) of a set of line segments
+    to a set of points, shape (..., 1).
+    """
+
+    d = stop - start
+    a = jnp.sum(d * d, axis=-1, keepdims=True)
+    c = jnp.sum(d * (point - start), axis=-1, keepdims=True)
+
+    safe_a = jnp.where(a == 0., 1., a)
+
+    return jnp.where(a == 0., 0., jnp.clip(c / safe_a, 0., 1.))
+
+
+def _closest_point_distances_jvp(closest_1, closest_2, tangent_1, tangent_2):
+    """
+    Returns the distances between pairs of closest points and their tangents.
+
+    The closest points are held fixed, since moving them along their segments does not change the minimum
+    distance to first order. Coincident points have a zero tangent instead of a NaN.
+    """
+
+    offsets = closest_1 - closest_2
+    distances = jnp.linalg.norm(offsets, axis=-1)
+
+    safe_distances = jnp.where(distances == 0., 1., distances)
+    distance_tangents = jnp.sum(offsets * (tangent_1 - tangent_2), axis=-1) / safe_distances
+    distance_tangents = jnp.where(distances == 0., 0., distance_tangents)
+
+    return distances, distance_tangents
+
+
+@custom_jvp
+def _segment_segment_distances(start_1, stop_1, start_2, stop_2):
+
+    s, t = _get_segment_parameters(start_1, stop_1, start_2, stop_2)
+
+    closest_1 = start_1 + s * (stop_1 - start_1)
+    closest_2 = start_2 + t * (stop_2 - start_2)
+
+    return jnp.linalg.norm(closest_1 - closest_2, axis=-1)
+
+
+@_segment_segment_distances.defjvp
+def _segment_segment_distances_jvp(primals, tangents):
+
+    start_1, stop_1, start_2, stop_2 = primals
+    start_1_dot, stop_1_dot, start_2_dot, stop_2_dot = tangents
+
+    s, t = _get_segment_parameters(start_1, stop_1, start_2, stop_2)
+
+    closest_1 = start_1 + s * (stop_1 - start_1)
+    closest_2 = start_2 + t * (stop_2 - start_2)
+    tangent_1 = start_1_dot + s * (stop_1_dot - start_1_dot)
+    tangent_2 = start_2_dot + t * (stop_2_dot - start_2_dot)
+
+    return _closest_point_distances_jvp(closest_1, closest_2, tangent_1, tangent_2)
+
+
+@custom_jvp
+def _point_segment_distances(point, start, stop):
+
+    t = _get_point_segment_parameter(point, start, stop)
+
+    return jnp.linalg.norm(point - (start + t * (stop - start)), axis=-1)
+
+
+@_point_segment_distances.defjvp
+def _point_segment_distances_jvp(primals, tangents):
+
+    point, start, stop = primals
+    point_dot, start_dot, stop_dot = tangents
+
+    t = _get_point_segment_parameter(point, start, stop)
+
+    closest = start + t * (stop - start)
+    tangent = start_dot + t * (stop_dot - start_dot)
+
+    return _closest_point_distances_jvp(point, closest, point_dot, tangent)
+
+
+_segment_segment_distances_jit = jit(_segment_segment_distances)
+_point_segment_distances_jit = jit(_point_segment_distances)
+
+
 def minimum_distances_segments_segments(start_1: jnp.ndarray,
                                         stop_1: jnp.ndarray,
                                         start_2: jnp.ndarray,
@@ -64,9 +198,11 @@ def minimum_distances_segments_segments(start_1: jnp.ndarray,
     """
     Returns the minimum distances between line segments.
 
-    Note 1: This function also works for points, where you set start==stop.
+    Note 1: This function also works for points, where you set start==stop, but minimum_distances_points_segments
+    is faster for points.
 
-    Note 2: This a vectorized implementation based on https://doi.org/10.1016/0020-0190(85)90032-8.
+    Note 2: The derivatives are calculated at fixed closest points, so they stay finite for degenerate and
+    parallel segments. The derivative of a zero distance is zero.
 
     Parameters:
     - start_1: The starting points of the first set of line segments.
@@ -79,68 +215,17 @@ def minimum_distances_segments_segments(start_1: jnp.ndarray,
 
     """
 
-    def clamp_bound(num):
-        """
-        If the number is outside the range [0,1] then clamp it to the nearest boundary.
-        """
-        return jnp.clip(num, 0., 1.)
-
     # Validate the inputs
     assert_shape(start_1, (..., 3))
     assert_shape(stop_1, (..., 3))
     assert_shape(start_2, (..., 3))
     assert_shape(stop_2, (..., 3))
-    assert_type(start_1, 'float64')
-    assert_type(stop_1, 'float64')
-    assert_type(start_2, 'float64')
-    assert_type(stop_2, 'float64')
+    assert_type(start_1, get_kernel_dtype())
+    assert_type(stop_1, get_kernel_dtype())
+    assert_type(start_2, get_kernel_dtype())
+    assert_type(stop_2, get_kernel_dtype())
 
-    d1 = stop_1 - start_1
-    d2 = stop_2 - start_2
-    d12 = start_2 - start_1
-
-    D1 = jnp.sum(d1 * d1, axis=-1, keepdims=True)
-    D2 = jnp.sum(d2 * d2, axis=-1, keepdims=True)
-    S1 = jnp.sum(d1 * d12, axis=-1, keepdims=True)
-    S2 = jnp.sum(d2 * d12, axis=-1, keepdims=True)
-    R = jnp.sum(d1 * d2, axis=-1, keepdims=True)
-    den = D1 * D2 - R ** 2 + 1e-8
-
-    t = jnp.zeros_like(D1)
-    u = jnp.zeros_like(D2)
-
-    # Handling cases where segments degenerate into points
-    mask_D1_zero = D1 == 0.
-    mask_D2_zero = D2 == 0.
-    mask_den_zero = den == 0.
-
-    # Both segments are points
-    mask_both_points = mask_D1_zero & mask_D2_zero
-
-    # Segment CD is a point
-    mask_CD_point = ~mask_D1_zero & mask_D2_zero
-    t = jnp.where(mask_CD_point, S1 / D1, t)
-
-    # Segment AB is a point
-    mask_AB_point = mask_D1_zero & ~mask_D2_zero
-    u = jnp.where(mask_AB_point, -S2 / D2, u)
-
-    # Line segments are parallel
-    u = jnp.where(mask_den_zero, -S2 / D2, u)
-    uf = clamp_bound(u)
-    t = jnp.where(mask_den_zero, (uf * R + S1) / D1, t)
-    u = jnp.where(mask_den_zero, uf, u)
-
-    # General case
-    mask_general = ~mask_both_points & ~mask_AB_point & ~mask_CD_point & ~mask_den_zero
-    t_general = (S1 * D2 - S2 * R) / den
-    u_general = (t_general * R - S2) / D2
-    t = jnp.where(mask_general, clamp_bound(t_general), t)
-    u = jnp.where(mask_general, clamp_bound(u_general), u)
-    u = clamp_bound(u)
-    t = jnp.where(mask_general, clamp_bound((u * R + S1) / D1), t)
-
-    minimum_distance = jnp.linalg.norm(d1 * t - d2 * u - d12, axis=-1)
+    minimum_distance = _segment_segment_distances_jit(start_1, stop_1, start_2, stop_2)
 
     return minimum_distance
 
@@ -148,16 +233,30 @@ def minimum_distances_segments_segments(start_1: jnp.ndarray,
 def minimum_distances_points_segments(point: jnp.ndarray,
                                       start: jnp.ndarray,
                                       stop: jnp.ndarray) -> jnp.ndarray:
+    """
+    Returns the minimum distances between points and line segments.
+
+    Projects each point onto its segment directly instead of treating it as a degenerate segment.
+    The derivatives follow minimum_distances_segments_segments.
+
+    Parameters:
+    - point: The points.
+    - start: The starting points of the line segments.
+    - stop: The stopping points of the line segments.
+
+    Returns:
+    - The minimum distances between the points and the line segments.
+    """
 
     # Validate the inputs
     assert_shape(point, (..., 3))
     assert_shape(start, (..., 3))
     assert_shape(stop, (..., 3))
-    assert_type(point, 'float64')
-    assert_type(start, 'float64')
-    assert_type(stop, 'float64')
+    assert_type(point, get_kernel_dtype())
+    assert_type(start, get_kernel_dtype())
+    assert_type(stop, get_kernel_dtype())
 
-    min_dist = minimum_distances_segments_segments(point, point, start, stop)
+    min_dist = _point_segment_distances_jit(point, start, stop)
 
     return min_dist
 
@@ -187,10 +286,10 @@ def signed_distances_spheres_spheres(centers_a: jnp.ndarray,
     assert_shape(radii_a, (None, 1))
     assert_shape(centers_b, (None, 3))
     assert_shape(radii_b, (None, 1))
-    assert_type(centers_a, 'float64')
-    assert_type(radii_a, 'float64')
-    assert_type(centers_b, 'float64')
-    assert_type(radii_b, 'float64')
+    assert_type(centers_a, get_kernel_dtype())
+    assert_type(radii_a, get_kernel_dtype())
+    assert_type(centers_b, get_kernel_dtype())
+    assert_type(radii_b, get_kernel_dtype())
 
     # Calculate the signed distances
     delta_positions = distances_points_points(centers_a, centers_b)
@@ -210,10 +309,10 @@ def signed_distances_capsules_capsules(centers_1: jnp.ndarray,
     assert_shape(radii_1, (None, 1))
     assert_shape(centers_2, (None, 3))
     assert_shape(radii_2, (None, 1))
-    assert_type(centers_1, 'float64')
-    assert_type(radii_1, 'float64')
-    assert_type(centers_2, 'float64')
-    assert_type(radii_2, 'float64')
+    assert_type(centers_1, get_kernel_dtype())
+    assert_type(radii_1, get_kernel_dtype())
+    assert_type(centers_2, get_kernel_dtype())
+    assert_type(radii_2, get_kernel_dtype())
 
     delta_positions = minimum_distances_segments_segments(centers_1, centers_2)
     delta_radii     = distances_radii_radii(radii_1, radii_2)
@@ -221,3 +320,44 @@ def signed_distances_capsules_capsules(centers_1: jnp.ndarray,
     signed_distances = delta_radii - delta_positions
 
     return signed_distances
+
+
+def signed_distances_sphere_pairs(centers_a: jnp.ndarray,
+                                  radii_a:   jnp.ndarray,
+                                  centers_b: jnp.ndarray,
+                                  radii_b:   jnp.ndarray,
+                                  pair_list: tuple) -> jnp.ndarray:
+    """
+    Calculate the signed distances between selected pairs of spheres.
+
+    Equivalent to gathering the pairs from signed_distances_spheres_spheres without calculating the full matrix.
+
+    Parameters:
+    - centers_a: The centers of the first set of spheres.
+    - radii_a: The radii of the first set of spheres.
+    - centers_b: The centers of the second set of spheres.
+    - radii_b: The radii of the second set of spheres.
+    - pair_list: The indices (indices_a, indices_b) of the pairs, for example from find_sphere_pairs_within.
+
+    Returns:
+    - The signed distances of the pairs, shape (n_pairs,).
+    """
+
+    # Validate the inputs
+    assert_shape(centers_a, (None, 3))
+    assert_shape(radii_a, (None, 1))
+    assert_shape(centers_b, (None, 3))
+    assert_shape(radii_b, (None, 1))
+    assert_type(centers_a, get_kernel_dtype())
+    assert_type(radii_a, get_kernel_dtype())
+    assert_type(centers_b, get_kernel_dtype())
+    assert_type(radii_b, get_kernel_dtype())
+
+    indices_a, indices_b = pair_list
+
+    # Calculate the signed distances
+    delta_positions = jnp.linalg.norm(centers_a[indices_a] - centers_b[indices_b], axis=1)
+    delta_radii     = radii_a[indices_a, 0] + radii_b[indices_b, 0]
+    signed_distances = delta_radii - delta_positions
+
+    return signed_distances
@@ -1,4 +1,6 @@
 import math
+from typing import NamedTuple
+
 import jax.numpy as jnp
 
 
@@ -190,6 +192,43 @@ def generate_mesh_vec(x_min, x_max, y_min, y_max, z_min, z_max, element_size=1.0
     return nodes, elements, centers, nx, ny, nz, lx, ly, lz
 
 
+class GridDescriptor(NamedTuple):
+    """
+    Closed-form description of a uniform grid, as created by generate_mesh_vec.
+
+    Element (i, j, k) spans [origin + (i, j, k) * spacing, origin + (i + 1, j + 1, k + 1) * spacing].
+
+    Attributes:
+    - origin: The lower corner of element (0, 0, 0), shape (3,).
+    - spacing: The size of each element, shape ().
+    - shape: The number of elements (nx, ny, nz).
+    """
+
+    origin: jnp.ndarray
+    spacing: jnp.ndarray
+    shape: tuple
+
+
+def create_grid_descriptor(grid_centers, grid_size):
+    """
+    Describes a uniform grid by its origin, spacing, and shape.
+
+    Only the first element center is read, so the cost does not depend on the size of the grid.
+
+    Parameters:
+    - grid_centers: Grid element centers, shape (nx, ny, nz, 1, 3).
+    - grid_size: Size of each grid element.
+
+    Returns:
+    - The GridDescriptor of the grid.
+    """
+
+    grid_nx, grid_ny, grid_nz = grid_centers.shape[:3]
+    origin = grid_centers[0, 0, 0, 0] - grid_size / 2
+
+    return GridDescriptor(origin, jnp.asarray(grid_size), (grid_nx, grid_ny, grid_nz))
+
+
 def find_active_nodes(density, threshold=1e-3):
     """
     Given a density array (per node), return the indices of nodes with density above the threshold.
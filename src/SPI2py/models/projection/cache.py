@@ -0,0 +1,154 @@
+"""Projection cache
+
+Keeps the windowed pseudo-density of each object along with the pose it was projected at, so that only the
+objects that moved are reprojected.
+
+The cache is a standalone utility for optimization loops that call the projection functions directly; it is
+not connected to the OpenMDAO components.
+"""
+
+import hashlib
+
+import numpy as np
+
+from .windows import WindowedDensity
+
+
+def get_pose_key(*arrays):
+    """
+    Returns a hashable key that is equal for two poses if and only if all of their values are equal.
+
+    Parameters:
+    - arrays: The small arrays that define the pose, e.g., translation and rotation.
+
+    Returns:
+    - A tuple of the arrays' raw bytes.
+    """
+
+    return tuple(np.ascontiguousarray(array, dtype=np.float64).tobytes() for array in arrays)
+
+
+def get_mesh_key(*arrays):
+    """
+    Returns a digest of the arrays that define the mesh, e.g., the grid centers and kernel samples.
+
+    Compute it once per mesh and pass it to ProjectionCache.set_mesh, rather than hashing the mesh on
+    every update.
+
+    Parameters:
+    - arrays: The arrays that define the mesh.
+
+    Returns:
+    - The hexadecimal SHA-256 digest of the arrays' shapes and values.
+    """
+
+    digest = hashlib.sha256()
+
+    for array in arrays:
+        array = np.ascontiguousarray(array, dtype=np.float64)
+        digest.update(str(array.shape).encode())
+        digest.update(array.tobytes())
+
+    return digest.hexdigest()
+
+
+class ProjectionCache:
+    """
+    Tracks the aggregate pseudo-density of several objects and only reprojects the objects whose pose changed.
+
+    Each object's projection is stored as a WindowedDensity. When an object moves, its old window is
+    subtracted from the aggregate and the new one is added, so moving a single object costs one projection
+    instead of one per object. A change of the mesh is signaled with set_mesh, which forgets every projection.
+    """
+
+    def __init__(self, n_objects, grid_shape):
+
+        self.n_objects = n_objects
+        self.grid_shape = tuple(grid_shape)
+
+        self.mesh_key = None
+        self.pose_keys = [None] * n_objects
+        self.windowed_densities = [None] * n_objects
+        self.aggregate_densities = np.zeros(self.grid_shape)
+
+        # Diagnostics
+        self.n_projections = 0
+        self.n_hits = 0
+
+    def set_mesh(self, mesh_key):
+        """
+        Sets the mesh of the projections, and forgets every cached projection if it changed.
+
+        Parameters:
+        - mesh_key: Any hashable value that identifies the mesh, e.g., a version counter or get_mesh_key.
+        """
+
+        if mesh_key != self.mesh_key:
+            self.clear()
+            self.mesh_key = mesh_key
+
+    def update(self, index, pose, project):
+        """
+        Updates the pseudo-densities of one object.
+
+        Parameters:
+        - index: The index of the object.
+        - pose: A sequence of arrays that define the object's spheres and pose, see get_pose_key.
+        - project: A callable without arguments that returns the object's WindowedDensity,
+          e.g., with project_component_to_window.
+
+        Returns:
+        - The WindowedDensity of the object.
+        """
+
+        pose_key = get_pose_key(*pose)
+
+        # Reuse the previous projection if the object did not move
+        if pose_key == self.pose_keys[index]:
+            self.n_hits += 1
+            return self.windowed_densities[index]
+
+        # Project the object at its new pose
+        offset, values = project()
+        windowed_density = WindowedDensity(np.asarray(offset, dtype=int).reshape(3),
+                                           np.asarray(values, dtype=np.float64))
+        self.n_projections += 1
+
+        # Replace the object's old contribution
+        if self.windowed_densities[index] is not None:
+            self._add_window(self.windowed_densities[index], -1.0)
+        self._add_window(windowed_density, 1.0)
+
+        self.windowed_densities[index] = windowed_density
+        self.pose_keys[index] = pose_key
+
+        return windowed_density
+
+    def _add_window(self, windowed_density, scale):
+        """
+        Adds a scaled window to the aggregate pseudo-densities in place.
+        """
+
+        (i1, j1, k1), values = windowed_density
+        wx, wy, wz = values.shape
+        self.aggregate_densities[i1:i1 + wx, j1:j1 + wy, k1:k1 + wz] += scale * values
+
+    def refresh(self):
+        """
+        Re-sums the aggregate pseudo-densities to remove round-off accumulated by incremental updates.
+        """
+
+        self.aggregate_densities = np.zeros(self.grid_shape)
+
+        for windowed_density in self.windowed_densities:
+            if windowed_density is not None:
+                self._add_window(windowed_density, 1.0)
+
+    def clear(self):
+        """
+        Forgets all cached projections.
+        """
+
+        self.pose_keys = [None] * self.n_objects
+        self.windowed_densities = [None] * self.n_objects
+        self.aggregate_densities = np.zeros(self.grid_shape)
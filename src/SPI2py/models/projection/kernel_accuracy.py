@@ -0,0 +1,299 @@
+"""Kernel accuracy
+
+Measures how accurately each mesh kernel represents an object's volume, so that the cheapest kernel
+that meets an error target can be chosen.
+"""
+
+from functools import lru_cache, partial
+
+import numpy as np
+import jax.numpy as jnp
+from jax import jit, lax
+
+from .kernel_library import get_kernel, list_kernels
+from .mesh_kernels import create_uniform_kernel
+from .projection import project_component, get_slab_size, _project_in_slabs, _project_component_slab
+from ..geometry.spheres import get_aabb_indices
+from ..physics.distributed.mesh import generate_mesh_vec
+from ..utilities.precision import get_storage_dtype
+
+
+def measure_volume_error(kernel_points, kernel_radii, element_size=0.25, obj_radius=1.0,
+                         obj_center=(0.1, 0.05, 0.02), max_bytes=2 ** 28):
+    """
+    Calculates the relative volume error of projecting a reference sphere with a kernel.
+
+    Parameters:
+    - kernel_points: Kernel positions relative to a unit element, shape (nk, 3).
+    - kernel_radii: Kernel radii relative to a unit element, shape (nk, 1).
+    - element_size: Size of each grid element.
+    - obj_radius: Radius of the reference sphere.
+    - obj_center: Center of the reference sphere, offset from the grid nodes to avoid symmetric cases.
+    - max_bytes: Memory budget of the projection, see project_component, so that fine grids fit in memory.
+
+    Returns:
+    - The relative error of the projected volume.
+    """
+
+    volume_errors = measure_volume_errors({'kernel': (kernel_points, kernel_radii)}, element_size=element_size,
+                                          obj_radius=obj_radius, obj_center=obj_center, max_bytes=max_bytes)
+
+    return volume_errors['kernel']
+
+
+def measure_volume_errors(kernels, element_size=0.25, obj_radius=1.0, obj_center=(0.1, 0.05, 0.02),
+                          max_bytes=2 ** 28):
+    """
+    Calculates the relative volume errors of several kernels with a few compiled projections.
+
+    Kernels of similar size are padded with zero-radius spheres to a common number of samples, which neither
+    overlap the reference sphere nor add to the element volume, and are projected with one compiled function.
+    A group holds the kernels with up to eight times the samples of its smallest kernel, which bounds both the
+    number of compilations and the padding overhead.
+
+    Parameters:
+    - kernels: A dictionary of kernel name to (positions, radii).
+    - element_size, obj_radius, obj_center, max_bytes: See measure_volume_error.
+
+    Returns:
+    - A dictionary of kernel name to the relative error of the projected volume.
+    """
+
+    # Create a grid around the reference sphere
+    bound = obj_radius + 2 * element_size
+    _, _, centers, nx, ny, nz, _, _, _ = generate_mesh_vec(-bound, bound, -bound, bound, -bound, bound,
+                                                          element_size=element_size)
+    grid_centers = jnp.asarray(centers, dtype=get_storage_dtype()).reshape(nx, ny, nz, 1, 3)
+    grid_size = jnp.asarray(element_size, dtype=get_storage_dtype())
+
+    obj_points = jnp.asarray(obj_center, dtype=get_storage_dtype()).reshape(1, 3)
+    obj_radii = jnp.asarray(obj_radius, dtype=get_storage_dtype()).reshape(1, 1)
+    volume = (4 / 3) * np.pi * obj_radius ** 3
+
+    # Extract the active grid region within the sphere's AABB, as project_component does
+    i1, i2, j1, j2, k1, k2 = get_aabb_indices(grid_centers, grid_size, obj_points, obj_radii)
+    active_grid_centers = grid_centers[i1:i2 + 1, j1:j2 + 1, k1:k2 + 1]
+
+    # Group the kernels by their number of samples
+    groups = []
+    for name in sorted(kernels, key=lambda name: np.size(kernels[name][1])):
+        if not groups or np.size(kernels[name][1]) > 8 * np.size(kernels[groups[-1][0]][1]):
+            groups.append([])
+        groups[-1].append(name)
+
+    volume_errors = {}
+    for names in groups:
+
+        # Pad the kernels to the largest number of samples of the group
+        n_samples = np.size(kernels[names[-1]][1])
+        kernel_points = np.zeros((len(names), n_samples, 3))
+        kernel_radii = np.zeros((len(names), n_samples, 1))
+        for i, name in enumerate(names):
+            positions, radii = kernels[name]
+            kernel_points[i, :np.size(radii)] = np.reshape(positions, (-1, 3))
+            kernel_radii[i, :np.size(radii)] = np.reshape(radii, (-1, 1))
+        kernel_points = jnp.asarray(kernel_points, dtype=get_storage_dtype())
+        kernel_radii = jnp.asarray(kernel_radii, dtype=get_storage_dtype())
+
+        # Project the sphere with every kernel and compare the projected volumes with the exact one
+        slab_size = get_slab_size(active_grid_centers, kernel_points[0], obj_points, max_bytes)
+        densities = _project_kernels(active_grid_centers, grid_size, obj_points, obj_radii,
+                                     kernel_points, kernel_radii, slab_size)
+        projected_volumes = np.asarray(densities, dtype=np.float64) * element_size ** 3
+
+        for name, projected_volume in zip(names, projected_volumes):
+            volume_errors[name] = float(np.abs(volume - projected_volume) / volume)
+
+    return volume_errors
+
+
+@partial(jit, static_argnames='slab_size')
+def _project_kernels(active_grid_centers, grid_size, obj_points, obj_radii, kernel_points, kernel_radii, slab_size):
+    """
+    Sums the pseudo-densities of an object projected with each of several padded kernels.
+    """
+
+    def project_kernel(kernel):
+        densities = _project_in_slabs(_project_component_slab, active_grid_centers, slab_size,
+                                      grid_size, obj_points, obj_radii, *kernel)
+        return jnp.sum(densities)
+
+    return lax.map(project_kernel, (kernel_points, kernel_radii))
+
+
+def get_default_kernels(steps_per_edge=(1, 2, 4, 8)):
+    """
+    Returns the uniform kernels for each number of steps per edge along with the packaged kernels.
+
+    Returns:
+    - A dictionary of kernel name to (positions (nk, 3), radii (nk, 1)).
+    """
+
+    kernels = {}
+
+    for steps in steps_per_edge:
+        for mode in ('inscription', 'circumscription'):
+            positions, radii = create_uniform_kernel(steps, mode=mode)
+            kernels[f'uniform_{mode}_{steps}'] = (positions.reshape(-1, 3), radii.reshape(-1, 1))
+
+    for name in list_kernels():
+        kernels[name] = get_kernel(name)
+
+    return kernels
+
+
+def create_kernel_accuracy_table(kernels=None, element_size=0.25, obj_radius=1.0):
+    """
+    Tabulates the volume error and the number of samples of each kernel.
+
+    The cost of a projection is proportional to the number of kernel samples, so the first row of the
+    table that meets an error target is the cheapest kernel that does.
+
+    Parameters:
+    - kernels: A dictionary of kernel name to (positions, radii). Defaults to get_default_kernels().
+    - element_size: Size of each grid element, see measure_volume_error.
+    - obj_radius: Radius of the reference sphere, see measure_volume_error.
+
+    Returns:
+    - A list of dictionaries with the keys 'name', 'n_samples', and 'volume_error', sorted by the
+      number of samples and then by the volume error.
+    """
+
+    if kernels is None:
+        kernels = get_default_kernels()
+
+    volume_errors = measure_volume_errors(kernels, element_size=element_size, obj_radius=obj_radius)
+
+    table = [{'name': name, 'n_samples': int(np.size(radii)), 'volume_error': volume_errors[name]}
+             for name, (_, radii) in kernels.items()]
+
+    table.sort(key=lambda row: (row['n_samples'], row['volume_error']))
+
+    return table
+
+
+@lru_cache(maxsize=8)
+def get_kernel_accuracy_table(element_size=0.25, obj_radius=1.0):
+    """
+    Returns the accuracy table of the default kernels, measured once per element size.
+
+    Measuring the table still compiles a projection for each group of kernel sizes, see measure_volume_errors,
+    so the table is cached for the rest of the session.
+
+    Returns:
+    - The output of create_kernel_accuracy_table for get_default_kernels(), as a tuple.
+    """
+
+    return tuple(create_kernel_accuracy_table(element_size=element_size, obj_radius=obj_radius))
+
+
+def select_kernel(tolerance, table=None, kernels=None, element_size=0.25):
+    """
+    Selects the cheapest kernel whose volume error is within a tolerance.
+
+    Parameters:
+    - tolerance: The largest acceptable relative volume error.
+    - table: The output of create_kernel_accuracy_table, which is created from kernels if not given.
+    - kernels: A dictionary of kernel name to (positions, radii). Defaults to get_default_kernels(),
+      whose table is cached, see get_kernel_accuracy_table.
+    - element_size: The element size of the mesh to measure the kernels at, if table is not given.
+
+    Returns:
+    - The name of the selected kernel, or of the most accurate kernel if none meets the tolerance.
+    """
+
+    if table is None and kernels is None:
+        table = get_kernel_accuracy_table(element_size)
+    elif table is None:
+        table = create_kernel_accuracy_table(kernels, element_size=element_size)
+
+    for row in table:
+        if row['volume_error'] <= tolerance:
+            return row['name']
+
+    return min(table, key=lambda row: row['volume_error'])['name']
+
+
+def select_object_kernel(grid_centers, grid_size, obj_points, obj_radii, volume, tolerance, kernels=None):
+    """
+    Selects the cheapest kernel that projects a specific object within a volume error tolerance.
+
+    The kernels are tried from the fewest to the most samples, and the first one whose projected volume
+    is within the tolerance of the object's volume is returned.
+
+    Parameters:
+    - grid_centers: Grid element centers, shape (nx, ny, nz, 1, 3).
+    - grid_size: Size of each grid element.
+    - obj_points: Object points, shape (no, 3).
+    - obj_radii: Radii of the object points, shape (no, 1).
+    - volume: The exact volume of the object.
+    - tolerance: The largest acceptable relative volume error.
+    - kernels: A dictionary of kernel name to (positions, radii). Defaults to get_default_kernels().
+
+    Returns:
+    - name: The name of the selected kernel, or of the most accurate kernel if none meets the tolerance.
+    - volume_error: The relative volume error of the selected kernel.
+    """
+
+    if kernels is None:
+        kernels = get_default_kernels()
+
+    best_name, best_error = None, np.inf
+    for name, (positions, radii) in sorted(kernels.items(), key=lambda item: np.size(item[1][1])):
+
+        kernel_points = jnp.asarray(positions, dtype=get_storage_dtype()).reshape(-1, 3)
+        kernel_radii = jnp.asarray(radii, dtype=get_storage_dtype()).reshape(-1, 1)
+
+        densities, _, _ = project_component(grid_centers, grid_size, obj_points, obj_radii, kernel_points, kernel_radii)
+        volume_error = float(jnp.abs(volume - jnp.sum(densities) * grid_size ** 3) / volume)
+
+        if volume_error <= tolerance:
+            return name, volume_error
+
+        if volume_error < best_error:
+            best_name, best_error = name, volume_error
+
+    return best_name, best_error
+
+
+def get_phase_tolerance(progress, initial_tolerance, final_tolerance):
+    """
+    Interpolates the volume error tolerance of an optimization phase.
+
+    The tolerance shrinks geometrically from the initial to the final value, so early iterations can
+    use cheap kernels and the accuracy only rises as the optimizer converges.
+
+    Parameters:
+    - progress: The progress of the optimization, from 0 (start) to 1 (converged).
+    - initial_tolerance: The tolerance at the start of the optimization.
+    - final_tolerance: The tolerance near convergence.
+
+    Returns:
+    - The tolerance of the current phase.
+    """
+
+    progress = min(max(progress, 0.0), 1.0)
+
+    return initial_tolerance * (final_tolerance / initial_tolerance) ** progress
+
+
+def select_phase_kernel(progress, initial_tolerance, final_tolerance, table=None, element_size=0.25):
+    """
+    Selects the cheapest kernel that meets the volume error tolerance of an optimization phase.
+
+    Rebuild the grid kernel with the selected kernel whenever the name changes between phases.
+
+    Parameters:
+    - progress: The progress of the optimization, see get_phase_tolerance.
+    - initial_tolerance: The tolerance at the start of the optimization.
+    - final_tolerance: The tolerance near convergence.
+    - table: The output of create_kernel_accuracy_table. Defaults to the cached table of the default kernels.
+    - element_size: The element size of the mesh, if table is not given.
+
+    Returns:
+    - The name of the selected kernel.
+    """
+
+    tolerance = get_phase_tolerance(progress, initial_tolerance, final_tolerance)
+
+    return select_kernel(tolerance, table=table, element_size=element_size)
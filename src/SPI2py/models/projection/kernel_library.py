@@ -0,0 +1,62 @@
+"""Kernel library
+
+Packaged mesh kernels, stored as (n, 4) arrays of [x, y, z, radius] in kernels/<name>.npy relative to a unit
+grid element. Each kernel is memory-mapped the first time it is requested.
+"""
+
+import os
+from functools import lru_cache
+
+import numpy as np
+
+KERNEL_DIRECTORY = os.path.join(os.path.dirname(__file__), 'kernels')
+
+
+def list_kernels():
+    """
+    Returns the names of the packaged kernels.
+    """
+
+    return sorted(os.path.splitext(filename)[0] for filename in os.listdir(KERNEL_DIRECTORY)
+                  if filename.endswith('.npy'))
+
+
+@lru_cache(maxsize=None)
+def _load_kernel(name):
+    """
+    Memory-maps the [x, y, z, radius] array of a packaged kernel.
+    """
+
+    filepath = os.path.join(KERNEL_DIRECTORY, f'{name}.npy')
+
+    if not os.path.isfile(filepath):
+        raise ValueError(f"Unknown kernel '{name}'. Use one of {list_kernels()}.")
+
+    return np.load(filepath, mmap_mode='r')
+
+
+def get_kernel(name, min_radius=None):
+    """
+    Returns a packaged kernel.
+
+    Spheres are stored from largest to smallest, so truncating by radius instead of by count keeps
+    the kernel symmetric.
+
+    Parameters:
+    - name: The name of the kernel, see list_kernels.
+    - min_radius: If given, only the spheres with at least this radius are returned.
+
+    Returns:
+    - positions: The sphere positions, shape (n, 3).
+    - radii: The sphere radii, shape (n, 1).
+    """
+
+    xyzr = _load_kernel(name)
+
+    if min_radius is not None:
+        xyzr = xyzr[xyzr[:, 3] >= min_radius]
+
+    positions = np.array(xyzr[:, :3])
+    radii = np.array(xyzr[:, 3:4])
+
+    return positions, radii
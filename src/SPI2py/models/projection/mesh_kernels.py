@@ -1,4 +1,11 @@
+from functools import lru_cache
+from typing import NamedTuple
+
 import numpy as np
+import jax.numpy as jnp
+from jax import lax
+
+from .kernel_library import get_kernel, list_kernels
 
 
 # def create_uniform_inscription_kernel(steps_per_edge):
@@ -28,46 +35,43 @@ import numpy as np
 
 
 
+@lru_cache(maxsize=32)
 def create_uniform_kernel(steps_per_edge, mode='inscription'):
     """
     Create a uniform grid of spheres based on the given mode.
 
+    The spheres are centered on the sub-cells of a unit element centered at the origin. Results are
+    cached by (steps_per_edge, mode) and returned as read-only arrays.
+
     Parameters:
     - steps_per_edge (int): Number of steps per edge of the grid.
     - mode (str): Either 'inscription' for inscribed spheres or 'circumscription' for circumscribed spheres.
 
     Returns:
-    - positions (numpy array): Array of sphere positions.
-    - radii (numpy array): Array of sphere radii.
+    - positions (numpy array): Array of sphere positions, shape (steps_per_edge, steps_per_edge, steps_per_edge, 3).
+    - radii (numpy array): Array of sphere radii, shape (steps_per_edge, steps_per_edge, steps_per_edge).
     """
     # Step size (distance between centers of consecutive spheres in the grid)
     step_size = 1.0 / steps_per_edge
 
-    # Initialize arrays for sphere positions and radii
-    positions = np.zeros((steps_per_edge, steps_per_edge, steps_per_edge, 3))  # 3 for (x, y, z) coordinates
-    radii = np.zeros((steps_per_edge, steps_per_edge, steps_per_edge))  # Radii of spheres
-
-    # Determine radius and center offset based on the mode
+    # Determine the radius based on the mode
     if mode == 'inscription':
         sphere_radius = 0.5 * step_size  # Inscribed sphere radius (half the cube edge length)
-        center_offset = 0.5 * step_size  # Center is inside the cube
     elif mode == 'circumscription':
         sphere_radius = (3 ** 0.5) * 0.5 * step_size  # Circumscribed sphere radius (half the cube diagonal)
-        center_offset = 0.0  # Center aligned with the grid corner for circumscriptions
     else:
         raise ValueError("Invalid mode. Use 'inscription' or 'circumscription'.")
 
-    # Loop through the grid and compute the sphere positions and radii
-    for i in range(steps_per_edge):
-        for j in range(steps_per_edge):
-            for k in range(steps_per_edge):
-                # The center of each sphere
-                x = (i + center_offset) * step_size
-                y = (j + center_offset) * step_size
-                z = (k + center_offset) * step_size
+    # The center of each sphere
+    centers = -0.5 + (np.arange(steps_per_edge) + 0.5) * step_size
+    x, y, z = np.meshgrid(centers, centers, centers, indexing='ij')
+
+    positions = np.stack([x, y, z], axis=-1)
+    radii = np.full((steps_per_edge, steps_per_edge, steps_per_edge), sphere_radius)
 
-                positions[i, j, k] = [x, y, z]
-                radii[i, j, k] = sphere_radius
+    # Prevent callers from modifying the cached arrays
+    positions.flags.writeable = False
+    radii.flags.writeable = False
 
     return positions, radii
 
@@ -78,9 +82,9 @@ def apply_kernel(element_centers, element_size, kernel_positions, kernel_radii):
     nx, ny, nz, _, _ = element_centers.shape
     ns, _ = kernel_positions.shape
 
-    element_size_expanded = np.broadcast_to(element_size, (nx, ny, nz, ns, 1))
-    kernel_pos_expanded = np.broadcast_to(kernel_positions, (nx, ny, nz, ns, 3))
-    kernel_rad_expanded = np.broadcast_to(kernel_radii, (nx, ny, nz, ns, 1))
+    element_size_expanded = jnp.broadcast_to(element_size, (nx, ny, nz, ns, 1))
+    kernel_pos_expanded = jnp.broadcast_to(kernel_positions, (nx, ny, nz, ns, 3))
+    kernel_rad_expanded = jnp.broadcast_to(kernel_radii, (nx, ny, nz, ns, 1))
 
     # Broadcast the kernel positions and radii to the grid
     all_positions = element_centers + (element_size_expanded * kernel_pos_expanded)
@@ -89,1278 +93,92 @@ def apply_kernel(element_centers, element_size, kernel_positions, kernel_radii):
     return all_positions, all_radii
 
 
-mdbd_1_kernel_positions = [[0.0, 0.0, 0.0]]
-mdbd_1_kernel_radii = [0.5]
+class GridKernel(NamedTuple):
+    """
+    Kernel samples of every grid element, computed once per grid and kernel.
+
+    Attributes:
+    - grid_centers: Grid element centers, shape (nx, ny, nz, 1, 3).
+    - grid_size: Size of each grid element, shape ().
+    - kernel_points: Kernel points of every grid element, shape (nx, ny, nz, nk, 3).
+    - kernel_radii: Kernel radii of every grid element, shape (nx, ny, nz, nk, 1).
+    """
+
+    grid_centers: jnp.ndarray
+    grid_size: jnp.ndarray
+    kernel_points: jnp.ndarray
+    kernel_radii: jnp.ndarray
+
+
+def create_grid_kernel(grid_centers, grid_size, kernel_positions, kernel_radii):
+    """
+    Applies a kernel to every element of a grid.
+
+    Parameters:
+    - grid_centers: Grid element centers, shape (nx, ny, nz, 1, 3).
+    - grid_size: Size of each grid element.
+    - kernel_positions: Kernel positions relative to a unit element, shape (nk, 3).
+    - kernel_radii: Kernel radii relative to a unit element, shape (nk, 1).
+
+    Returns:
+    - The GridKernel of the grid.
+    """
+
+    all_positions, all_radii = apply_kernel(grid_centers, grid_size, kernel_positions, kernel_radii)
+
+    return GridKernel(grid_centers, jnp.asarray(grid_size), all_positions, all_radii)
 
-mdbd_9_kernel_positions = [[0.0, 0.0, 0.0], [-0.366, -0.366, -0.366],
-                           [-0.366, -0.366, 0.366],
-                           [-0.366, 0.366, -0.366],
-                           [-0.366, 0.366, 0.366],
-                           [0.366, -0.366, -0.366],
-                           [0.366, -0.366, 0.366],
-                           [0.366, 0.366, -0.366],
-                           [0.366, 0.366, 0.366]]
 
-mdbd_9_kernel_radii = [0.5, 0.134, 0.134, 0.134, 0.134, 0.134, 0.134, 0.134, 0.134]
+def slice_grid_kernel(grid_kernel, i1, i2, j1, j2, k1, k2):
+    """
+    Returns the GridKernel of the elements within the inclusive index ranges [i1, i2], [j1, j2], [k1, k2].
+
+    The window is a basic slice of the precomputed samples, so the kernel is not re-applied.
+    """
+
+    return GridKernel(grid_kernel.grid_centers[i1:i2 + 1, j1:j2 + 1, k1:k2 + 1],
+                      grid_kernel.grid_size,
+                      grid_kernel.kernel_points[i1:i2 + 1, j1:j2 + 1, k1:k2 + 1],
+                      grid_kernel.kernel_radii[i1:i2 + 1, j1:j2 + 1, k1:k2 + 1])
+
 
-uniform_8_kernel_positions = [[-0.25, -0.25, -0.25],
-                              [-0.25, 0.25, -0.25],
-                              [0.25, -0.25, -0.25],
-                              [0.25, 0.25, -0.25],
-                                [-0.25, -0.25, 0.25],
-                              [-0.25, 0.25, 0.25],
-                                [0.25, -0.25, 0.25],
-                                [0.25, 0.25, 0.25]]
-uniform_8_kernel_radii = [0.25, 0.25, 0.25, 0.25, 0.25, 0.25, 0.25, 0.25]
+def dynamic_slice_grid_kernel(grid_kernel, window_start, window_shape):
+    """
+    Returns the GridKernel of a fixed-shape window that starts at traced indices, for use under jit.
+
+    Parameters:
+    - grid_kernel: The GridKernel of the grid.
+    - window_start: The grid indices (i1, j1, k1) of the window's first element.
+    - window_shape: The static window dimensions (wx, wy, wz).
+
+    Returns:
+    - The GridKernel of the window.
+    """
+
+    i1, j1, k1 = window_start
+    wx, wy, wz = window_shape
+
+    def slice_window(array):
+        return lax.dynamic_slice(array, (i1, j1, k1, 0, 0), (wx, wy, wz, array.shape[3], array.shape[4]))
+
+    return GridKernel(slice_window(grid_kernel.grid_centers),
+                      grid_kernel.grid_size,
+                      slice_window(grid_kernel.kernel_points),
+                      slice_window(grid_kernel.kernel_radii))
+
+
+
+def __getattr__(name):
+    """
+    Loads the <kernel>_kernel_positions and <kernel>_kernel_radii attributes from the kernel library on first access.
+    """
 
-uniform_64_kernel_positions = [[-0.375, -0.375, -0.375], [-0.375, -0.125, -0.375], [-0.375, 0.125, -0.375], [-0.375, 0.375, -0.375], [-0.125, -0.375, -0.375], [-0.125, -0.125, -0.375], [-0.125, 0.125, -0.375], [-0.125, 0.375, -0.375], [0.125, -0.375, -0.375], [0.125, -0.125, -0.375], [0.125, 0.125, -0.375], [0.125, 0.375, -0.375], [0.375, -0.375, -0.375], [0.375, -0.125, -0.375], [0.375, 0.125, -0.375], [0.375, 0.375, -0.375], [-0.375, -0.375, -0.125], [-0.375, -0.125, -0.125], [-0.375, 0.125, -0.125], [-0.375, 0.375, -0.125], [-0.125, -0.375, -0.125], [-0.125, -0.125, -0.125], [-0.125, 0.125, -0.125], [-0.125, 0.375, -0.125], [0.125, -0.375, -0.125], [0.125, -0.125, -0.125], [0.125, 0.125, -0.125], [0.125, 0.375, -0.125], [0.375, -0.375, -0.125], [0.375, -0.125, -0.125], [0.375, 0.125, -0.125], [0.375, 0.375, -0.125], [-0.375, -0.375, 0.125], [-0.375, -0.125, 0.125], [-0.375, 0.125, 0.125], [-0.375, 0.375, 0.125], [-0.125, -0.375, 0.125], [-0.125, -0.125, 0.125], [-0.125, 0.125, 0.125], [-0.125, 0.375, 0.125], [0.125, -0.375, 0.125], [0.125, -0.125, 0.125], [0.125, 0.125, 0.125], [0.125, 0.375, 0.125], [0.375, -0.375, 0.125], [0.375, -0.125, 0.125], [0.375, 0.125, 0.125], [0.375, 0.375, 0.125], [-0.375, -0.375, 0.375], [-0.375, -0.125, 0.375], [-0.375, 0.125, 0.375], [-0.375, 0.375, 0.375], [-0.125, -0.375, 0.375], [-0.125, -0.125, 0.375], [-0.125, 0.125, 0.375], [-0.125, 0.375, 0.375], [0.125, -0.375, 0.375], [0.125, -0.125, 0.375], [0.125, 0.125, 0.375], [0.125, 0.375, 0.375], [0.375, -0.375, 0.375], [0.375, -0.125, 0.375], [0.375, 0.125, 0.375], [0.375, 0.375, 0.375]]
-uniform_64_kernel_radii = [0.125, 0.125, 0.125, 0.125, 0.125, 0.125, 0.125, 0.125, 0.125, 0.125, 0.125, 0.125, 0.125, 0.125, 0.125, 0.125, 0.125, 0.125, 0.125, 0.125, 0.125, 0.125, 0.125, 0.125, 0.125, 0.125, 0.125, 0.125, 0.125, 0.125, 0.125, 0.125, 0.125, 0.125, 0.125, 0.125, 0.125, 0.125, 0.125, 0.125, 0.125, 0.125, 0.125, 0.125, 0.125, 0.125, 0.125, 0.125, 0.125, 0.125, 0.125, 0.125, 0.125, 0.125, 0.125, 0.125, 0.125, 0.125, 0.125, 0.125, 0.125, 0.125, 0.125, 0.125]
+    for suffix in ('_kernel_positions', '_kernel_radii'):
+        kernel_name = name[:-len(suffix)]
+        if name.endswith(suffix) and kernel_name in list_kernels():
+            positions, radii = get_kernel(kernel_name)
+            value = positions if suffix == '_kernel_positions' else radii.reshape(-1)
+            globals()[name] = value
+            return value
 
-mdbd_kernel_positions = [[0.0, 0.0, 0.0], [0.32258064516129026, 0.32258064516129026, 0.32258064516129026],
-                         [0.32258064516129026, 0.32258064516129026, -0.3225806451612903],
-                         [-0.3225806451612903, -0.3225806451612903, -0.3225806451612903],
-                         [0.32258064516129026, -0.3225806451612903, 0.32258064516129026],
-                         [0.32258064516129026, -0.3225806451612903, -0.3225806451612903],
-                         [-0.3225806451612903, -0.3225806451612903, 0.32258064516129026],
-                         [-0.3225806451612903, 0.32258064516129026, -0.3225806451612903],
-                         [-0.3225806451612903, 0.32258064516129026, 0.32258064516129026],
-                         [-0.3870967741935484, 0.3870967741935484, -0.11290322580645162],
-                         [-0.3870967741935484, 0.3870967741935484, 0.10483870967741937],
-                         [-0.3870967741935484, -0.10483870967741937, -0.3870967741935484],
-                         [-0.3870967741935484, -0.11290322580645162, 0.3870967741935484],
-                         [-0.10483870967741937, -0.3870967741935484, -0.3870967741935484],
-                         [-0.14516129032258063, -0.3870967741935484, 0.3870967741935484],
-                         [-0.3870967741935484, 0.14516129032258063, -0.3870967741935484],
-                         [-0.3870967741935484, 0.13709677419354838, 0.3870967741935484],
-                         [-0.11290322580645162, 0.3870967741935484, 0.3870967741935484],
-                         [-0.11290322580645162, 0.3870967741935484, -0.3870967741935484],
-                         [-0.3790322580645161, -0.3870967741935484, -0.12903225806451613],
-                         [-0.3790322580645161, -0.3870967741935484, 0.13709677419354838],
-                         [0.3790322580645161, -0.3870967741935484, 0.12903225806451613],
-                         [0.3790322580645161, -0.3870967741935484, -0.12903225806451613],
-                         [0.3870967741935484, 0.3870967741935484, -0.10483870967741937],
-                         [0.3870967741935484, 0.3870967741935484, 0.14516129032258063],
-                         [0.12903225806451613, 0.3870967741935484, 0.3790322580645161],
-                         [0.13709677419354838, -0.3870967741935484, 0.3790322580645161],
-                         [0.13709677419354838, -0.3790322580645161, -0.3870967741935484],
-                         [0.13709677419354838, 0.3790322580645161, -0.3870967741935484],
-                         [0.3870967741935484, -0.11290322580645162, -0.3870967741935484],
-                         [0.3870967741935484, -0.12096774193548387, 0.3870967741935484],
-                         [0.3870967741935484, 0.12903225806451613, -0.3790322580645161],
-                         [0.3870967741935484, 0.12096774193548387, 0.3870967741935484],
-                         [-0.016129032258064502, -0.3951612903225806, 0.3951612903225806],
-                         [0.3951612903225806, -0.3951612903225806, 0.0],
-                         [-0.3951612903225806, -0.3951612903225806, 0.0],
-                         [0.016129032258064502, 0.41129032258064513, -0.4032258064516129],
-                         [0.41129032258064513, 0.0, 0.4193548387096774],
-                         [0.008064516129032251, 0.4193548387096774, 0.41129032258064513],
-                         [0.41129032258064513, 0.4193548387096774, 0.024193548387096753],
-                         [-0.3709677419354839, 0.016129032258064502, 0.4193548387096774],
-                         [0.4193548387096774, 0.008064516129032251, -0.41129032258064513],
-                         [-0.41935483870967744, 0.024193548387096753, -0.41935483870967744],
-                         [0.016129032258064502, -0.41935483870967744, -0.41129032258064513],
-                         [-0.43548387096774194, 0.008064516129032251, 0.3548387096774194],
-                         [-0.43548387096774194, -0.43548387096774194, 0.44354838709677413],
-                         [-0.217741935483871, 0.44354838709677413, 0.44354838709677413],
-                         [-0.43548387096774194, 0.44354838709677413, -0.43548387096774194],
-                         [-0.43548387096774194, 0.4354838709677419, 0.44354838709677413],
-                         [-0.43548387096774194, 0.44354838709677413, 0.20967741935483875],
-                         [-0.43548387096774194, 0.44354838709677413, 0.0],
-                         [-0.33870967741935487, 0.44354838709677413, -0.008064516129032251],
-                         [0.032258064516129004, 0.33870967741935476, 0.44354838709677413],
-                         [0.44354838709677413, -0.43548387096774194, 0.44354838709677413],
-                         [0.44354838709677413, -0.43548387096774194, -0.43548387096774194],
-                         [0.42741935483870963, 0.44354838709677413, 0.44354838709677413],
-                         [0.4354838709677419, 0.44354838709677413, -0.43548387096774194],
-                         [0.4354838709677419, 0.44354838709677413, -0.20967741935483875],
-                         [0.44354838709677413, 0.33870967741935476, 0.0],
-                         [-0.4435483870967742, -0.4274193548387097, -0.4435483870967742],
-                         [-0.217741935483871, -0.4435483870967742, -0.4435483870967742],
-                         [-0.4435483870967742, -0.20967741935483875, -0.43548387096774194],
-                         [-0.4435483870967742, -0.217741935483871, 0.44354838709677413],
-                         [0.33870967741935476, 0.032258064516129004, -0.4435483870967742],
-                         [0.44354838709677413, -0.217741935483871, -0.4435483870967742],
-                         [-0.217741935483871, 0.44354838709677413, -0.4435483870967742],
-                         [-0.4435483870967742, 0.33870967741935476, 0.0],
-                         [-0.4435483870967742, 0.44354838709677413, -0.217741935483871],
-                         [0.032258064516129004, 0.4516129032258064, 0.3306451612903225],
-                         [0.056451612903225756, -0.3225806451612903, 0.4516129032258064],
-                         [0.4354838709677419, 0.217741935483871, 0.4516129032258064],
-                         [-0.29838709677419356, 0.4516129032258064, 0.16935483870967738],
-                         [0.17741935483870963, 0.4516129032258064, -0.282258064516129],
-                         [0.17741935483870963, 0.27419354838709675, 0.4516129032258064],
-                         [0.17741935483870963, -0.27419354838709675, 0.4516129032258064],
-                         [0.44354838709677413, -0.2338709677419355, 0.4516129032258064],
-                         [0.17741935483870963, 0.4516129032258064, 0.282258064516129],
-                         [0.217741935483871, 0.44354838709677413, 0.4516129032258064],
-                         [0.22580645161290325, -0.4435483870967742, 0.4516129032258064],
-                         [-0.2903225806451613, -0.16935483870967744, 0.4516129032258064],
-                         [0.4516129032258064, -0.4435483870967742, 0.217741935483871],
-                         [-0.2903225806451613, 0.4516129032258064, -0.16935483870967744],
-                         [0.4516129032258064, -0.4435483870967742, -0.2338709677419355],
-                         [0.282258064516129, 0.17741935483870963, 0.4516129032258064],
-                         [0.282258064516129, 0.4516129032258064, 0.17741935483870963],
-                         [0.282258064516129, 0.4516129032258064, -0.16935483870967744],
-                         [0.282258064516129, -0.16935483870967744, 0.4516129032258064],
-                         [0.3306451612903225, 0.024193548387096753, 0.4516129032258064],
-                         [0.3306451612903225, 0.4516129032258064, 0.0],
-                         [0.32258064516129026, 0.4516129032258064, 0.056451612903225756],
-                         [0.22580645161290325, 0.4516129032258064, -0.4435483870967742],
-                         [0.4516129032258064, 0.22580645161290325, -0.4435483870967742],
-                         [0.4516129032258064, 0.17741935483870963, 0.27419354838709675],
-                         [0.4516129032258064, 0.282258064516129, -0.1774193548387097],
-                         [0.4516129032258064, 0.27419354838709675, 0.17741935483870963],
-                         [0.4516129032258064, 0.17741935483870963, -0.282258064516129],
-                         [0.4516129032258064, 0.4516129032258064, 0.2338709677419355],
-                         [-0.27419354838709675, 0.17741935483870963, 0.4516129032258064],
-                         [0.4516129032258064, -0.1774193548387097, -0.27419354838709675],
-                         [0.4516129032258064, -0.16935483870967744, 0.282258064516129],
-                         [0.4516129032258064, -0.282258064516129, -0.1774193548387097],
-                         [0.4516129032258064, -0.2903225806451613, 0.16935483870967738],
-                         [0.4516129032258064, 0.016129032258064502, 0.3306451612903225],
-                         [0.4516129032258064, 0.032258064516129004, -0.3306451612903226],
-                         [-0.4435483870967742, 0.2338709677419355, 0.4516129032258064],
-                         [-0.16129032258064518, 0.4516129032258064, -0.2903225806451613],
-                         [-0.16129032258064518, 0.4516129032258064, 0.29032258064516125],
-                         [-0.16129032258064518, 0.29032258064516125, 0.4516129032258064],
-                         [-0.1774193548387097, -0.27419354838709675, 0.4516129032258064],
-                         [-0.45161290322580644, 0.040322580645161255, -0.3306451612903226],
-                         [-0.282258064516129, -0.16935483870967744, -0.45161290322580644],
-                         [-0.45161290322580644, 0.048387096774193505, 0.4516129032258064],
-                         [-0.282258064516129, 0.17741935483870963, -0.45161290322580644],
-                         [-0.45161290322580644, -0.024193548387096808, 0.4516129032258064],
-                         [-0.45161290322580644, -0.1774193548387097, -0.282258064516129],
-                         [-0.45161290322580644, -0.1774193548387097, 0.27419354838709675],
-                         [-0.4435483870967742, -0.45161290322580644, -0.217741935483871],
-                         [-0.4435483870967742, -0.45161290322580644, 0.22580645161290325],
-                         [-0.45161290322580644, 0.16935483870967738, 0.282258064516129],
-                         [-0.45161290322580644, 0.17741935483870963, -0.27419354838709675],
-                         [-0.27419354838709675, -0.45161290322580644, -0.1774193548387097],
-                         [-0.27419354838709675, -0.45161290322580644, 0.17741935483870963],
-                         [-0.45161290322580644, 0.29032258064516125, 0.16935483870967738],
-                         [-0.45161290322580644, 0.29032258064516125, -0.16935483870967744],
-                         [-0.45161290322580644, 0.24193548387096775, -0.45161290322580644],
-                         [0.24193548387096775, -0.45161290322580644, -0.45161290322580644],
-                         [-0.16129032258064518, -0.45161290322580644, -0.2903225806451613],
-                         [-0.16129032258064518, -0.2903225806451613, -0.45161290322580644],
-                         [-0.16935483870967744, 0.29032258064516125, -0.45161290322580644],
-                         [0.29032258064516125, -0.16935483870967744, -0.45161290322580644],
-                         [-0.33870967741935487, 0.048387096774193505, -0.45161290322580644],
-                         [0.29032258064516125, 0.16935483870967738, -0.45161290322580644],
-                         [-0.3306451612903226, -0.008064516129032251, -0.45161290322580644],
-                         [0.27419354838709675, -0.45161290322580644, -0.1774193548387097],
-                         [0.27419354838709675, -0.45161290322580644, 0.17741935483870963],
-                         [-0.1774193548387097, -0.45161290322580644, 0.282258064516129],
-                         [-0.45161290322580644, -0.27419354838709675, -0.1774193548387097],
-                         [-0.45161290322580644, -0.282258064516129, 0.16935483870967738],
-                         [0.16935483870967738, -0.45161290322580644, -0.282258064516129],
-                         [0.17741935483870963, -0.27419354838709675, -0.45161290322580644],
-                         [0.17741935483870963, -0.45161290322580644, 0.27419354838709675],
-                         [0.17741935483870963, 0.27419354838709675, -0.45161290322580644],
-                         [0.008064516129032251, -0.3306451612903226, -0.45161290322580644],
-                         [-0.008064516129032251, -0.45161290322580644, -0.3306451612903226],
-                         [-0.2338709677419355, -0.45161290322580644, 0.4516129032258064],
-                         [-0.016129032258064502, 0.3306451612903225, -0.45161290322580644],
-                         [0.048387096774193505, -0.45161290322580644, -0.3225806451612903],
-                         [0.3629032258064516, 0.45967741935483863, 0.45967741935483863],
-                         [-0.20161290322580644, 0.45967741935483863, -0.24193548387096775],
-                         [0.032258064516129004, 0.45967741935483863, -0.31451612903225806],
-                         [-0.20161290322580644, 0.45967741935483863, 0.24193548387096775],
-                         [0.12096774193548387, 0.45967741935483863, -0.2903225806451613],
-                         [-0.03225806451612906, 0.45967741935483863, 0.32258064516129026],
-                         [-0.24193548387096775, 0.45967741935483863, 0.20161290322580638],
-                         [-0.03225806451612906, 0.45967741935483863, -0.3225806451612903],
-                         [0.27419354838709675, 0.45967741935483863, 0.45967741935483863],
-                         [-0.08064516129032262, -0.3064516129032258, 0.45967741935483863],
-                         [0.12096774193548387, -0.2903225806451613, 0.45967741935483863],
-                         [0.12096774193548387, 0.29032258064516125, 0.45967741935483863],
-                         [-0.282258064516129, 0.45967741935483863, 0.45967741935483863],
-                         [0.45967741935483863, 0.4516129032258064, 0.3870967741935484],
-                         [0.45967741935483863, 0.45967741935483863, -0.3629032258064516],
-                         [0.45967741935483863, 0.45967741935483863, -0.282258064516129],
-                         [-0.24193548387096775, 0.45967741935483863, -0.20161290322580644],
-                         [-0.03225806451612906, 0.314516129032258, 0.45967741935483863],
-                         [-0.3709677419354839, 0.45967741935483863, 0.45967741935483863],
-                         [-0.20161290322580644, 0.24193548387096775, 0.45967741935483863],
-                         [-0.3064516129032258, 0.07258064516129026, 0.45967741935483863],
-                         [0.45967741935483863, -0.2903225806451613, -0.12096774193548387],
-                         [0.45967741935483863, -0.3064516129032258, 0.07258064516129026],
-                         [0.45967741935483863, -0.3064516129032258, -0.07258064516129031],
-                         [0.45967741935483863, -0.24193548387096775, 0.20161290322580638],
-                         [0.45967741935483863, -0.3629032258064516, 0.45967741935483863],
-                         [0.06451612903225801, -0.45161290322580644, 0.45967741935483863],
-                         [0.314516129032258, -0.04032258064516131, 0.45967741935483863],
-                         [0.45967741935483863, -0.024193548387096808, -0.3306451612903226],
-                         [0.45967741935483863, -0.04032258064516131, 0.314516129032258],
-                         [0.45967741935483863, 0.314516129032258, 0.056451612903225756],
-                         [0.45967741935483863, 0.27419354838709675, 0.45967741935483863],
-                         [0.4516129032258064, 0.3870967741935484, 0.45967741935483863],
-                         [0.45967741935483863, 0.3870967741935484, -0.45161290322580644],
-                         [-0.45161290322580644, 0.45967741935483863, 0.3870967741935484],
-                         [-0.24193548387096775, -0.20161290322580644, 0.45967741935483863],
-                         [-0.4596774193548387, -0.2661290322580645, -0.4596774193548387],
-                         [-0.3629032258064516, -0.4596774193548387, -0.4596774193548387],
-                         [-0.4596774193548387, -0.3709677419354839, 0.45967741935483863],
-                         [-0.4596774193548387, -0.3629032258064516, -0.4596774193548387],
-                         [-0.3709677419354839, 0.45967741935483863, -0.4596774193548387],
-                         [-0.4596774193548387, -0.2903225806451613, -0.12096774193548387],
-                         [-0.4596774193548387, -0.31451612903225806, 0.056451612903225756],
-                         [-0.4596774193548387, -0.31451612903225806, -0.05645161290322581],
-                         [-0.20161290322580644, -0.4596774193548387, -0.24193548387096775],
-                         [-0.3629032258064516, -0.4596774193548387, 0.45967741935483863],
-                         [0.314516129032258, -0.024193548387096808, -0.4596774193548387],
-                         [-0.4596774193548387, -0.282258064516129, 0.45967741935483863],
-                         [0.3629032258064516, 0.45967741935483863, -0.4596774193548387],
-                         [-0.31451612903225806, -0.4596774193548387, 0.056451612903225756],
-                         [0.3709677419354839, -0.4596774193548387, -0.4596774193548387],
-                         [0.3629032258064516, -0.4596774193548387, 0.45967741935483863],
-                         [0.282258064516129, -0.4596774193548387, 0.45967741935483863],
-                         [0.282258064516129, 0.45967741935483863, -0.4596774193548387],
-                         [-0.4596774193548387, -0.4596774193548387, 0.3870967741935484],
-                         [-0.4596774193548387, -0.45161290322580644, -0.3870967741935484],
-                         [-0.4596774193548387, -0.4596774193548387, 0.282258064516129],
-                         [-0.4596774193548387, -0.4596774193548387, -0.27419354838709675],
-                         [-0.20161290322580644, -0.24193548387096775, -0.4596774193548387],
-                         [-0.20161290322580644, 0.24193548387096775, -0.4596774193548387],
-                         [0.24193548387096775, -0.20161290322580644, -0.4596774193548387],
-                         [0.24193548387096775, 0.20161290322580638, -0.4596774193548387],
-                         [0.45967741935483863, -0.4596774193548387, -0.3790322580645161],
-                         [0.45967741935483863, -0.4596774193548387, 0.27419354838709675],
-                         [0.45967741935483863, -0.4596774193548387, 0.3629032258064516],
-                         [0.056451612903225756, 0.314516129032258, -0.4596774193548387],
-                         [-0.4596774193548387, 0.45967741935483863, -0.3629032258064516],
-                         [-0.45161290322580644, 0.3870967741935484, -0.4596774193548387],
-                         [-0.4596774193548387, 0.45967741935483863, -0.282258064516129],
-                         [0.45967741935483863, 0.282258064516129, -0.4596774193548387],
-                         [-0.4596774193548387, 0.45967741935483863, 0.282258064516129],
-                         [0.45967741935483863, -0.282258064516129, -0.4596774193548387],
-                         [0.45967741935483863, -0.3709677419354839, -0.4596774193548387],
-                         [-0.4596774193548387, 0.3709677419354839, 0.45967741935483863],
-                         [0.040322580645161255, -0.4596774193548387, 0.314516129032258],
-                         [-0.07258064516129031, -0.4596774193548387, 0.30645161290322576],
-                         [-0.282258064516129, -0.4596774193548387, -0.4596774193548387],
-                         [-0.282258064516129, 0.45967741935483863, -0.4596774193548387],
-                         [-0.4596774193548387, -0.024193548387096808, -0.3225806451612903],
-                         [-0.4596774193548387, 0.07258064516129026, 0.30645161290322576],
-                         [-0.4596774193548387, 0.24193548387096775, -0.20161290322580644],
-                         [-0.4596774193548387, 0.24193548387096775, 0.20161290322580638],
-                         [-0.467741935483871, -0.12096774193548387, -0.2903225806451613],
-                         [0.467741935483871, 0.45967741935483863, -0.04032258064516131],
-                         [-0.467741935483871, -0.10483870967741937, 0.29032258064516125],
-                         [-0.467741935483871, -0.4596774193548387, -0.33870967741935487],
-                         [0.467741935483871, 0.467741935483871, -0.16129032258064518],
-                         [0.467741935483871, 0.467741935483871, 0.32258064516129026],
-                         [0.467741935483871, 0.467741935483871, 0.08870967741935487],
-                         [-0.467741935483871, -0.4596774193548387, -0.07258064516129031],
-                         [0.467741935483871, -0.29838709677419356, 0.467741935483871],
-                         [0.467741935483871, -0.3064516129032258, 0.024193548387096753],
-                         [0.467741935483871, -0.3064516129032258, -0.024193548387096808],
-                         [0.314516129032258, -0.467741935483871, -0.04838709677419356],
-                         [0.314516129032258, -0.467741935483871, 0.048387096774193505],
-                         [0.314516129032258, -0.467741935483871, -0.4596774193548387],
-                         [0.467741935483871, -0.282258064516129, 0.11290322580645162],
-                         [-0.467741935483871, -0.06451612903225806, -0.29838709677419356],
-                         [-0.467741935483871, -0.06451612903225806, 0.2983870967741935],
-                         [-0.467741935483871, -0.467741935483871, 0.3306451612903225],
-                         [0.45967741935483863, 0.07258064516129026, -0.467741935483871],
-                         [-0.467741935483871, -0.467741935483871, -0.16935483870967744],
-                         [-0.467741935483871, -0.467741935483871, 0.09677419354838712],
-                         [-0.467741935483871, -0.04838709677419356, -0.467741935483871],
-                         [-0.467741935483871, -0.467741935483871, 0.17741935483870963],
-                         [-0.467741935483871, -0.467741935483871, 0.056451612903225756],
-                         [-0.467741935483871, -0.2903225806451613, 0.11290322580645162],
-                         [0.45967741935483863, 0.33870967741935476, -0.467741935483871],
-                         [0.45967741935483863, 0.3306451612903225, 0.467741935483871],
-                         [-0.3870967741935484, -0.20161290322580644, -0.467741935483871],
-                         [0.45967741935483863, -0.467741935483871, -0.07258064516129031],
-                         [0.45967741935483863, -0.467741935483871, -0.18548387096774194],
-                         [0.45967741935483863, -0.467741935483871, -0.29838709677419356],
-                         [0.45967741935483863, -0.467741935483871, 0.07258064516129026],
-                         [-0.467741935483871, -0.31451612903225806, -0.4596774193548387],
-                         [0.467741935483871, -0.467741935483871, 0.16935483870967738],
-                         [-0.467741935483871, -0.20161290322580644, 0.22580645161290325],
-                         [-0.467741935483871, -0.20161290322580644, -0.22580645161290325],
-                         [-0.467741935483871, -0.16129032258064518, -0.467741935483871],
-                         [-0.467741935483871, -0.25, 0.20967741935483875],
-                         [-0.467741935483871, -0.2338709677419355, -0.20967741935483875],
-                         [-0.467741935483871, 0.3870967741935484, 0.20161290322580638],
-                         [-0.467741935483871, 0.467741935483871, -0.04838709677419356],
-                         [0.467741935483871, 0.2338709677419355, -0.20161290322580644],
-                         [-0.467741935483871, 0.45967741935483863, 0.33870967741935476],
-                         [-0.467741935483871, 0.467741935483871, 0.048387096774193505],
-                         [0.467741935483871, 0.22580645161290325, 0.22580645161290325],
-                         [-0.467741935483871, 0.33870967741935476, -0.4596774193548387],
-                         [-0.467741935483871, 0.32258064516129026, 0.45967741935483863],
-                         [0.467741935483871, 0.282258064516129, 0.11290322580645162],
-                         [0.467741935483871, 0.282258064516129, -0.12096774193548387],
-                         [0.467741935483871, 0.2983870967741935, -0.06451612903225806],
-                         [-0.467741935483871, 0.30645161290322576, -0.04838709677419356],
-                         [-0.467741935483871, 0.30645161290322576, 0.048387096774193505],
-                         [0.467741935483871, -0.04838709677419356, -0.467741935483871],
-                         [0.467741935483871, -0.05645161290322581, 0.467741935483871],
-                         [0.467741935483871, 0.056451612903225756, 0.467741935483871],
-                         [0.467741935483871, 0.056451612903225756, 0.2983870967741935],
-                         [0.467741935483871, 0.16935483870967738, -0.467741935483871],
-                         [0.467741935483871, 0.11290322580645162, -0.282258064516129],
-                         [0.467741935483871, 0.09677419354838712, 0.29032258064516125],
-                         [0.467741935483871, 0.07258064516129026, -0.29838709677419356],
-                         [-0.4596774193548387, 0.2983870967741935, -0.467741935483871],
-                         [0.467741935483871, 0.20967741935483875, -0.24193548387096775],
-                         [-0.467741935483871, 0.467741935483871, 0.16129032258064513],
-                         [0.467741935483871, 0.17741935483870963, 0.467741935483871],
-                         [-0.467741935483871, 0.11290322580645162, 0.282258064516129],
-                         [0.467741935483871, -0.22580645161290325, -0.20967741935483875],
-                         [-0.467741935483871, 0.12096774193548387, -0.282258064516129],
-                         [0.467741935483871, 0.3870967741935484, -0.20161290322580644],
-                         [0.467741935483871, -0.1935483870967742, 0.2338709677419355],
-                         [0.467741935483871, -0.18548387096774194, 0.467741935483871],
-                         [-0.467741935483871, 0.08870967741935487, -0.29838709677419356],
-                         [-0.467741935483871, 0.08870967741935487, -0.467741935483871],
-                         [0.467741935483871, -0.09677419354838712, 0.29032258064516125],
-                         [0.467741935483871, -0.09677419354838712, -0.2903225806451613],
-                         [-0.467741935483871, 0.29032258064516125, 0.11290322580645162],
-                         [0.467741935483871, -0.05645161290322581, -0.29838709677419356],
-                         [-0.467741935483871, 0.282258064516129, -0.11290322580645162],
-                         [-0.467741935483871, 0.282258064516129, 0.467741935483871],
-                         [-0.467741935483871, 0.19354838709677413, 0.2338709677419355],
-                         [-0.467741935483871, 0.20161290322580638, -0.22580645161290325],
-                         [0.2338709677419355, 0.217741935483871, 0.467741935483871],
-                         [0.2338709677419355, -0.217741935483871, 0.467741935483871],
-                         [-0.2338709677419355, -0.467741935483871, 0.217741935483871],
-                         [-0.2338709677419355, -0.467741935483871, -0.20967741935483875],
-                         [0.22580645161290325, 0.467741935483871, -0.20161290322580644],
-                         [0.22580645161290325, 0.467741935483871, 0.22580645161290325],
-                         [0.2338709677419355, -0.467741935483871, 0.20967741935483875],
-                         [-0.24193548387096775, 0.20967741935483875, -0.467741935483871],
-                         [0.2338709677419355, -0.467741935483871, -0.20967741935483875],
-                         [-0.04838709677419356, 0.467741935483871, 0.467741935483871],
-                         [-0.04032258064516131, -0.467741935483871, -0.467741935483871],
-                         [-0.04838709677419356, -0.3064516129032258, -0.467741935483871],
-                         [-0.04838709677419356, -0.467741935483871, -0.29838709677419356],
-                         [-0.04838709677419356, 0.467741935483871, -0.4596774193548387],
-                         [-0.2338709677419355, 0.20967741935483875, 0.467741935483871],
-                         [-0.3064516129032258, -0.467741935483871, 0.45967741935483863],
-                         [-0.3064516129032258, -0.467741935483871, -0.06451612903225806],
-                         [-0.3064516129032258, -0.467741935483871, -0.024193548387096808],
-                         [-0.2338709677419355, -0.1935483870967742, -0.467741935483871],
-                         [0.20161290322580638, 0.467741935483871, -0.2338709677419355],
-                         [0.20161290322580638, -0.22580645161290325, -0.467741935483871],
-                         [0.20161290322580638, 0.22580645161290325, -0.467741935483871],
-                         [-0.3064516129032258, 0.467741935483871, 0.040322580645161255],
-                         [-0.3064516129032258, 0.467741935483871, -0.05645161290322581],
-                         [0.20967741935483875, -0.467741935483871, -0.25],
-                         [-0.29838709677419356, -0.07258064516129031, 0.467741935483871],
-                         [-0.29838709677419356, -0.06451612903225806, -0.467741935483871],
-                         [0.20161290322580638, -0.467741935483871, 0.22580645161290325],
-                         [-0.3064516129032258, -0.024193548387096808, 0.467741935483871],
-                         [-0.3064516129032258, 0.08870967741935487, -0.467741935483871],
-                         [-0.09677419354838712, -0.467741935483871, -0.2903225806451613],
-                         [-0.10483870967741937, 0.467741935483871, 0.29032258064516125],
-                         [-0.09677419354838712, -0.2903225806451613, -0.467741935483871],
-                         [-0.10483870967741937, 0.29032258064516125, -0.467741935483871],
-                         [-0.10483870967741937, 0.29032258064516125, 0.467741935483871],
-                         [-0.10483870967741937, 0.467741935483871, -0.2903225806451613],
-                         [-0.08870967741935487, -0.467741935483871, 0.467741935483871],
-                         [-0.11290322580645162, -0.467741935483871, 0.282258064516129],
-                         [-0.20967741935483875, -0.2338709677419355, 0.467741935483871],
-                         [-0.12096774193548387, -0.282258064516129, 0.467741935483871],
-                         [-0.06451612903225806, 0.2983870967741935, -0.467741935483871],
-                         [0.08870967741935487, -0.467741935483871, -0.2903225806451613],
-                         [0.08870967741935487, -0.467741935483871, 0.29032258064516125],
-                         [0.08064516129032251, 0.467741935483871, 0.467741935483871],
-                         [0.08870967741935487, -0.467741935483871, -0.467741935483871],
-                         [-0.282258064516129, -0.467741935483871, 0.11290322580645162],
-                         [-0.282258064516129, -0.467741935483871, -0.12096774193548387],
-                         [0.08870967741935487, -0.2903225806451613, -0.467741935483871],
-                         [0.08064516129032251, 0.467741935483871, -0.31451612903225806],
-                         [0.08064516129032251, 0.45967741935483863, -0.467741935483871],
-                         [0.08870967741935487, 0.467741935483871, 0.29032258064516125],
-                         [-0.2903225806451613, 0.467741935483871, -0.11290322580645162],
-                         [-0.2903225806451613, 0.467741935483871, 0.08870967741935487],
-                         [-0.282258064516129, 0.12096774193548387, -0.467741935483871],
-                         [-0.282258064516129, 0.11290322580645162, 0.467741935483871],
-                         [0.11290322580645162, 0.282258064516129, -0.467741935483871],
-                         [-0.282258064516129, -0.11290322580645162, 0.467741935483871],
-                         [-0.282258064516129, -0.11290322580645162, -0.467741935483871],
-                         [0.17741935483870963, 0.467741935483871, -0.467741935483871],
-                         [0.18548387096774188, -0.467741935483871, -0.467741935483871],
-                         [0.048387096774193505, -0.29838709677419356, -0.467741935483871],
-                         [0.16935483870967738, 0.467741935483871, 0.467741935483871],
-                         [0.17741935483870963, -0.467741935483871, 0.467741935483871],
-                         [0.29032258064516125, 0.467741935483871, 0.09677419354838712],
-                         [0.2983870967741935, 0.467741935483871, -0.04838709677419356],
-                         [-0.16129032258064518, -0.467741935483871, -0.467741935483871],
-                         [0.29032258064516125, 0.467741935483871, -0.11290322580645162],
-                         [0.29032258064516125, -0.467741935483871, 0.08870967741935487],
-                         [-0.20161290322580644, -0.467741935483871, 0.2338709677419355],
-                         [-0.20161290322580644, -0.467741935483871, -0.3870967741935484],
-                         [0.29032258064516125, -0.467741935483871, -0.08870967741935487],
-                         [-0.20161290322580644, -0.3870967741935484, -0.467741935483871],
-                         [0.29032258064516125, 0.12096774193548387, 0.467741935483871],
-                         [0.29032258064516125, 0.10483870967741937, -0.467741935483871],
-                         [0.29032258064516125, -0.09677419354838712, -0.467741935483871],
-                         [0.29032258064516125, -0.11290322580645162, 0.467741935483871],
-                         [0.2983870967741935, 0.08064516129032251, 0.467741935483871],
-                         [-0.47580645161290325, 0.12903225806451613, -0.47580645161290325],
-                         [-0.47580645161290325, 0.12096774193548387, 0.47580645161290325],
-                         [0.47580645161290325, -0.3951612903225806, 0.20967741935483875],
-                         [0.47580645161290325, -0.3951612903225806, -0.217741935483871],
-                         [0.467741935483871, -0.15322580645161293, -0.47580645161290325],
-                         [-0.47580645161290325, 0.17741935483870963, -0.47580645161290325],
-                         [-0.47580645161290325, 0.16129032258064513, 0.47580645161290325],
-                         [-0.25806451612903225, 0.47580645161290325, 0.13709677419354838],
-                         [-0.47580645161290325, 0.048387096774193505, 0.4032258064516129],
-                         [0.040322580645161255, 0.47580645161290325, -0.47580645161290325],
-                         [0.47580645161290325, -0.3306451612903226, -0.1935483870967742],
-                         [0.47580645161290325, -0.3306451612903226, -0.47580645161290325],
-                         [0.048387096774193505, -0.3629032258064516, -0.47580645161290325],
-                         [-0.47580645161290325, 0.032258064516129004, 0.29032258064516125],
-                         [0.048387096774193505, -0.47580645161290325, -0.47580645161290325],
-                         [0.040322580645161255, 0.47580645161290325, 0.47580645161290325],
-                         [0.47580645161290325, -0.33870967741935487, 0.19354838709677413],
-                         [-0.3951612903225806, -0.47580645161290325, -0.4274193548387097],
-                         [-0.3951612903225806, -0.47580645161290325, -0.217741935483871],
-                         [0.008064516129032251, -0.2903225806451613, 0.47580645161290325],
-                         [0.0, 0.47580645161290325, 0.29032258064516125],
-                         [-0.47580645161290325, 0.3951612903225806, 0.0],
-                         [0.467741935483871, 0.47580645161290325, 0.18548387096774188],
-                         [0.467741935483871, 0.47580645161290325, 0.282258064516129],
-                         [0.008064516129032251, 0.29032258064516125, 0.47580645161290325],
-                         [0.47580645161290325, -0.47580645161290325, -0.47580645161290325],
-                         [-0.47580645161290325, 0.3548387096774194, -0.20161290322580644],
-                         [-0.47580645161290325, 0.3467741935483871, 0.19354838709677413],
-                         [0.0, -0.47580645161290325, 0.2983870967741935],
-                         [-0.47580645161290325, 0.3870967741935484, -0.20967741935483875],
-                         [0.47580645161290325, -0.467741935483871, 0.10483870967741937],
-                         [0.47580645161290325, -0.4596774193548387, -0.3306451612903226],
-                         [0.47580645161290325, -0.467741935483871, -0.11290322580645162],
-                         [0.47580645161290325, -0.467741935483871, -0.15322580645161293],
-                         [0.024193548387096753, -0.47580645161290325, 0.47580645161290325],
-                         [0.47580645161290325, -0.47580645161290325, 0.32258064516129026],
-                         [0.47580645161290325, -0.47580645161290325, 0.4032258064516129],
-                         [0.47580645161290325, -0.47580645161290325, -0.04032258064516131],
-                         [0.47580645161290325, -0.47580645161290325, 0.032258064516129004],
-                         [-0.47580645161290325, 0.19354838709677413, 0.47580645161290325],
-                         [0.467741935483871, 0.11290322580645162, -0.47580645161290325],
-                         [-0.4032258064516129, -0.47580645161290325, -0.47580645161290325],
-                         [-0.47580645161290325, 0.22580645161290325, 0.4032258064516129],
-                         [-0.008064516129032251, 0.47580645161290325, -0.47580645161290325],
-                         [0.016129032258064502, 0.29032258064516125, -0.47580645161290325],
-                         [-0.47580645161290325, -0.3064516129032258, 0.008064516129032251],
-                         [-0.47580645161290325, -0.2903225806451613, -0.016129032258064502],
-                         [-0.47580645161290325, -0.3306451612903226, -0.1935483870967742],
-                         [0.10483870967741937, -0.467741935483871, 0.47580645161290325],
-                         [-0.47580645161290325, -0.3225806451612903, 0.47580645161290325],
-                         [-0.47580645161290325, -0.217741935483871, 0.19354838709677413],
-                         [-0.3870967741935484, -0.20967741935483875, 0.47580645161290325],
-                         [0.12096774193548387, -0.47580645161290325, -0.2661290322580645],
-                         [0.12096774193548387, -0.47580645161290325, -0.3064516129032258],
-                         [0.12096774193548387, -0.47580645161290325, 0.2661290322580645],
-                         [-0.3870967741935484, 0.47580645161290325, -0.20967741935483875],
-                         [-0.47580645161290325, -0.467741935483871, 0.13709677419354838],
-                         [-0.47580645161290325, -0.467741935483871, -0.11290322580645162],
-                         [0.12096774193548387, -0.27419354838709675, -0.47580645161290325],
-                         [-0.47580645161290325, -0.47580645161290325, -0.03225806451612906],
-                         [-0.47580645161290325, -0.47580645161290325, -0.467741935483871],
-                         [-0.47580645161290325, -0.47580645161290325, 0.47580645161290325],
-                         [-0.47580645161290325, -0.4032258064516129, -0.20967741935483875],
-                         [-0.47580645161290325, -0.4032258064516129, 0.22580645161290325],
-                         [0.11290322580645162, 0.47580645161290325, -0.47580645161290325],
-                         [0.056451612903225756, 0.29032258064516125, 0.47580645161290325],
-                         [-0.47580645161290325, -0.08870967741935487, 0.47580645161290325],
-                         [-0.47580645161290325, -0.08870967741935487, -0.47580645161290325],
-                         [-0.47580645161290325, 0.0, 0.29032258064516125],
-                         [-0.47580645161290325, 0.008064516129032251, -0.2903225806451613],
-                         [-0.47580645161290325, -0.1774193548387097, 0.32258064516129026],
-                         [-0.47580645161290325, -0.1774193548387097, -0.3306451612903226],
-                         [0.08064516129032251, 0.314516129032258, 0.47580645161290325],
-                         [-0.47580645161290325, -0.16129032258064518, 0.47580645161290325],
-                         [-0.47580645161290325, -0.20161290322580644, 0.3629032258064516],
-                         [-0.47580645161290325, -0.1935483870967742, -0.3709677419354839],
-                         [-0.47580645161290325, -0.12096774193548387, -0.47580645161290325],
-                         [-0.47580645161290325, -0.12903225806451613, 0.47580645161290325],
-                         [0.06451612903225801, 0.47580645161290325, -0.282258064516129],
-                         [-0.16935483870967744, 0.47580645161290325, 0.47580645161290325],
-                         [-0.16935483870967744, 0.47580645161290325, -0.47580645161290325],
-                         [-0.04838709677419356, -0.47580645161290325, 0.47580645161290325],
-                         [-0.16129032258064518, -0.47580645161290325, 0.47580645161290325],
-                         [-0.04032258064516131, -0.2903225806451613, 0.47580645161290325],
-                         [-0.20161290322580644, 0.3548387096774194, -0.47580645161290325],
-                         [-0.20161290322580644, 0.3548387096774194, 0.47580645161290325],
-                         [-0.06451612903225806, 0.282258064516129, 0.47580645161290325],
-                         [-0.06451612903225806, 0.47580645161290325, -0.2903225806451613],
-                         [-0.06451612903225806, 0.47580645161290325, 0.282258064516129],
-                         [-0.024193548387096808, 0.3629032258064516, 0.47580645161290325],
-                         [-0.016129032258064502, -0.3064516129032258, 0.47580645161290325],
-                         [-0.03225806451612906, -0.47580645161290325, 0.29032258064516125],
-                         [-0.20161290322580644, 0.47580645161290325, 0.3548387096774194],
-                         [-0.1935483870967742, -0.47580645161290325, -0.3467741935483871],
-                         [-0.20161290322580644, 0.47580645161290325, -0.3709677419354839],
-                         [-0.1935483870967742, -0.3306451612903226, -0.47580645161290325],
-                         [-0.13709677419354838, 0.47580645161290325, -0.47580645161290325],
-                         [-0.20967741935483875, 0.3870967741935484, -0.47580645161290325],
-                         [-0.20967741935483875, 0.3870967741935484, 0.47580645161290325],
-                         [-0.12903225806451613, 0.47580645161290325, 0.47580645161290325],
-                         [-0.12096774193548387, -0.47580645161290325, -0.47580645161290325],
-                         [-0.12903225806451613, -0.47580645161290325, 0.47580645161290325],
-                         [-0.08064516129032262, 0.47580645161290325, -0.47580645161290325],
-                         [-0.467741935483871, 0.47580645161290325, -0.15322580645161293],
-                         [-0.20967741935483875, 0.47580645161290325, 0.3870967741935484],
-                         [-0.09677419354838712, 0.47580645161290325, 0.47580645161290325],
-                         [-0.08870967741935487, -0.47580645161290325, -0.47580645161290325],
-                         [0.47580645161290325, -0.03225806451612906, 0.3629032258064516],
-                         [-0.47580645161290325, 0.47580645161290325, -0.47580645161290325],
-                         [0.47580645161290325, -0.008064516129032251, -0.2903225806451613],
-                         [-0.47580645161290325, 0.47580645161290325, -0.3225806451612903],
-                         [0.47580645161290325, -0.08870967741935487, -0.47580645161290325],
-                         [0.47580645161290325, -0.09677419354838712, 0.47580645161290325],
-                         [0.47580645161290325, 0.09677419354838712, 0.47580645161290325],
-                         [-0.47580645161290325, 0.47580645161290325, -0.08870967741935487],
-                         [-0.47580645161290325, 0.47580645161290325, 0.12096774193548387],
-                         [-0.47580645161290325, 0.47580645161290325, 0.08870967741935487],
-                         [-0.47580645161290325, 0.47580645161290325, 0.47580645161290325],
-                         [0.47580645161290325, 0.040322580645161255, -0.47580645161290325],
-                         [0.47580645161290325, -0.22580645161290325, 0.4032258064516129],
-                         [0.47580645161290325, -0.14516129032258063, 0.47580645161290325],
-                         [0.47580645161290325, -0.12903225806451613, -0.2661290322580645],
-                         [0.47580645161290325, -0.20161290322580644, -0.3709677419354839],
-                         [0.47580645161290325, -0.1935483870967742, -0.22580645161290325],
-                         [0.47580645161290325, -0.1935483870967742, -0.3225806451612903],
-                         [0.47580645161290325, -0.1935483870967742, 0.3306451612903225],
-                         [0.47580645161290325, 0.3629032258064516, 0.056451612903225756],
-                         [0.47580645161290325, 0.4032258064516129, 0.4193548387096774],
-                         [0.47580645161290325, 0.3306451612903225, -0.1935483870967742],
-                         [0.47580645161290325, 0.47580645161290325, 0.47580645161290325],
-                         [0.47580645161290325, 0.47580645161290325, 0.12903225806451613],
-                         [-0.41935483870967744, -0.47580645161290325, -0.41129032258064513],
-                         [0.47580645161290325, 0.47580645161290325, -0.008064516129032251],
-                         [0.47580645161290325, 0.44354838709677413, 0.29032258064516125],
-                         [0.47580645161290325, 0.47580645161290325, -0.3225806451612903],
-                         [0.47580645161290325, 0.47580645161290325, -0.07258064516129031],
-                         [0.47580645161290325, 0.47580645161290325, -0.12096774193548387],
-                         [0.47580645161290325, 0.47580645161290325, -0.47580645161290325],
-                         [0.47580645161290325, 0.18548387096774188, 0.32258064516129026],
-                         [0.47580645161290325, 0.18548387096774188, 0.22580645161290325],
-                         [0.47580645161290325, 0.217741935483871, -0.3951612903225806],
-                         [0.47580645161290325, 0.20967741935483875, 0.41129032258064513],
-                         [-0.1935483870967742, 0.47580645161290325, -0.3306451612903226],
-                         [0.47580645161290325, 0.12903225806451613, 0.27419354838709675],
-                         [0.47580645161290325, 0.13709677419354838, 0.47580645161290325],
-                         [0.47580645161290325, 0.29032258064516125, -0.024193548387096808],
-                         [0.47580645161290325, 0.24193548387096775, 0.4193548387096774],
-                         [0.47580645161290325, 0.22580645161290325, 0.18548387096774188],
-                         [-0.2903225806451613, -0.47580645161290325, 0.016129032258064502],
-                         [0.27419354838709675, 0.47580645161290325, 0.12903225806451613],
-                         [-0.33870967741935487, -0.1935483870967742, -0.47580645161290325],
-                         [0.3467741935483871, -0.1935483870967742, -0.47580645161290325],
-                         [-0.33870967741935487, -0.1935483870967742, 0.47580645161290325],
-                         [0.282258064516129, -0.47580645161290325, 0.12903225806451613],
-                         [0.282258064516129, -0.47580645161290325, -0.12903225806451613],
-                         [0.3467741935483871, 0.47580645161290325, -0.18548387096774194],
-                         [0.17741935483870963, -0.47580645161290325, -0.2338709677419355],
-                         [0.4032258064516129, 0.217741935483871, -0.47580645161290325],
-                         [0.18548387096774188, 0.22580645161290325, 0.47580645161290325],
-                         [0.18548387096774188, 0.32258064516129026, 0.47580645161290325],
-                         [0.18548387096774188, -0.3225806451612903, 0.47580645161290325],
-                         [0.18548387096774188, -0.22580645161290325, 0.47580645161290325],
-                         [0.314516129032258, 0.47580645161290325, 0.47580645161290325],
-                         [0.18548387096774188, 0.47580645161290325, 0.22580645161290325],
-                         [0.282258064516129, -0.07258064516129031, 0.47580645161290325],
-                         [0.282258064516129, 0.06451612903225801, -0.47580645161290325],
-                         [0.4032258064516129, -0.47580645161290325, -0.22580645161290325],
-                         [0.4032258064516129, -0.47580645161290325, 0.47580645161290325],
-                         [0.4032258064516129, -0.47580645161290325, 0.22580645161290325],
-                         [-0.3790322580645161, 0.47580645161290325, 0.20161290322580638],
-                         [0.2338709677419355, -0.1774193548387097, 0.47580645161290325],
-                         [-0.3225806451612903, 0.47580645161290325, 0.47580645161290325],
-                         [-0.3225806451612903, 0.47580645161290325, -0.47580645161290325],
-                         [0.2338709677419355, 0.17741935483870963, 0.47580645161290325],
-                         [0.3629032258064516, -0.024193548387096808, -0.47580645161290325],
-                         [-0.3467741935483871, 0.47580645161290325, -0.1935483870967742],
-                         [-0.3467741935483871, 0.47580645161290325, 0.18548387096774188],
-                         [-0.2903225806451613, 0.008064516129032251, 0.47580645161290325],
-                         [-0.2903225806451613, 0.024193548387096753, -0.47580645161290325],
-                         [-0.2903225806451613, 0.056451612903225756, -0.47580645161290325],
-                         [0.33870967741935476, 0.19354838709677413, -0.47580645161290325],
-                         [0.20967741935483875, 0.3951612903225806, 0.47580645161290325],
-                         [0.217741935483871, -0.47580645161290325, -0.4032258064516129],
-                         [0.217741935483871, -0.3951612903225806, 0.47580645161290325],
-                         [0.3306451612903225, 0.19354838709677413, 0.47580645161290325],
-                         [-0.3225806451612903, -0.47580645161290325, -0.47580645161290325],
-                         [0.41129032258064513, -0.47580645161290325, -0.47580645161290325],
-                         [0.3306451612903225, -0.1935483870967742, 0.47580645161290325],
-                         [0.2983870967741935, -0.47580645161290325, 0.016129032258064502],
-                         [0.2983870967741935, -0.47580645161290325, -0.016129032258064502],
-                         [0.42741935483870963, -0.47580645161290325, 0.3951612903225806],
-                         [0.22580645161290325, -0.47580645161290325, 0.4032258064516129],
-                         [0.22580645161290325, -0.4032258064516129, -0.47580645161290325],
-                         [0.29032258064516125, -0.4435483870967742, -0.47580645161290325],
-                         [0.22580645161290325, 0.4032258064516129, -0.47580645161290325],
-                         [0.217741935483871, 0.47580645161290325, -0.3951612903225806],
-                         [0.217741935483871, 0.47580645161290325, 0.3951612903225806],
-                         [0.32258064516129026, -0.47580645161290325, 0.47580645161290325],
-                         [0.22580645161290325, 0.47580645161290325, 0.18548387096774188],
-                         [0.32258064516129026, 0.47580645161290325, -0.47580645161290325],
-                         [0.3790322580645161, 0.47580645161290325, -0.20967741935483875],
-                         [0.12903225806451613, 0.47580645161290325, 0.2661290322580645],
-                         [0.12903225806451613, 0.47580645161290325, 0.47580645161290325],
-                         [-0.282258064516129, -0.4435483870967742, 0.47580645161290325],
-                         [0.3951612903225806, -0.47580645161290325, 0.42741935483870963],
-                         [0.12903225806451613, -0.47580645161290325, -0.47580645161290325],
-                         [0.3870967741935484, -0.20967741935483875, -0.47580645161290325],
-                         [0.13709677419354838, -0.467741935483871, 0.47580645161290325],
-                         [0.3951612903225806, -0.217741935483871, 0.47580645161290325],
-                         [0.4838709677419355, -0.47580645161290325, 0.13709677419354838],
-                         [-0.10483870967741937, -0.4838709677419355, -0.25806451612903225],
-                         [0.25806451612903225, 0.09677419354838712, -0.4838709677419355],
-                         [-0.22580645161290325, 0.16935483870967738, 0.4838709677419355],
-                         [-0.22580645161290325, 0.17741935483870963, -0.4838709677419355],
-                         [0.4838709677419355, 0.07258064516129026, 0.2661290322580645],
-                         [0.4838709677419355, -0.47580645161290325, 0.0],
-                         [0.4838709677419355, -0.47580645161290325, 0.4838709677419355],
-                         [-0.016129032258064502, 0.282258064516129, -0.4838709677419355],
-                         [0.4838709677419355, 0.08064516129032251, -0.2661290322580645],
-                         [-0.47580645161290325, 0.44354838709677413, -0.4838709677419355],
-                         [-0.09677419354838712, 0.4838709677419355, -0.25806451612903225],
-                         [-0.33870967741935487, -0.04032258064516131, 0.4838709677419355],
-                         [0.4838709677419355, -0.4838709677419355, -0.3467741935483871],
-                         [0.4838709677419355, -0.4838709677419355, -0.27419354838709675],
-                         [0.4838709677419355, -0.4838709677419355, -0.25],
-                         [-0.3225806451612903, -0.15322580645161293, -0.4838709677419355],
-                         [0.4838709677419355, -0.4838709677419355, -0.4435483870967742],
-                         [0.4838709677419355, -0.4838709677419355, -0.41935483870967744],
-                         [0.282258064516129, 0.4838709677419355, -0.08064516129032262],
-                         [-0.07258064516129031, -0.2661290322580645, 0.4838709677419355],
-                         [0.4838709677419355, -0.4838709677419355, -0.20967741935483875],
-                         [-0.07258064516129031, -0.2661290322580645, -0.4838709677419355],
-                         [0.282258064516129, 0.4838709677419355, 0.032258064516129004],
-                         [0.282258064516129, 0.4838709677419355, 0.008064516129032251],
-                         [0.282258064516129, 0.4838709677419355, -0.016129032258064502],
-                         [0.4838709677419355, -0.4838709677419355, 0.4354838709677419],
-                         [0.4838709677419355, -0.4838709677419355, 0.467741935483871],
-                         [0.4838709677419355, 0.09677419354838712, 0.25806451612903225],
-                         [0.4838709677419355, -0.4838709677419355, 0.20161290322580638],
-                         [0.4838709677419355, -0.4838709677419355, 0.24193548387096775],
-                         [-0.08064516129032262, 0.4838709677419355, -0.2661290322580645],
-                         [0.4838709677419355, 0.008064516129032251, 0.282258064516129],
-                         [-0.45161290322580644, 0.19354838709677413, -0.4838709677419355],
-                         [0.4838709677419355, 0.008064516129032251, 0.4838709677419355],
-                         [-0.3467741935483871, -0.4838709677419355, -0.20967741935483875],
-                         [0.4838709677419355, 0.024193548387096753, -0.282258064516129],
-                         [-0.016129032258064502, 0.4838709677419355, -0.282258064516129],
-                         [0.4838709677419355, 0.0, -0.47580645161290325],
-                         [0.4838709677419355, -0.008064516129032251, 0.47580645161290325],
-                         [0.25, -0.4838709677419355, 0.4838709677419355],
-                         [0.41129032258064513, -0.4838709677419355, -0.41129032258064513],
-                         [0.4838709677419355, -0.008064516129032251, 0.29032258064516125],
-                         [0.25, -0.4838709677419355, 0.4193548387096774],
-                         [-0.07258064516129031, -0.4838709677419355, -0.2661290322580645],
-                         [-0.07258064516129031, -0.4838709677419355, 0.2661290322580645],
-                         [-0.41935483870967744, -0.3870967741935484, 0.4838709677419355],
-                         [-0.47580645161290325, 0.4193548387096774, -0.4838709677419355],
-                         [0.4838709677419355, 0.056451612903225756, 0.4354838709677419],
-                         [-0.09677419354838712, 0.4838709677419355, 0.25806451612903225],
-                         [0.25806451612903225, -0.13709677419354838, -0.4838709677419355],
-                         [0.25806451612903225, -0.12903225806451613, 0.4838709677419355],
-                         [0.4838709677419355, 0.032258064516129004, 0.27419354838709675],
-                         [-0.217741935483871, -0.16935483870967744, 0.4838709677419355],
-                         [0.4838709677419355, 0.032258064516129004, 0.3709677419354839],
-                         [0.4838709677419355, 0.024193548387096753, 0.467741935483871],
-                         [0.4838709677419355, 0.048387096774193505, -0.27419354838709675],
-                         [0.25806451612903225, -0.10483870967741937, 0.4838709677419355],
-                         [0.25806451612903225, -0.10483870967741937, -0.4838709677419355],
-                         [-0.09677419354838712, -0.25806451612903225, -0.4838709677419355],
-                         [-0.09677419354838712, -0.25806451612903225, 0.4838709677419355],
-                         [0.25, -0.4838709677419355, 0.13709677419354838],
-                         [0.4838709677419355, 0.19354838709677413, -0.3225806451612903],
-                         [0.4838709677419355, 0.18548387096774188, 0.4354838709677419],
-                         [0.22580645161290325, 0.25806451612903225, 0.4838709677419355],
-                         [0.4838709677419355, 0.18548387096774188, -0.20967741935483875],
-                         [0.22580645161290325, 0.25, -0.4838709677419355],
-                         [0.4838709677419355, 0.20161290322580638, -0.33870967741935487],
-                         [0.4838709677419355, 0.20161290322580638, -0.20161290322580644],
-                         [0.4838709677419355, 0.20161290322580638, 0.20161290322580638],
-                         [0.4838709677419355, 0.20161290322580638, -0.4838709677419355],
-                         [0.4838709677419355, 0.16129032258064513, -0.24193548387096775],
-                         [0.4838709677419355, 0.15322580645161288, 0.2338709677419355],
-                         [0.47580645161290325, 0.4838709677419355, 0.032258064516129004],
-                         [0.47580645161290325, 0.4838709677419355, 0.056451612903225756],
-                         [0.3870967741935484, -0.4838709677419355, -0.41935483870967744],
-                         [0.22580645161290325, 0.4838709677419355, -0.25806451612903225],
-                         [0.47580645161290325, 0.4838709677419355, -0.4032258064516129],
-                         [0.4838709677419355, 0.17741935483870963, -0.2338709677419355],
-                         [0.47580645161290325, 0.4838709677419355, -0.24193548387096775],
-                         [0.4838709677419355, 0.16935483870967738, -0.217741935483871],
-                         [0.22580645161290325, 0.4838709677419355, -0.16935483870967744],
-                         [0.4838709677419355, 0.20161290322580638, 0.3467741935483871],
-                         [0.4838709677419355, 0.2338709677419355, 0.15322580645161288],
-                         [0.4838709677419355, 0.2338709677419355, -0.15322580645161293],
-                         [0.24193548387096775, 0.4838709677419355, 0.4838709677419355],
-                         [0.4838709677419355, 0.22580645161290325, 0.4838709677419355],
-                         [0.25806451612903225, -0.4838709677419355, -0.11290322580645162],
-                         [0.4838709677419355, 0.22580645161290325, 0.3870967741935484],
-                         [0.4838709677419355, 0.24193548387096775, 0.13709677419354838],
-                         [0.4838709677419355, 0.25, -0.2338709677419355],
-                         [0.25806451612903225, -0.4838709677419355, 0.11290322580645162],
-                         [0.4838709677419355, 0.25, -0.12096774193548387],
-                         [0.4838709677419355, 0.25, -0.14516129032258063],
-                         [0.4838709677419355, 0.25, -0.4838709677419355],
-                         [0.24193548387096775, 0.4838709677419355, 0.41129032258064513],
-                         [-0.47580645161290325, 0.4838709677419355, -0.4032258064516129],
-                         [0.4838709677419355, 0.20967741935483875, 0.47580645161290325],
-                         [0.22580645161290325, 0.4838709677419355, 0.25806451612903225],
-                         [0.4838709677419355, 0.217741935483871, -0.16935483870967744],
-                         [0.4838709677419355, 0.20967741935483875, -0.3548387096774194],
-                         [0.4838709677419355, 0.20161290322580638, 0.3790322580645161],
-                         [0.4838709677419355, 0.20967741935483875, 0.3629032258064516],
-                         [0.4838709677419355, 0.22580645161290325, 0.25806451612903225],
-                         [-0.09677419354838712, 0.25806451612903225, 0.4838709677419355],
-                         [0.22580645161290325, 0.16129032258064513, -0.4838709677419355],
-                         [-0.09677419354838712, 0.25806451612903225, -0.4838709677419355],
-                         [-0.07258064516129031, 0.314516129032258, 0.4838709677419355],
-                         [0.4032258064516129, 0.4838709677419355, -0.4838709677419355],
-                         [-0.4274193548387097, 0.4838709677419355, -0.3870967741935484],
-                         [-0.4274193548387097, 0.4838709677419355, -0.4838709677419355],
-                         [-0.45161290322580644, -0.4838709677419355, -0.31451612903225806],
-                         [-0.4274193548387097, 0.4838709677419355, 0.25806451612903225],
-                         [-0.07258064516129031, 0.2661290322580645, -0.4838709677419355],
-                         [-0.4274193548387097, 0.4838709677419355, 0.4838709677419355],
-                         [-0.45161290322580644, -0.4838709677419355, -0.4838709677419355],
-                         [0.25806451612903225, 0.10483870967741937, 0.4838709677419355],
-                         [0.3709677419354839, 0.217741935483871, 0.4838709677419355],
-                         [-0.016129032258064502, -0.282258064516129, -0.4838709677419355],
-                         [0.3709677419354839, 0.217741935483871, -0.4838709677419355],
-                         [0.25806451612903225, 0.12903225806451613, -0.4838709677419355],
-                         [-0.41935483870967744, -0.4838709677419355, 0.4838709677419355],
-                         [-0.41935483870967744, -0.4838709677419355, 0.3870967741935484],
-                         [0.25, -0.4838709677419355, -0.13709677419354838],
-                         [0.4032258064516129, 0.4838709677419355, 0.22580645161290325],
-                         [-0.41935483870967744, -0.4838709677419355, -0.25806451612903225],
-                         [0.25806451612903225, 0.12903225806451613, 0.4838709677419355],
-                         [0.4838709677419355, 0.13709677419354838, -0.24193548387096775],
-                         [0.4838709677419355, 0.13709677419354838, -0.4596774193548387],
-                         [0.4838709677419355, 0.13709677419354838, -0.4838709677419355],
-                         [0.4838709677419355, 0.13709677419354838, 0.24193548387096775],
-                         [0.4838709677419355, 0.12903225806451613, 0.30645161290322576],
-                         [0.47580645161290325, 0.4838709677419355, 0.3548387096774194],
-                         [-0.07258064516129031, 0.4838709677419355, 0.314516129032258],
-                         [-0.016129032258064502, -0.3709677419354839, -0.4838709677419355],
-                         [0.4838709677419355, 0.12096774193548387, -0.25],
-                         [0.47580645161290325, 0.4838709677419355, 0.42741935483870963],
-                         [0.4838709677419355, -0.2338709677419355, -0.24193548387096775],
-                         [0.29032258064516125, -0.4838709677419355, -0.4838709677419355],
-                         [0.4838709677419355, -0.2338709677419355, -0.3951612903225806],
-                         [0.25, 0.4838709677419355, 0.14516129032258063],
-                         [0.4838709677419355, -0.2338709677419355, 0.16129032258064513],
-                         [0.4838709677419355, -0.2338709677419355, 0.25],
-                         [0.4838709677419355, -0.2338709677419355, -0.15322580645161293],
-                         [0.4838709677419355, -0.2338709677419355, -0.1774193548387097],
-                         [0.4838709677419355, -0.24193548387096775, 0.13709677419354838],
-                         [0.4838709677419355, -0.24193548387096775, -0.13709677419354838],
-                         [-0.08064516129032262, -0.4838709677419355, 0.4354838709677419],
-                         [0.4838709677419355, -0.22580645161290325, -0.25806451612903225],
-                         [0.4838709677419355, -0.2661290322580645, 0.42741935483870963],
-                         [0.4838709677419355, -0.2661290322580645, 0.467741935483871],
-                         [0.4838709677419355, -0.25806451612903225, -0.22580645161290325],
-                         [0.4838709677419355, -0.25806451612903225, -0.09677419354838712],
-                         [0.25, 0.4838709677419355, -0.12096774193548387],
-                         [0.4838709677419355, -0.27419354838709675, 0.44354838709677413],
-                         [0.4838709677419355, -0.2661290322580645, -0.07258064516129031],
-                         [0.4838709677419355, -0.2661290322580645, 0.08064516129032251],
-                         [0.4838709677419355, -0.25, 0.15322580645161288],
-                         [0.4838709677419355, -0.25, 0.12096774193548387],
-                         [0.4838709677419355, -0.25, 0.4193548387096774],
-                         [0.4838709677419355, -0.25, 0.4838709677419355],
-                         [0.4838709677419355, -0.25, -0.12096774193548387],
-                         [0.4838709677419355, -0.25, -0.4838709677419355],
-                         [-0.217741935483871, -0.4838709677419355, -0.1774193548387097],
-                         [0.4838709677419355, -0.20161290322580644, 0.3790322580645161],
-                         [0.4838709677419355, -0.20161290322580644, 0.4354838709677419],
-                         [0.4838709677419355, -0.20161290322580644, 0.19354838709677413],
-                         [-0.217741935483871, -0.4838709677419355, 0.2661290322580645],
-                         [-0.217741935483871, -0.4838709677419355, 0.16935483870967738],
-                         [0.4838709677419355, -0.1774193548387097, -0.47580645161290325],
-                         [0.4838709677419355, -0.3870967741935484, -0.41935483870967744],
-                         [0.4838709677419355, -0.217741935483871, 0.16935483870967738],
-                         [0.4838709677419355, -0.217741935483871, 0.25806451612903225],
-                         [0.4838709677419355, -0.217741935483871, 0.3709677419354839],
-                         [0.25, 0.14516129032258063, -0.4838709677419355],
-                         [0.4838709677419355, -0.217741935483871, 0.4838709677419355],
-                         [0.25, 0.14516129032258063, 0.4838709677419355],
-                         [0.4838709677419355, -0.217741935483871, -0.16935483870967744],
-                         [0.4838709677419355, -0.20967741935483875, 0.3548387096774194],
-                         [0.4838709677419355, -0.20967741935483875, 0.2983870967741935],
-                         [0.4838709677419355, -0.3870967741935484, 0.42741935483870963],
-                         [0.29032258064516125, -0.4838709677419355, -0.43548387096774194],
-                         [0.3709677419354839, 0.4838709677419355, -0.024193548387096808],
-                         [0.4838709677419355, -0.3629032258064516, -0.20967741935483875],
-                         [0.4838709677419355, -0.3306451612903226, 0.4838709677419355],
-                         [0.4838709677419355, -0.3225806451612903, -0.4435483870967742],
-                         [0.4838709677419355, -0.3225806451612903, 0.44354838709677413],
-                         [0.4838709677419355, -0.3225806451612903, -0.16129032258064518],
-                         [0.4838709677419355, -0.3467741935483871, 0.06451612903225801],
-                         [0.4838709677419355, -0.3467741935483871, -0.06451612903225806],
-                         [0.4838709677419355, -0.3629032258064516, 0.20967741935483875],
-                         [0.4838709677419355, -0.2903225806451613, 0.4354838709677419],
-                         [0.25, 0.4838709677419355, -0.2338709677419355],
-                         [0.3790322580645161, -0.4838709677419355, -0.20967741935483875],
-                         [-0.016129032258064502, 0.467741935483871, 0.4838709677419355],
-                         [0.3790322580645161, 0.20161290322580638, 0.4838709677419355],
-                         [0.3790322580645161, 0.20161290322580638, -0.4838709677419355],
-                         [0.4838709677419355, -0.27419354838709675, 0.048387096774193505],
-                         [0.4838709677419355, -0.27419354838709675, -0.03225806451612906],
-                         [0.4838709677419355, -0.282258064516129, 0.0], [0.25, 0.4838709677419355, -0.4838709677419355],
-                         [0.4838709677419355, -0.31451612903225806, 0.12903225806451613],
-                         [0.25, 0.41129032258064513, 0.4838709677419355],
-                         [0.25, 0.4193548387096774, -0.4838709677419355],
-                         [0.4838709677419355, -0.07258064516129031, -0.2661290322580645],
-                         [-0.41935483870967744, -0.25, -0.4838709677419355],
-                         [0.4838709677419355, -0.05645161290322581, 0.27419354838709675],
-                         [0.4838709677419355, -0.07258064516129031, 0.2661290322580645],
-                         [0.4838709677419355, -0.4435483870967742, 0.32258064516129026],
-                         [0.4838709677419355, -0.09677419354838712, 0.25806451612903225],
-                         [0.3790322580645161, -0.4838709677419355, 0.20967741935483875],
-                         [0.4838709677419355, -0.09677419354838712, -0.25806451612903225],
-                         [0.4838709677419355, -0.03225806451612906, -0.27419354838709675],
-                         [0.4838709677419355, -0.03225806451612906, 0.27419354838709675],
-                         [0.4838709677419355, -0.024193548387096808, 0.467741935483871],
-                         [0.4838709677419355, -0.016129032258064502, -0.4838709677419355],
-                         [0.4838709677419355, -0.4435483870967742, -0.282258064516129],
-                         [0.4838709677419355, -0.05645161290322581, 0.4354838709677419],
-                         [0.4838709677419355, -0.4435483870967742, -0.4838709677419355],
-                         [0.4838709677419355, -0.16129032258064518, -0.22580645161290325],
-                         [0.4838709677419355, -0.16129032258064518, -0.31451612903225806],
-                         [0.4838709677419355, -0.16129032258064518, 0.2338709677419355],
-                         [0.4838709677419355, -0.41129032258064513, 0.25],
-                         [0.4838709677419355, -0.16129032258064518, -0.45161290322580644],
-                         [0.4838709677419355, -0.14516129032258063, -0.3064516129032258],
-                         [0.4838709677419355, -0.14516129032258063, -0.24193548387096775],
-                         [0.25, -0.12096774193548387, -0.4838709677419355],
-                         [0.25, -0.15322580645161293, -0.4838709677419355],
-                         [0.4838709677419355, -0.4032258064516129, 0.4838709677419355],
-                         [0.4838709677419355, -0.3951612903225806, 0.41129032258064513],
-                         [-0.22580645161290325, 0.4838709677419355, -0.3951612903225806],
-                         [-0.22580645161290325, 0.4838709677419355, -0.16129032258064518],
-                         [0.4838709677419355, -0.41129032258064513, 0.3951612903225806],
-                         [-0.22580645161290325, 0.4838709677419355, 0.16129032258064513],
-                         [0.4838709677419355, -0.4032258064516129, -0.4838709677419355],
-                         [0.4838709677419355, -0.12096774193548387, 0.2661290322580645],
-                         [0.4838709677419355, -0.43548387096774194, -0.07258064516129031],
-                         [0.4838709677419355, -0.43548387096774194, 0.06451612903225801],
-                         [0.4838709677419355, -0.43548387096774194, -0.18548387096774194],
-                         [0.4838709677419355, -0.43548387096774194, -0.29838709677419356],
-                         [0.4838709677419355, -0.43548387096774194, -0.3467741935483871],
-                         [0.4838709677419355, -0.43548387096774194, 0.3951612903225806],
-                         [0.4838709677419355, -0.12096774193548387, -0.467741935483871],
-                         [0.4838709677419355, -0.12903225806451613, 0.30645161290322576],
-                         [-0.08064516129032262, -0.43548387096774194, 0.4838709677419355],
-                         [0.25, 0.4838709677419355, 0.42741935483870963],
-                         [0.4838709677419355, -0.41935483870967744, -0.1935483870967742],
-                         [0.4838709677419355, -0.14516129032258063, 0.24193548387096775],
-                         [0.4838709677419355, -0.12903225806451613, -0.29838709677419356],
-                         [0.4838709677419355, -0.12903225806451613, 0.25],
-                         [0.4838709677419355, -0.4274193548387097, -0.27419354838709675],
-                         [0.4838709677419355, -0.41935483870967744, -0.3870967741935484],
-                         [0.4838709677419355, -0.12903225806451613, -0.4838709677419355],
-                         [-0.14516129032258063, -0.3064516129032258, 0.4838709677419355],
-                         [-0.14516129032258063, -0.25, -0.4838709677419355],
-                         [-0.14516129032258063, -0.24193548387096775, 0.4838709677419355],
-                         [-0.12096774193548387, 0.4838709677419355, 0.25],
-                         [-0.20161290322580644, -0.31451612903225806, 0.4838709677419355],
-                         [-0.43548387096774194, -0.16935483870967744, -0.4838709677419355],
-                         [-0.12096774193548387, 0.4838709677419355, -0.25806451612903225],
-                         [0.2338709677419355, -0.25, -0.4838709677419355],
-                         [0.2661290322580645, 0.217741935483871, 0.4838709677419355],
-                         [-0.14516129032258063, 0.25, 0.4838709677419355],
-                         [-0.14516129032258063, 0.25, -0.4838709677419355],
-                         [-0.20967741935483875, -0.29838709677419356, -0.4838709677419355],
-                         [-0.15322580645161293, 0.4838709677419355, 0.2338709677419355],
-                         [0.2661290322580645, 0.4838709677419355, -0.20967741935483875],
-                         [0.2661290322580645, 0.4838709677419355, 0.07258064516129026],
-                         [0.2661290322580645, 0.4838709677419355, -0.08870967741935487],
-                         [-0.15322580645161293, 0.4838709677419355, -0.2338709677419355],
-                         [0.3548387096774194, 0.20967741935483875, 0.4838709677419355],
-                         [-0.14516129032258063, -0.4838709677419355, -0.24193548387096775],
-                         [-0.14516129032258063, -0.4838709677419355, 0.25],
-                         [-0.20967741935483875, 0.4838709677419355, -0.29838709677419356],
-                         [-0.14516129032258063, 0.4838709677419355, 0.25],
-                         [-0.04838709677419356, -0.27419354838709675, -0.4838709677419355],
-                         [-0.12096774193548387, 0.25806451612903225, 0.4838709677419355],
-                         [-0.3225806451612903, 0.44354838709677413, -0.4838709677419355],
-                         [-0.12096774193548387, 0.25806451612903225, -0.4838709677419355],
-                         [-0.14516129032258063, 0.4838709677419355, -0.25],
-                         [0.2338709677419355, -0.25, 0.4838709677419355],
-                         [0.2661290322580645, 0.08870967741935487, 0.4838709677419355],
-                         [-0.20161290322580644, -0.4838709677419355, -0.1935483870967742],
-                         [-0.20161290322580644, -0.4838709677419355, -0.31451612903225806],
-                         [-0.43548387096774194, -0.29838709677419356, -0.4838709677419355],
-                         [-0.20967741935483875, 0.4838709677419355, 0.282258064516129],
-                         [-0.20161290322580644, -0.4838709677419355, 0.4838709677419355],
-                         [-0.20161290322580644, -0.4838709677419355, 0.32258064516129026],
-                         [-0.20161290322580644, -0.4838709677419355, 0.19354838709677413],
-                         [-0.33870967741935487, -0.4838709677419355, -0.05645161290322581],
-                         [-0.16129032258064518, 0.22580645161290325, -0.4838709677419355],
-                         [-0.16129032258064518, 0.24193548387096775, 0.4838709677419355],
-                         [-0.16129032258064518, -0.4838709677419355, 0.24193548387096775],
-                         [0.27419354838709675, -0.05645161290322581, -0.4838709677419355],
-                         [0.27419354838709675, -0.03225806451612906, 0.4838709677419355],
-                         [-0.3225806451612903, 0.20161290322580638, 0.4838709677419355],
-                         [0.27419354838709675, -0.03225806451612906, -0.4838709677419355],
-                         [-0.3225806451612903, 0.20161290322580638, -0.4838709677419355],
-                         [-0.43548387096774194, 0.282258064516129, 0.4838709677419355],
-                         [-0.16935483870967744, 0.4838709677419355, 0.217741935483871],
-                         [-0.16129032258064518, -0.4838709677419355, -0.22580645161290325],
-                         [-0.16129032258064518, -0.2338709677419355, 0.4838709677419355],
-                         [-0.16129032258064518, -0.22580645161290325, -0.4838709677419355],
-                         [-0.20161290322580644, 0.19354838709677413, 0.4838709677419355],
-                         [-0.20161290322580644, 0.20161290322580638, -0.4838709677419355],
-                         [0.27419354838709675, -0.12903225806451613, -0.4838709677419355],
-                         [0.27419354838709675, -0.217741935483871, 0.4838709677419355],
-                         [-0.20161290322580644, -0.1935483870967742, -0.4838709677419355],
-                         [-0.20161290322580644, -0.1935483870967742, 0.4838709677419355],
-                         [0.3548387096774194, -0.03225806451612906, 0.4838709677419355],
-                         [-0.43548387096774194, -0.04032258064516131, -0.4838709677419355],
-                         [0.3548387096774194, -0.20967741935483875, 0.4838709677419355],
-                         [-0.467741935483871, 0.4838709677419355, -0.12096774193548387],
-                         [0.2661290322580645, 0.4838709677419355, 0.217741935483871],
-                         [0.3870967741935484, 0.4838709677419355, -0.4274193548387097],
-                         [-0.4596774193548387, -0.4838709677419355, -0.12903225806451613],
-                         [-0.4596774193548387, -0.4838709677419355, -0.41935483870967744],
-                         [0.27419354838709675, -0.4838709677419355, 0.056451612903225756],
-                         [0.27419354838709675, -0.4838709677419355, -0.04838709677419356],
-                         [0.27419354838709675, -0.4838709677419355, 0.032258064516129004],
-                         [-0.12903225806451613, -0.25, 0.4838709677419355],
-                         [0.3951612903225806, 0.4354838709677419, -0.4838709677419355],
-                         [-0.12903225806451613, -0.25806451612903225, -0.4838709677419355],
-                         [0.3951612903225806, 0.41129032258064513, -0.4838709677419355],
-                         [-0.03225806451612906, -0.3467741935483871, -0.4838709677419355],
-                         [0.3951612903225806, -0.41129032258064513, 0.4838709677419355],
-                         [0.3951612903225806, -0.41129032258064513, -0.4838709677419355],
-                         [-0.31451612903225806, -0.4838709677419355, 0.20161290322580638],
-                         [-0.03225806451612906, 0.44354838709677413, -0.4838709677419355],
-                         [-0.2338709677419355, -0.3951612903225806, 0.4838709677419355],
-                         [-0.03225806451612906, 0.3790322580645161, -0.4838709677419355],
-                         [-0.2338709677419355, -0.3951612903225806, -0.4838709677419355],
-                         [-0.03225806451612906, 0.27419354838709675, -0.4838709677419355],
-                         [-0.03225806451612906, 0.27419354838709675, 0.4838709677419355],
-                         [0.3951612903225806, -0.43548387096774194, 0.4838709677419355],
-                         [-0.4435483870967742, 0.30645161290322576, 0.4838709677419355],
-                         [0.3951612903225806, 0.056451612903225756, -0.4838709677419355],
-                         [-0.2338709677419355, -0.15322580645161293, -0.4838709677419355],
-                         [-0.2338709677419355, -0.16129032258064518, 0.4838709677419355],
-                         [-0.04032258064516131, -0.3225806451612903, 0.4838709677419355],
-                         [-0.04032258064516131, 0.42741935483870963, -0.4838709677419355],
-                         [-0.4596774193548387, 0.09677419354838712, 0.4838709677419355],
-                         [0.2661290322580645, -0.07258064516129031, -0.4838709677419355],
-                         [-0.12096774193548387, -0.4838709677419355, 0.25],
-                         [-0.04032258064516131, 0.4838709677419355, -0.27419354838709675],
-                         [-0.04032258064516131, -0.43548387096774194, -0.4838709677419355],
-                         [0.3951612903225806, 0.2338709677419355, 0.4838709677419355],
-                         [-0.12096774193548387, -0.4838709677419355, -0.2661290322580645],
-                         [-0.43548387096774194, -0.4838709677419355, 0.3467741935483871],
-                         [-0.43548387096774194, -0.47580645161290325, -0.4838709677419355],
-                         [-0.43548387096774194, -0.4838709677419355, -0.3548387096774194],
-                         [-0.43548387096774194, -0.4838709677419355, -0.06451612903225806],
-                         [-0.43548387096774194, -0.4838709677419355, 0.06451612903225801],
-                         [-0.4435483870967742, 0.4838709677419355, 0.32258064516129026],
-                         [-0.3467741935483871, 0.20967741935483875, 0.4838709677419355],
-                         [-0.4435483870967742, 0.4838709677419355, -0.3225806451612903],
-                         [-0.2338709677419355, 0.16129032258064513, -0.4838709677419355],
-                         [-0.2338709677419355, 0.15322580645161288, 0.4838709677419355],
-                         [-0.3225806451612903, 0.4838709677419355, -0.4435483870967742],
-                         [-0.13709677419354838, -0.4838709677419355, 0.30645161290322576],
-                         [-0.3225806451612903, 0.44354838709677413, 0.4838709677419355],
-                         [0.2338709677419355, -0.16129032258064518, -0.4838709677419355],
-                         [0.4032258064516129, -0.43548387096774194, -0.4838709677419355],
-                         [-0.20967741935483875, 0.282258064516129, 0.4838709677419355],
-                         [-0.3225806451612903, 0.4838709677419355, 0.44354838709677413],
-                         [-0.24193548387096775, 0.4838709677419355, -0.15322580645161293],
-                         [-0.2338709677419355, -0.4838709677419355, -0.3951612903225806],
-                         [-0.2338709677419355, -0.4838709677419355, -0.15322580645161293],
-                         [0.4032258064516129, -0.4838709677419355, -0.43548387096774194],
-                         [-0.31451612903225806, -0.4838709677419355, -0.20161290322580644],
-                         [0.3951612903225806, 0.4838709677419355, 0.4838709677419355],
-                         [-0.2338709677419355, -0.4838709677419355, 0.3951612903225806],
-                         [-0.2338709677419355, -0.4838709677419355, 0.25],
-                         [-0.2338709677419355, -0.4838709677419355, 0.16129032258064513],
-                         [-0.12903225806451613, -0.4838709677419355, -0.25],
-                         [-0.04838709677419356, 0.4354838709677419, 0.4838709677419355],
-                         [-0.20967741935483875, 0.18548387096774188, -0.4838709677419355],
-                         [0.2338709677419355, 0.4838709677419355, -0.24193548387096775],
-                         [0.2338709677419355, 0.4838709677419355, -0.15322580645161293],
-                         [-0.03225806451612906, 0.4838709677419355, 0.3629032258064516],
-                         [-0.03225806451612906, 0.4838709677419355, 0.27419354838709675],
-                         [0.2338709677419355, 0.4838709677419355, 0.15322580645161288],
-                         [0.4838709677419355, 0.4354838709677419, 0.3467741935483871],
-                         [0.4838709677419355, 0.4354838709677419, 0.08064516129032251],
-                         [0.4838709677419355, 0.4354838709677419, 0.47580645161290325],
-                         [0.4838709677419355, 0.44354838709677413, -0.4838709677419355],
-                         [0.4838709677419355, 0.44354838709677413, -0.3225806451612903],
-                         [-0.4435483870967742, -0.4838709677419355, 0.4838709677419355],
-                         [0.4838709677419355, 0.42741935483870963, -0.03225806451612906],
-                         [0.4838709677419355, 0.4354838709677419, -0.3951612903225806],
-                         [0.4838709677419355, 0.4354838709677419, -0.16935483870967744],
-                         [0.4838709677419355, 0.4354838709677419, -0.25],
-                         [0.4838709677419355, 0.41129032258064513, -0.3951612903225806],
-                         [0.4838709677419355, 0.41129032258064513, -0.4838709677419355],
-                         [-0.24193548387096775, 0.13709677419354838, -0.4838709677419355],
-                         [0.4838709677419355, 0.4032258064516129, 0.2338709677419355],
-                         [0.4838709677419355, 0.41129032258064513, -0.25],
-                         [0.4838709677419355, 0.41129032258064513, 0.25],
-                         [0.4838709677419355, 0.4032258064516129, -0.41129032258064513],
-                         [0.4838709677419355, 0.4032258064516129, -0.2338709677419355],
-                         [0.4838709677419355, 0.4193548387096774, 0.45967741935483863],
-                         [-0.016129032258064502, -0.4838709677419355, 0.47580645161290325],
-                         [0.4838709677419355, 0.42741935483870963, -0.47580645161290325],
-                         [0.4838709677419355, 0.4193548387096774, 0.4838709677419355],
-                         [-0.24193548387096775, 0.13709677419354838, 0.4838709677419355]]
-mdbd_kernel_radii = [0.5, 0.17741935483870974, 0.1774193548387097, 0.1774193548387097, 0.1774193548387097,
-                     0.1774193548387097, 0.1774193548387097, 0.1774193548387097, 0.1774193548387097,
-                     0.11290322580645162, 0.11290322580645162, 0.11290322580645162, 0.11290322580645162,
-                     0.11290322580645162, 0.11290322580645162, 0.11290322580645162, 0.11290322580645162,
-                     0.11290322580645162, 0.11290322580645162, 0.11290322580645162, 0.11290322580645162,
-                     0.11290322580645162, 0.11290322580645162, 0.11290322580645162, 0.11290322580645162,
-                     0.11290322580645162, 0.11290322580645162, 0.11290322580645162, 0.11290322580645162,
-                     0.11290322580645162, 0.11290322580645162, 0.11290322580645162, 0.11290322580645162,
-                     0.10483870967741937, 0.10483870967741937, 0.10483870967741937, 0.08870967741935487,
-                     0.08064516129032262, 0.08064516129032262, 0.08064516129032262, 0.08064516129032262,
-                     0.08064516129032262, 0.08064516129032256, 0.08064516129032256, 0.06451612903225806,
-                     0.05645161290322587, 0.05645161290322587, 0.05645161290322587, 0.05645161290322587,
-                     0.05645161290322587, 0.05645161290322587, 0.05645161290322587, 0.05645161290322587,
-                     0.05645161290322587, 0.05645161290322587, 0.05645161290322587, 0.05645161290322587,
-                     0.05645161290322587, 0.05645161290322587, 0.05645161290322581, 0.05645161290322581,
-                     0.05645161290322581, 0.05645161290322581, 0.05645161290322581, 0.05645161290322581,
-                     0.05645161290322581, 0.05645161290322581, 0.05645161290322581, 0.048387096774193616,
-                     0.048387096774193616, 0.048387096774193616, 0.048387096774193616, 0.048387096774193616,
-                     0.048387096774193616, 0.048387096774193616, 0.048387096774193616, 0.048387096774193616,
-                     0.048387096774193616, 0.048387096774193616, 0.048387096774193616, 0.048387096774193616,
-                     0.048387096774193616, 0.048387096774193616, 0.048387096774193616, 0.048387096774193616,
-                     0.048387096774193616, 0.048387096774193616, 0.048387096774193616, 0.048387096774193616,
-                     0.048387096774193616, 0.048387096774193616, 0.048387096774193616, 0.048387096774193616,
-                     0.048387096774193616, 0.048387096774193616, 0.048387096774193616, 0.048387096774193616,
-                     0.048387096774193616, 0.048387096774193616, 0.048387096774193616, 0.048387096774193616,
-                     0.048387096774193616, 0.048387096774193616, 0.048387096774193616, 0.048387096774193616,
-                     0.048387096774193616, 0.048387096774193616, 0.048387096774193616, 0.048387096774193616,
-                     0.04838709677419356, 0.04838709677419356, 0.04838709677419356, 0.04838709677419356,
-                     0.04838709677419356, 0.04838709677419356, 0.04838709677419356, 0.04838709677419356,
-                     0.04838709677419356, 0.04838709677419356, 0.04838709677419356, 0.04838709677419356,
-                     0.04838709677419356, 0.04838709677419356, 0.04838709677419356, 0.04838709677419356,
-                     0.04838709677419356, 0.04838709677419356, 0.04838709677419356, 0.04838709677419356,
-                     0.04838709677419356, 0.04838709677419356, 0.04838709677419356, 0.04838709677419356,
-                     0.04838709677419356, 0.04838709677419356, 0.04838709677419356, 0.04838709677419356,
-                     0.04838709677419356, 0.04838709677419356, 0.04838709677419356, 0.04838709677419356,
-                     0.04838709677419356, 0.04838709677419356, 0.04838709677419356, 0.04838709677419356,
-                     0.04838709677419356, 0.04838709677419356, 0.040322580645161366, 0.040322580645161366,
-                     0.040322580645161366, 0.040322580645161366, 0.040322580645161366, 0.040322580645161366,
-                     0.040322580645161366, 0.040322580645161366, 0.040322580645161366, 0.040322580645161366,
-                     0.040322580645161366, 0.040322580645161366, 0.040322580645161366, 0.040322580645161366,
-                     0.040322580645161366, 0.040322580645161366, 0.040322580645161366, 0.040322580645161366,
-                     0.040322580645161366, 0.040322580645161366, 0.040322580645161366, 0.040322580645161366,
-                     0.040322580645161366, 0.040322580645161366, 0.040322580645161366, 0.040322580645161366,
-                     0.040322580645161366, 0.040322580645161366, 0.040322580645161366, 0.040322580645161366,
-                     0.040322580645161366, 0.040322580645161366, 0.040322580645161366, 0.040322580645161366,
-                     0.040322580645161366, 0.040322580645161366, 0.04032258064516131, 0.04032258064516131,
-                     0.04032258064516131, 0.04032258064516131, 0.04032258064516131, 0.04032258064516131,
-                     0.04032258064516131, 0.04032258064516131, 0.04032258064516131, 0.04032258064516131,
-                     0.04032258064516131, 0.04032258064516131, 0.04032258064516131, 0.04032258064516131,
-                     0.04032258064516131, 0.04032258064516131, 0.04032258064516131, 0.04032258064516131,
-                     0.04032258064516131, 0.04032258064516131, 0.04032258064516131, 0.04032258064516131,
-                     0.04032258064516131, 0.04032258064516131, 0.04032258064516131, 0.04032258064516131,
-                     0.04032258064516131, 0.04032258064516131, 0.04032258064516131, 0.04032258064516131,
-                     0.04032258064516131, 0.04032258064516131, 0.04032258064516131, 0.04032258064516131,
-                     0.04032258064516131, 0.04032258064516131, 0.04032258064516131, 0.04032258064516131,
-                     0.04032258064516131, 0.04032258064516131, 0.04032258064516131, 0.04032258064516131,
-                     0.04032258064516131, 0.04032258064516131, 0.04032258064516131, 0.04032258064516131,
-                     0.032258064516129004, 0.032258064516129004, 0.032258064516129004, 0.032258064516129004,
-                     0.032258064516129004, 0.032258064516129004, 0.032258064516129004, 0.032258064516129004,
-                     0.032258064516129004, 0.032258064516129004, 0.032258064516129004, 0.032258064516129004,
-                     0.032258064516129004, 0.032258064516129004, 0.032258064516129004, 0.032258064516129004,
-                     0.032258064516129004, 0.032258064516129004, 0.032258064516129004, 0.032258064516129004,
-                     0.032258064516129004, 0.032258064516129004, 0.032258064516129004, 0.032258064516129004,
-                     0.032258064516129004, 0.032258064516129004, 0.032258064516129004, 0.032258064516129004,
-                     0.032258064516129004, 0.032258064516129004, 0.032258064516129004, 0.032258064516129004,
-                     0.032258064516129004, 0.032258064516129004, 0.032258064516129004, 0.032258064516129004,
-                     0.032258064516129004, 0.032258064516129004, 0.032258064516129004, 0.032258064516129004,
-                     0.032258064516129004, 0.032258064516129004, 0.032258064516129004, 0.032258064516129004,
-                     0.032258064516129004, 0.032258064516129004, 0.032258064516129004, 0.032258064516129004,
-                     0.032258064516129004, 0.032258064516129004, 0.032258064516129004, 0.032258064516129004,
-                     0.032258064516129004, 0.032258064516129004, 0.032258064516129004, 0.032258064516129004,
-                     0.032258064516129004, 0.032258064516129004, 0.032258064516129004, 0.032258064516129004,
-                     0.032258064516129004, 0.032258064516129004, 0.032258064516129004, 0.032258064516129004,
-                     0.032258064516129004, 0.032258064516129004, 0.032258064516129004, 0.032258064516129004,
-                     0.032258064516129004, 0.032258064516129004, 0.032258064516129004, 0.032258064516129004,
-                     0.032258064516129004, 0.032258064516129004, 0.032258064516129004, 0.032258064516129004,
-                     0.032258064516129004, 0.032258064516129004, 0.032258064516129004, 0.032258064516129004,
-                     0.032258064516129004, 0.032258064516129004, 0.032258064516129004, 0.032258064516129004,
-                     0.032258064516129004, 0.032258064516129004, 0.032258064516129004, 0.032258064516129004,
-                     0.032258064516129004, 0.032258064516129004, 0.032258064516129004, 0.032258064516129004,
-                     0.032258064516129004, 0.032258064516129004, 0.032258064516129004, 0.032258064516129004,
-                     0.032258064516129004, 0.032258064516129004, 0.032258064516129004, 0.032258064516129004,
-                     0.032258064516129004, 0.032258064516129004, 0.032258064516129004, 0.032258064516129004,
-                     0.032258064516129004, 0.032258064516129004, 0.032258064516129004, 0.032258064516129004,
-                     0.032258064516129004, 0.032258064516129004, 0.032258064516129004, 0.032258064516129004,
-                     0.032258064516129004, 0.032258064516129004, 0.032258064516129004, 0.032258064516129004,
-                     0.032258064516129004, 0.032258064516129004, 0.032258064516129004, 0.032258064516129004,
-                     0.032258064516129004, 0.032258064516129004, 0.032258064516129004, 0.032258064516129004,
-                     0.032258064516129004, 0.032258064516129004, 0.032258064516129004, 0.032258064516129004,
-                     0.032258064516129004, 0.032258064516129004, 0.032258064516129004, 0.032258064516129004,
-                     0.032258064516129004, 0.032258064516129004, 0.032258064516129004, 0.032258064516129004,
-                     0.032258064516129004, 0.032258064516129004, 0.032258064516129004, 0.032258064516129004,
-                     0.032258064516129004, 0.032258064516129004, 0.032258064516129004, 0.032258064516129004,
-                     0.032258064516129004, 0.032258064516129004, 0.032258064516129004, 0.032258064516129004,
-                     0.032258064516129004, 0.032258064516129004, 0.032258064516129004, 0.032258064516129004,
-                     0.032258064516129004, 0.032258064516129004, 0.032258064516129004, 0.032258064516129004,
-                     0.032258064516129004, 0.024193548387096753, 0.024193548387096753, 0.024193548387096753,
-                     0.024193548387096753, 0.024193548387096753, 0.024193548387096753, 0.024193548387096753,
-                     0.024193548387096753, 0.024193548387096753, 0.024193548387096753, 0.024193548387096753,
-                     0.024193548387096753, 0.024193548387096753, 0.024193548387096753, 0.024193548387096753,
-                     0.024193548387096753, 0.024193548387096753, 0.024193548387096753, 0.024193548387096753,
-                     0.024193548387096753, 0.024193548387096753, 0.024193548387096753, 0.024193548387096753,
-                     0.024193548387096753, 0.024193548387096753, 0.024193548387096753, 0.024193548387096753,
-                     0.024193548387096753, 0.024193548387096753, 0.024193548387096753, 0.024193548387096753,
-                     0.024193548387096753, 0.024193548387096753, 0.024193548387096753, 0.024193548387096753,
-                     0.024193548387096753, 0.024193548387096753, 0.024193548387096753, 0.024193548387096753,
-                     0.024193548387096753, 0.024193548387096753, 0.024193548387096753, 0.024193548387096753,
-                     0.024193548387096753, 0.024193548387096753, 0.024193548387096753, 0.024193548387096753,
-                     0.024193548387096753, 0.024193548387096753, 0.024193548387096753, 0.024193548387096753,
-                     0.024193548387096753, 0.024193548387096753, 0.024193548387096753, 0.024193548387096753,
-                     0.024193548387096753, 0.024193548387096753, 0.024193548387096753, 0.024193548387096753,
-                     0.024193548387096753, 0.024193548387096753, 0.024193548387096753, 0.024193548387096753,
-                     0.024193548387096753, 0.024193548387096753, 0.024193548387096753, 0.024193548387096753,
-                     0.024193548387096753, 0.024193548387096753, 0.024193548387096753, 0.024193548387096753,
-                     0.024193548387096753, 0.024193548387096753, 0.024193548387096753, 0.024193548387096753,
-                     0.024193548387096753, 0.024193548387096753, 0.024193548387096753, 0.024193548387096753,
-                     0.024193548387096753, 0.024193548387096753, 0.024193548387096753, 0.024193548387096753,
-                     0.024193548387096753, 0.024193548387096753, 0.024193548387096753, 0.024193548387096753,
-                     0.024193548387096753, 0.024193548387096753, 0.024193548387096753, 0.024193548387096753,
-                     0.024193548387096753, 0.024193548387096753, 0.024193548387096753, 0.024193548387096753,
-                     0.024193548387096753, 0.024193548387096753, 0.024193548387096753, 0.024193548387096753,
-                     0.024193548387096753, 0.024193548387096753, 0.024193548387096753, 0.024193548387096753,
-                     0.024193548387096753, 0.024193548387096753, 0.024193548387096753, 0.024193548387096753,
-                     0.024193548387096753, 0.024193548387096753, 0.024193548387096753, 0.024193548387096753,
-                     0.024193548387096753, 0.024193548387096753, 0.024193548387096753, 0.024193548387096753,
-                     0.024193548387096753, 0.024193548387096753, 0.024193548387096753, 0.024193548387096753,
-                     0.024193548387096753, 0.024193548387096753, 0.024193548387096753, 0.024193548387096753,
-                     0.024193548387096753, 0.024193548387096753, 0.024193548387096753, 0.024193548387096753,
-                     0.024193548387096753, 0.024193548387096753, 0.024193548387096753, 0.024193548387096753,
-                     0.024193548387096753, 0.024193548387096753, 0.024193548387096753, 0.024193548387096753,
-                     0.024193548387096753, 0.024193548387096753, 0.024193548387096753, 0.024193548387096753,
-                     0.024193548387096753, 0.024193548387096753, 0.024193548387096753, 0.024193548387096753,
-                     0.024193548387096753, 0.024193548387096753, 0.024193548387096753, 0.024193548387096753,
-                     0.024193548387096753, 0.024193548387096753, 0.024193548387096753, 0.024193548387096753,
-                     0.024193548387096753, 0.024193548387096753, 0.024193548387096753, 0.024193548387096753,
-                     0.024193548387096753, 0.024193548387096753, 0.024193548387096753, 0.024193548387096753,
-                     0.024193548387096753, 0.024193548387096753, 0.024193548387096753, 0.024193548387096753,
-                     0.024193548387096753, 0.024193548387096753, 0.024193548387096753, 0.024193548387096753,
-                     0.024193548387096753, 0.024193548387096753, 0.024193548387096753, 0.024193548387096753,
-                     0.024193548387096753, 0.024193548387096753, 0.024193548387096753, 0.024193548387096753,
-                     0.024193548387096753, 0.024193548387096753, 0.024193548387096753, 0.024193548387096753,
-                     0.024193548387096753, 0.024193548387096753, 0.024193548387096753, 0.024193548387096753,
-                     0.024193548387096753, 0.024193548387096753, 0.024193548387096753, 0.024193548387096753,
-                     0.024193548387096753, 0.024193548387096753, 0.024193548387096753, 0.024193548387096753,
-                     0.024193548387096753, 0.024193548387096753, 0.024193548387096753, 0.024193548387096753,
-                     0.024193548387096753, 0.024193548387096753, 0.024193548387096753, 0.024193548387096753,
-                     0.024193548387096753, 0.024193548387096753, 0.024193548387096753, 0.024193548387096753,
-                     0.024193548387096753, 0.024193548387096753, 0.024193548387096753, 0.024193548387096753,
-                     0.024193548387096753, 0.024193548387096753, 0.016129032258064502, 0.016129032258064502,
-                     0.016129032258064502, 0.016129032258064502, 0.016129032258064502, 0.016129032258064502,
-                     0.016129032258064502, 0.016129032258064502, 0.016129032258064502, 0.016129032258064502,
-                     0.016129032258064502, 0.016129032258064502, 0.016129032258064502, 0.016129032258064502,
-                     0.016129032258064502, 0.016129032258064502, 0.016129032258064502, 0.016129032258064502,
-                     0.016129032258064502, 0.016129032258064502, 0.016129032258064502, 0.016129032258064502,
-                     0.016129032258064502, 0.016129032258064502, 0.016129032258064502, 0.016129032258064502,
-                     0.016129032258064502, 0.016129032258064502, 0.016129032258064502, 0.016129032258064502,
-                     0.016129032258064502, 0.016129032258064502, 0.016129032258064502, 0.016129032258064502,
-                     0.016129032258064502, 0.016129032258064502, 0.016129032258064502, 0.016129032258064502,
-                     0.016129032258064502, 0.016129032258064502, 0.016129032258064502, 0.016129032258064502,
-                     0.016129032258064502, 0.016129032258064502, 0.016129032258064502, 0.016129032258064502,
-                     0.016129032258064502, 0.016129032258064502, 0.016129032258064502, 0.016129032258064502,
-                     0.016129032258064502, 0.016129032258064502, 0.016129032258064502, 0.016129032258064502,
-                     0.016129032258064502, 0.016129032258064502, 0.016129032258064502, 0.016129032258064502,
-                     0.016129032258064502, 0.016129032258064502, 0.016129032258064502, 0.016129032258064502,
-                     0.016129032258064502, 0.016129032258064502, 0.016129032258064502, 0.016129032258064502,
-                     0.016129032258064502, 0.016129032258064502, 0.016129032258064502, 0.016129032258064502,
-                     0.016129032258064502, 0.016129032258064502, 0.016129032258064502, 0.016129032258064502,
-                     0.016129032258064502, 0.016129032258064502, 0.016129032258064502, 0.016129032258064502,
-                     0.016129032258064502, 0.016129032258064502, 0.016129032258064502, 0.016129032258064502,
-                     0.016129032258064502, 0.016129032258064502, 0.016129032258064502, 0.016129032258064502,
-                     0.016129032258064502, 0.016129032258064502, 0.016129032258064502, 0.016129032258064502,
-                     0.016129032258064502, 0.016129032258064502, 0.016129032258064502, 0.016129032258064502,
-                     0.016129032258064502, 0.016129032258064502, 0.016129032258064502, 0.016129032258064502,
-                     0.016129032258064502, 0.016129032258064502, 0.016129032258064502, 0.016129032258064502,
-                     0.016129032258064502, 0.016129032258064502, 0.016129032258064502, 0.016129032258064502,
-                     0.016129032258064502, 0.016129032258064502, 0.016129032258064502, 0.016129032258064502,
-                     0.016129032258064502, 0.016129032258064502, 0.016129032258064502, 0.016129032258064502,
-                     0.016129032258064502, 0.016129032258064502, 0.016129032258064502, 0.016129032258064502,
-                     0.016129032258064502, 0.016129032258064502, 0.016129032258064502, 0.016129032258064502,
-                     0.016129032258064502, 0.016129032258064502, 0.016129032258064502, 0.016129032258064502,
-                     0.016129032258064502, 0.016129032258064502, 0.016129032258064502, 0.016129032258064502,
-                     0.016129032258064502, 0.016129032258064502, 0.016129032258064502, 0.016129032258064502,
-                     0.016129032258064502, 0.016129032258064502, 0.016129032258064502, 0.016129032258064502,
-                     0.016129032258064502, 0.016129032258064502, 0.016129032258064502, 0.016129032258064502,
-                     0.016129032258064502, 0.016129032258064502, 0.016129032258064502, 0.016129032258064502,
-                     0.016129032258064502, 0.016129032258064502, 0.016129032258064502, 0.016129032258064502,
-                     0.016129032258064502, 0.016129032258064502, 0.016129032258064502, 0.016129032258064502,
-                     0.016129032258064502, 0.016129032258064502, 0.016129032258064502, 0.016129032258064502,
-                     0.016129032258064502, 0.016129032258064502, 0.016129032258064502, 0.016129032258064502,
-                     0.016129032258064502, 0.016129032258064502, 0.016129032258064502, 0.016129032258064502,
-                     0.016129032258064502, 0.016129032258064502, 0.016129032258064502, 0.016129032258064502,
-                     0.016129032258064502, 0.016129032258064502, 0.016129032258064502, 0.016129032258064502,
-                     0.016129032258064502, 0.016129032258064502, 0.016129032258064502, 0.016129032258064502,
-                     0.016129032258064502, 0.016129032258064502, 0.016129032258064502, 0.016129032258064502,
-                     0.016129032258064502, 0.016129032258064502, 0.016129032258064502, 0.016129032258064502,
-                     0.016129032258064502, 0.016129032258064502, 0.016129032258064502, 0.016129032258064502,
-                     0.016129032258064502, 0.016129032258064502, 0.016129032258064502, 0.016129032258064502,
-                     0.016129032258064502, 0.016129032258064502, 0.016129032258064502, 0.016129032258064502,
-                     0.016129032258064502, 0.016129032258064502, 0.016129032258064502, 0.016129032258064502,
-                     0.016129032258064502, 0.016129032258064502, 0.016129032258064502, 0.016129032258064502,
-                     0.016129032258064502, 0.016129032258064502, 0.016129032258064502, 0.016129032258064502,
-                     0.016129032258064502, 0.016129032258064502, 0.016129032258064502, 0.016129032258064502,
-                     0.016129032258064502, 0.016129032258064502, 0.016129032258064502, 0.016129032258064502,
-                     0.016129032258064502, 0.016129032258064502, 0.016129032258064502, 0.016129032258064502,
-                     0.016129032258064502, 0.016129032258064502, 0.016129032258064502, 0.016129032258064502,
-                     0.016129032258064502, 0.016129032258064502, 0.016129032258064502, 0.016129032258064502,
-                     0.016129032258064502, 0.016129032258064502, 0.016129032258064502, 0.016129032258064502,
-                     0.016129032258064502, 0.016129032258064502, 0.016129032258064502, 0.016129032258064502,
-                     0.016129032258064502, 0.016129032258064502, 0.016129032258064502, 0.016129032258064502,
-                     0.016129032258064502, 0.016129032258064502, 0.016129032258064502, 0.016129032258064502,
-                     0.016129032258064502, 0.016129032258064502, 0.016129032258064502, 0.016129032258064502,
-                     0.016129032258064502, 0.016129032258064502, 0.016129032258064502, 0.016129032258064502,
-                     0.016129032258064502, 0.016129032258064502, 0.016129032258064502, 0.016129032258064502,
-                     0.016129032258064502, 0.016129032258064502, 0.016129032258064502, 0.016129032258064502,
-                     0.016129032258064502, 0.016129032258064502, 0.016129032258064502, 0.016129032258064502,
-                     0.016129032258064502, 0.016129032258064502, 0.016129032258064502, 0.016129032258064502,
-                     0.016129032258064502, 0.016129032258064502, 0.016129032258064502, 0.016129032258064502,
-                     0.016129032258064502, 0.016129032258064502, 0.016129032258064502, 0.016129032258064502,
-                     0.016129032258064502, 0.016129032258064502, 0.016129032258064502, 0.016129032258064502,
-                     0.016129032258064502, 0.016129032258064502, 0.016129032258064502, 0.016129032258064502,
-                     0.016129032258064502, 0.016129032258064502, 0.016129032258064502, 0.016129032258064502,
-                     0.016129032258064502, 0.016129032258064502, 0.016129032258064502, 0.016129032258064502,
-                     0.016129032258064502, 0.016129032258064502, 0.016129032258064502, 0.016129032258064502,
-                     0.016129032258064502, 0.016129032258064502, 0.016129032258064502, 0.016129032258064502,
-                     0.016129032258064502, 0.016129032258064502, 0.016129032258064502, 0.016129032258064502,
-                     0.016129032258064502, 0.016129032258064502, 0.016129032258064502, 0.016129032258064502,
-                     0.016129032258064502, 0.016129032258064502, 0.016129032258064502, 0.016129032258064502,
-                     0.016129032258064502, 0.016129032258064502, 0.016129032258064502, 0.016129032258064502,
-                     0.016129032258064502, 0.016129032258064502, 0.016129032258064502, 0.016129032258064502,
-                     0.016129032258064502, 0.016129032258064502, 0.016129032258064502, 0.016129032258064502,
-                     0.016129032258064502, 0.016129032258064502, 0.016129032258064502, 0.016129032258064502,
-                     0.016129032258064502, 0.016129032258064502, 0.016129032258064502, 0.016129032258064502,
-                     0.016129032258064502, 0.016129032258064502, 0.016129032258064502, 0.016129032258064502,
-                     0.016129032258064502, 0.016129032258064502, 0.016129032258064502, 0.016129032258064502,
-                     0.016129032258064502, 0.016129032258064502, 0.016129032258064502, 0.016129032258064502,
-                     0.016129032258064502, 0.016129032258064502, 0.016129032258064502, 0.016129032258064502,
-                     0.016129032258064502, 0.016129032258064502, 0.016129032258064502, 0.016129032258064502,
-                     0.016129032258064502, 0.016129032258064502, 0.016129032258064502, 0.016129032258064502,
-                     0.016129032258064502, 0.016129032258064502, 0.016129032258064502, 0.016129032258064502,
-                     0.016129032258064502, 0.016129032258064502, 0.016129032258064502, 0.016129032258064502,
-                     0.016129032258064502, 0.016129032258064502, 0.016129032258064502, 0.016129032258064502,
-                     0.016129032258064502, 0.016129032258064502, 0.016129032258064502, 0.016129032258064502,
-                     0.016129032258064502, 0.016129032258064502, 0.016129032258064502, 0.016129032258064502,
-                     0.016129032258064502, 0.016129032258064502, 0.016129032258064502, 0.016129032258064502,
-                     0.016129032258064502, 0.016129032258064502, 0.016129032258064502, 0.016129032258064502,
-                     0.016129032258064502, 0.016129032258064502, 0.016129032258064502, 0.016129032258064502,
-                     0.016129032258064502, 0.016129032258064502, 0.016129032258064502, 0.016129032258064502,
-                     0.016129032258064502, 0.016129032258064502, 0.016129032258064502, 0.016129032258064502,
-                     0.016129032258064502, 0.016129032258064502, 0.016129032258064502, 0.016129032258064502,
-                     0.016129032258064502, 0.016129032258064502, 0.016129032258064502]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,26 +2,1023 @@
 Geometry Project by Norato...
 """
 
+from functools import partial
+
+import numpy as np
+from scipy.spatial import cKDTree
 import jax.numpy as jnp
-from chex import assert_shape, assert_type
+from jax import jit, lax, vmap, vjp, jacfwd, custom_vjp, tree_util
+
+from .mesh_kernels import apply_kernel, slice_grid_kernel, dynamic_slice_grid_kernel
+from .windows import WindowedDensity
+from ..geometry.cylinders import create_cylinders
+from ..geometry.intersection import volume_intersection_two_spheres, volume_intersection_two_spheres_derivative
+from ..mechanics.distance import minimum_distances_points_segments, minimum_distances_segments_segments
+from ..mechanics.transformations_rigidbody import transform_points
+from ..physics.distributed.mesh import generate_mesh_vec, create_grid_descriptor
+from ..geometry.spheres import get_aabb_indices, get_aabb_index_range
+from ..utilities.precision import get_storage_dtype, to_compute_dtype
+from ..utilities.validation import assert_shape, assert_type
+from ..utilities.aggregation import kreisselmeier_steinhauser_max, kreisselmeier_steinhauser_min, \
+    kreisselmeier_steinhauser_max_online
+
+
+def project_component(grid_centers, grid_size, obj_points, obj_radii, kernel_points, kernel_radii, max_bytes=None):
+    """
+    Projects object points to the grid and calculates pseudo-densities.
+
+    Parameters:
+    ----------
+    grid_centers : array, shape (nx, ny, nz, nk, 3)
+        Grid element centers.
+    grid_size : float
+        Size of each grid element.
+    obj_points : array, shape (no, 3)
+        Object points in 3D space.
+    obj_radii : array, shape (no, 1)
+        Radii of the object points.
+    kernel_points : array, shape (nk, 3)
+        Points representing the mesh kernel.
+    kernel_radii : array, shape (nk, 1)
+        Radii of kernel points.
+    max_bytes : int, optional
+        Memory budget for the kernel-object distance tensor. If given, the active grid region is
+        processed in slabs along x that each stay within the budget.
+
+    Returns:
+    --------
+    all_densities : array, shape (nx, ny, nz)
+        Pseudo-densities calculated for each grid element.
+    kernel_points : array, shape (nxs, nys, nzs, nk, 3)
+        Kernel points in the grid's active area.
+    kernel_radii : array, shape (nxs, nys, nzs, nk, 1)
+        Kernel radii in the grid's active area.
+    """
+
+    # Check the input shapes
+    assert_shape(grid_centers, (None, None, None, None, 3))
+    assert_shape(grid_size, ())
+    assert_shape(obj_points, (None, 3))
+    assert_shape(obj_radii, (None, 1))
+    assert_shape(kernel_points, (None, 3))
+    assert_shape(kernel_radii, (None, 1))
+
+    # Check the input types
+    assert_type(grid_centers, get_storage_dtype())
+    assert_type(grid_size, get_storage_dtype())
+    assert_type(obj_points, get_storage_dtype())
+    assert_type(obj_radii, get_storage_dtype())
+    assert_type(kernel_points, get_storage_dtype())
+    assert_type(kernel_radii, get_storage_dtype())
+
+    # Unpack the AABB indices
+    i1, i2, j1, j2, k1, k2 = get_aabb_indices(grid_centers, grid_size, obj_points, obj_radii)
+
+    # Extract grid dimensions
+    grid_nx, grid_ny, grid_nz, _, _ = grid_centers.shape
+
+    # Initialize the output density array
+    all_densities = jnp.zeros((grid_nx, grid_ny, grid_nz), dtype=get_storage_dtype())
+
+    # Extract the active grid region within the object's AABB
+    active_grid_centers = grid_centers[i1:i2 + 1, j1:j2 + 1, k1:k2 + 1]
+
+    # Project the object onto the active grid region
+    if max_bytes is None:
+        densities, kernel_points, kernel_radii = _project_component_window(active_grid_centers, grid_size,
+                                                                           obj_points, obj_radii,
+                                                                           kernel_points, kernel_radii)
+    else:
+        slab_size = get_slab_size(active_grid_centers, kernel_points, obj_points, max_bytes)
+        densities = _project_in_slabs(_project_component_slab, active_grid_centers, slab_size,
+                                      grid_size, obj_points, obj_radii, kernel_points, kernel_radii)
+        kernel_points, kernel_radii = apply_kernel(active_grid_centers, grid_size, kernel_points, kernel_radii)
+
+    # Store the densities in the output array
+    all_densities = all_densities.at[i1:i2 + 1, j1:j2 + 1, k1:k2 + 1].set(densities)
+
+    return all_densities, kernel_points, kernel_radii
+
+
+def project_component_grid_kernel(grid_kernel, obj_points, obj_radii, max_bytes=None):
+    """
+    Projects object points to the grid using kernel samples precomputed by create_grid_kernel.
+
+    Equivalent to project_component, but the kernel is not re-applied to the grid on every call, so one
+    grid kernel can be shared by all the projections onto the same grid.
+
+    Parameters:
+    ----------
+    grid_kernel : GridKernel
+        Grid element centers and kernel samples of the grid.
+    obj_points : array, shape (no, 3)
+        Object points in 3D space.
+    obj_radii : array, shape (no, 1)
+        Radii of the object points.
+    max_bytes : int, optional
+        Memory budget for the kernel-object distance tensor, see project_component.
+
+    Returns:
+    --------
+    all_densities : array, shape (nx, ny, nz)
+        Pseudo-densities calculated for each grid element.
+    kernel_points : array, shape (nxs, nys, nzs, nk, 3)
+        Kernel points in the grid's active area.
+    kernel_radii : array, shape (nxs, nys, nzs, nk, 1)
+        Kernel radii in the grid's active area.
+    """
+
+    # Check the input shapes
+    assert_shape(obj_points, (None, 3))
+    assert_shape(obj_radii, (None, 1))
+
+    # Check the input types
+    assert_type(obj_points, get_storage_dtype())
+    assert_type(obj_radii, get_storage_dtype())
+
+    # Unpack the AABB indices
+    i1, i2, j1, j2, k1, k2 = get_aabb_indices(grid_kernel.grid_centers, grid_kernel.grid_size, obj_points, obj_radii)
+
+    # Extract grid dimensions
+    grid_nx, grid_ny, grid_nz, _, _ = grid_kernel.grid_centers.shape
+
+    # Initialize the output density array
+    all_densities = jnp.zeros((grid_nx, grid_ny, grid_nz), dtype=get_storage_dtype())
+
+    # Extract the kernel samples within the object's AABB
+    active_grid_kernel = slice_grid_kernel(grid_kernel, i1, i2, j1, j2, k1, k2)
+    kernel_points = active_grid_kernel.kernel_points
+    kernel_radii = active_grid_kernel.kernel_radii
+
+    # Project the object onto the active kernel samples
+    if max_bytes is None:
+        densities = _project_component_samples(kernel_points, kernel_radii, obj_points, obj_radii)
+    else:
+        slab_size = get_slab_size(active_grid_kernel.grid_centers, kernel_points[0, 0, 0], obj_points, max_bytes)
+        densities = _project_in_slabs(_project_grid_kernel_slab, (kernel_points, kernel_radii), slab_size,
+                                      obj_points, obj_radii)
+
+    # Store the densities in the output array
+    all_densities = all_densities.at[i1:i2 + 1, j1:j2 + 1, k1:k2 + 1].set(densities)
+
+    return all_densities, kernel_points, kernel_radii
+
+
+def get_slab_size(active_grid_centers, kernel_points, obj_points, max_bytes):
+    """
+    Calculates how many x-slices of the active grid region fit within a memory budget.
+
+    The largest intermediate array of a projection is the (nxs, nys, nzs, nk, no, 3) tensor of
+    kernel-object offsets, so the budget is divided by the size of one x-slice of it.
+
+    Parameters:
+    ----------
+    active_grid_centers : array, shape (nxs, nys, nzs, 1, 3)
+        Grid element centers of the active region.
+    kernel_points : array, shape (nk, 3)
+        Points representing the mesh kernel.
+    obj_points : array, shape (no, 3)
+        Object points, or the segment start points of an interconnect.
+    max_bytes : int
+        Memory budget in bytes.
+
+    Returns:
+    --------
+    slab_size : int
+        Number of x-slices per slab, at least one.
+    """
+
+    aabb_nx, aabb_ny, aabb_nz, _, _ = active_grid_centers.shape
+    kernel_count, _ = kernel_points.shape
+    obj_count, _ = obj_points.shape
+    itemsize = jnp.dtype(active_grid_centers.dtype).itemsize
+
+    slice_bytes = aabb_ny * aabb_nz * kernel_count * obj_count * 3 * itemsize
+    slab_size = int(min(max(max_bytes // slice_bytes, 1), aabb_nx))
+
+    return slab_size
+
+
+@partial(jit, static_argnames=('project_slab', 'slab_size'))
+def _project_in_slabs(project_slab, active_grid_centers, slab_size, *args):
+    """
+    Applies a window projection to slabs of the active grid region along x with lax.map.
+
+    The active region may be a single array or a tuple of arrays that share their first three axes,
+    e.g., the kernel points and radii of a precomputed grid kernel. project_slab is called as
+    project_slab(slab, *args) and must be a module-level function, so that repeated projections
+    with the same shapes reuse the compiled function.
+    """
+
+    aabb_nx = tree_util.tree_leaves(active_grid_centers)[0].shape[0]
+    n_slabs = -(-aabb_nx // slab_size)
+
+    # Pad the region to a whole number of slabs by repeating the last slice
+    def split_slabs(array):
+        padding = ((0, n_slabs * slab_size - aabb_nx),) + ((0, 0),) * (array.ndim - 1)
+        padded_array = jnp.pad(array, padding, mode='edge')
+        return padded_array.reshape(n_slabs, slab_size, *array.shape[1:])
+
+    slabs = tree_util.tree_map(split_slabs, active_grid_centers)
+
+    # Project one slab at a time and drop the padded slices
+    densities = lax.map(lambda slab: project_slab(slab, *args), slabs)
+    densities = densities.reshape(n_slabs * slab_size, *densities.shape[2:])[:aabb_nx]
+
+    return densities
+
+
+def _project_component_slab(slab_grid_centers, grid_size, obj_points, obj_radii, kernel_points, kernel_radii):
+    """
+    Calculates the pseudo-densities of one slab of the active grid region, see _project_in_slabs.
+    """
+
+    densities, _, _ = _project_component_window(slab_grid_centers, grid_size, obj_points, obj_radii,
+                                                kernel_points, kernel_radii)
+
+    return densities
+
+
+def _project_grid_kernel_slab(slab_kernel, obj_points, obj_radii):
+    """
+    Calculates the pseudo-densities of one slab of precomputed kernel samples, see _project_in_slabs.
+    """
+
+    return _project_component_samples(*slab_kernel, obj_points, obj_radii)
+
+
+def _project_component_window(active_grid_centers, grid_size, obj_points, obj_radii, kernel_points, kernel_radii):
+    """
+    Calculates the pseudo-densities of the grid elements in an active window.
+
+    Parameters:
+    ----------
+    active_grid_centers : array, shape (nxs, nys, nzs, 1, 3)
+        Grid element centers of the active window.
+    grid_size : float
+        Size of each grid element.
+    obj_points : array, shape (no, 3)
+        Object points in 3D space.
+    obj_radii : array, shape (no, 1)
+        Radii of the object points.
+    kernel_points : array, shape (nk, 3)
+        Points representing the mesh kernel.
+    kernel_radii : array, shape (nk, 1)
+        Radii of kernel points.
+
+    Returns:
+    --------
+    densities : array, shape (nxs, nys, nzs)
+        Pseudo-densities of the active window.
+    kernel_points : array, shape (nxs, nys, nzs, nk, 3)
+        Kernel points in the active window.
+    kernel_radii : array, shape (nxs, nys, nzs, nk, 1)
+        Kernel radii in the active window.
+    """
+
+    # Apply the kernel to active grid elements
+    kernel_points, kernel_radii = apply_kernel(active_grid_centers, grid_size, kernel_points, kernel_radii)
+
+    # Project the object onto the kernel samples
+    densities = _project_component_samples(kernel_points, kernel_radii, obj_points, obj_radii)
+
+    return densities, kernel_points, kernel_radii
+
+
+def _project_component_samples(kernel_points, kernel_radii, obj_points, obj_radii):
+    """
+    Calculates the pseudo-densities of grid elements from their kernel samples.
+
+    Parameters:
+    ----------
+    kernel_points : array, shape (nxs, nys, nzs, nk, 3)
+        Kernel points of the grid elements.
+    kernel_radii : array, shape (nxs, nys, nzs, nk, 1)
+        Kernel radii of the grid elements.
+    obj_points : array, shape (no, 3)
+        Object points in 3D space.
+    obj_radii : array, shape (no, 1)
+        Radii of the object points.
+
+    Returns:
+    --------
+    densities : array, shape (nxs, nys, nzs)
+        Pseudo-densities of the grid elements.
+    """
+
+    # Extract the window dimensions
+    aabb_nx, aabb_ny, aabb_nz, kernel_count, _ = kernel_points.shape
+    obj_count, _ = obj_points.shape
+
+    # Calculate the overlaps in the compute precision
+    kernel_points, kernel_radii, obj_points, obj_radii = to_compute_dtype(kernel_points, kernel_radii,
+                                                                          obj_points, obj_radii)
+
+    # Calculate sample volumes and element volumes
+    sample_volumes = (4 / 3) * jnp.pi * kernel_radii ** 3
+    element_volumes = jnp.sum(sample_volumes, axis=3, keepdims=True)
+
+    # Expand dimensions for broadcasting
+    # Transpose object radii for broadcasting
+    kernel_points_bc = kernel_points.reshape(aabb_nx, aabb_ny, aabb_nz, kernel_count, 1, 3)
+    obj_points_bc = obj_points.reshape(1, 1, 1, 1, obj_count, 3)
+    obj_radii_bc = obj_radii.T.reshape(1, 1, 1, 1, obj_count)
+
+    # Compute distances between kernel and object points
+    distances = minimum_distances_points_segments(kernel_points_bc, obj_points_bc, obj_points_bc)
+
+    # Calculate volume overlaps
+    overlaps = volume_intersection_two_spheres(obj_radii_bc, kernel_radii, distances)
+
+    # Accumulate in the storage precision
+    overlaps = overlaps.astype(get_storage_dtype())
+    element_volumes = element_volumes.astype(get_storage_dtype())
+    element_overlaps = jnp.sum(overlaps, axis=4, keepdims=True)
+
+    # Calculate volume fractions
+    volume_fractions = (element_overlaps / element_volumes).reshape(aabb_nx, aabb_ny, aabb_nz, kernel_count)
+
+    # Sum fractions to compute pseudo-densities
+    densities = jnp.sum(volume_fractions, axis=3)
+
+    return densities
+
+
+def get_window_shape(grid_centers, grid_size, obj_points, obj_radii):
+    """
+    Calculates a fixed active window shape that contains the object's AABB for any rigid body pose.
+
+    The window extent is taken from the radius of the sphere that bounds the object about its centroid,
+    which does not change when the object is translated or rotated.
+
+    Parameters:
+    ----------
+    grid_centers : array, shape (nx, ny, nz, 1, 3)
+        Grid element centers.
+    grid_size : float
+        Size of each grid element.
+    obj_points : array, shape (no, 3)
+        Object points in 3D space.
+    obj_radii : array, shape (no, 1)
+        Radii of the object points.
+
+    Returns:
+    --------
+    window_shape : tuple of int
+        Number of grid elements (wx, wy, wz) in the active window.
+    """
+
+    # Calculate the bounding radius of the object about its centroid
+    obj_points = np.asarray(obj_points).reshape(-1, 3)
+    obj_radii = np.asarray(obj_radii).reshape(-1, 1)
+    centroid = np.mean(obj_points, axis=0, keepdims=True)
+    bounding_radius = np.max(np.linalg.norm(obj_points - centroid, axis=1, keepdims=True) + obj_radii)
+
+    # An interval of length 2R overlaps at most floor(2R / size) + 2 elements
+    window_length = int(np.floor(2 * bounding_radius / float(grid_size))) + 2
+
+    # The window cannot be larger than the grid
+    grid_nx, grid_ny, grid_nz, _, _ = grid_centers.shape
+    window_shape = (min(window_length, grid_nx), min(window_length, grid_ny), min(window_length, grid_nz))
+
+    return window_shape
+
+
+def _get_window_indices(first, last, grid_length, window_length):
+    """
+    Returns the start index of a fixed-length window and the mask of the elements that overlap the object.
+    """
+
+    # Clamp the window to the grid
+    start = jnp.clip(first, 0, grid_length - window_length)
+
+    # Mask the elements of the window that lie outside the object's AABB or the grid
+    indices = start + jnp.arange(window_length)
+    mask = (indices >= first) & (indices <= last)
+
+    return start, mask
+
+
+def _locate_window(grid_centers, grid_size, obj_points, obj_radii, window_shape):
+    """
+    Returns the start indices, the AABB mask, and the grid element centers of a fixed-shape active window.
+    """
+
+    grid_nx, grid_ny, grid_nz, grid_nc, _ = grid_centers.shape
+    window_nx, window_ny, window_nz = window_shape
+
+    # Calculate the object's AABB
+    obj_min = jnp.min(obj_points - obj_radii, axis=0)
+    obj_max = jnp.max(obj_points + obj_radii, axis=0)
+
+    # Locate the window along each axis
+    grid = create_grid_descriptor(grid_centers, grid_size)
+    first, last = get_aabb_index_range(grid, obj_min, obj_max)
+    i1, mask_x = _get_window_indices(first[0], last[0], grid_nx, window_nx)
+    j1, mask_y = _get_window_indices(first[1], last[1], grid_ny, window_ny)
+    k1, mask_z = _get_window_indices(first[2], last[2], grid_nz, window_nz)
+    mask = mask_x[:, None, None] & mask_y[None, :, None] & mask_z[None, None, :]
+
+    # Extract the active grid window
+    active_grid_centers = lax.dynamic_slice(grid_centers, (i1, j1, k1, 0, 0),
+                                            (window_nx, window_ny, window_nz, grid_nc, 3))
+
+    return (i1, j1, k1), mask, active_grid_centers
+
+
+def project_component_windowed(grid_centers, grid_size, obj_points, obj_radii, kernel_points, kernel_radii,
+                               window_shape):
+    """
+    Projects object points to the grid using a fixed-shape active window.
+
+    Unlike project_component, every intermediate array has a static shape, so the function can be
+    compiled with jax.jit (see project_component_jit) and reused for every pose of the object.
+    Elements of the window that lie outside the object's AABB are masked out, so the densities
+    match project_component.
+
+    Parameters:
+    ----------
+    grid_centers : array, shape (nx, ny, nz, 1, 3)
+        Grid element centers.
+    grid_size : float
+        Size of each grid element.
+    obj_points : array, shape (no, 3)
+        Object points in 3D space.
+    obj_radii : array, shape (no, 1)
+        Radii of the object points.
+    kernel_points : array, shape (nk, 3)
+        Points representing the mesh kernel.
+    kernel_radii : array, shape (nk, 1)
+        Radii of kernel points.
+    window_shape : tuple of int
+        Static shape (wx, wy, wz) of the active window, see get_window_shape.
+
+    Returns:
+    --------
+    all_densities : array, shape (nx, ny, nz)
+        Pseudo-densities calculated for each grid element.
+    kernel_points : array, shape (wx, wy, wz, nk, 3)
+        Kernel points in the grid's active window.
+    kernel_radii : array, shape (wx, wy, wz, nk, 1)
+        Kernel radii in the grid's active window.
+    """
+
+    # Check the input shapes
+    assert_shape(grid_centers, (None, None, None, None, 3))
+    assert_shape(grid_size, ())
+    assert_shape(obj_points, (None, 3))
+    assert_shape(obj_radii, (None, 1))
+    assert_shape(kernel_points, (None, 3))
+    assert_shape(kernel_radii, (None, 1))
+
+    # Check the input types
+    assert_type(grid_centers, get_storage_dtype())
+    assert_type(grid_size, get_storage_dtype())
+    assert_type(obj_points, get_storage_dtype())
+    assert_type(obj_radii, get_storage_dtype())
+    assert_type(kernel_points, get_storage_dtype())
+    assert_type(kernel_radii, get_storage_dtype())
+
+    # Extract grid dimensions
+    grid_nx, grid_ny, grid_nz, _, _ = grid_centers.shape
+
+    # Locate the active grid window
+    (i1, j1, k1), mask, active_grid_centers = _locate_window(grid_centers, grid_size, obj_points, obj_radii,
+                                                             window_shape)
+
+    # Project the object onto the active grid window
+    densities, kernel_points, kernel_radii = _project_component_window(active_grid_centers, grid_size,
+                                                                       obj_points, obj_radii,
+                                                                       kernel_points, kernel_radii)
+
+    # Remove the contributions of elements outside the object's AABB
+    densities = jnp.where(mask, densities, 0.0)
+
+    # Store the densities in the output array
+    all_densities = jnp.zeros((grid_nx, grid_ny, grid_nz), dtype=get_storage_dtype())
+    all_densities = lax.dynamic_update_slice(all_densities, densities, (i1, j1, k1))
+
+    return all_densities, kernel_points, kernel_radii
+
+
+project_component_jit = jit(project_component_windowed, static_argnames='window_shape')
+
+
+@partial(jit, static_argnames='window_shape')
+def project_component_grid_kernel_jit(grid_kernel, obj_points, obj_radii, window_shape):
+    """
+    Projects object points to the grid using a fixed-shape window of a precomputed grid kernel.
+
+    Equivalent to project_component_jit, but the window's kernel samples are sliced from the grid kernel
+    instead of being recomputed.
+
+    Parameters:
+    ----------
+    grid_kernel : GridKernel
+        Grid element centers and kernel samples of the grid.
+    obj_points : array, shape (no, 3)
+        Object points in 3D space.
+    obj_radii : array, shape (no, 1)
+        Radii of the object points.
+    window_shape : tuple of int
+        Static shape (wx, wy, wz) of the active window, see get_window_shape.
+
+    Returns:
+    --------
+    all_densities : array, shape (nx, ny, nz)
+        Pseudo-densities calculated for each grid element.
+    kernel_points : array, shape (wx, wy, wz, nk, 3)
+        Kernel points in the grid's active window.
+    kernel_radii : array, shape (wx, wy, wz, nk, 1)
+        Kernel radii in the grid's active window.
+    """
+
+    # Extract grid dimensions
+    grid_nx, grid_ny, grid_nz, _, _ = grid_kernel.grid_centers.shape
+
+    # Locate the active grid window and slice its kernel samples
+    window_start, mask, _ = _locate_window(grid_kernel.grid_centers, grid_kernel.grid_size,
+                                           obj_points, obj_radii, window_shape)
+    active_grid_kernel = dynamic_slice_grid_kernel(grid_kernel, window_start, window_shape)
+    kernel_points = active_grid_kernel.kernel_points
+    kernel_radii = active_grid_kernel.kernel_radii
+
+    # Project the object onto the active kernel samples
+    densities = _project_component_samples(kernel_points, kernel_radii, obj_points, obj_radii)
+
+    # Remove the contributions of elements outside the object's AABB
+    densities = jnp.where(mask, densities, 0.0)
+
+    # Store the densities in the output array
+    all_densities = jnp.zeros((grid_nx, grid_ny, grid_nz), dtype=get_storage_dtype())
+    all_densities = lax.dynamic_update_slice(all_densities, densities, window_start)
+
+    return all_densities, kernel_points, kernel_radii
+
+
+@partial(jit, static_argnames='window_shape')
+def project_component_to_window(grid_centers, grid_size, obj_points, obj_radii, kernel_points, kernel_radii,
+                                window_shape):
+    """
+    Projects object points to a fixed-shape active window without allocating a full-grid array.
+
+    See project_component_windowed for the parameters. Use densify or aggregate_windowed_densities
+    to move the result onto the grid.
+
+    Returns:
+    --------
+    windowed_density : WindowedDensity
+        The window offset (i1, j1, k1) and the pseudo-densities of the window, shape window_shape.
+    """
+
+    # Locate the active grid window
+    window_start, mask, active_grid_centers = _locate_window(grid_centers, grid_size, obj_points, obj_radii,
+                                                             window_shape)
+
+    # Project the object onto the active grid window
+    densities, _, _ = _project_component_window(active_grid_centers, grid_size, obj_points, obj_radii,
+                                                kernel_points, kernel_radii)
+
+    # Remove the contributions of elements outside the object's AABB
+    densities = jnp.where(mask, densities, 0.0)
+
+    return WindowedDensity(jnp.stack(window_start), densities)
+
+
+def pad_spheres(obj_points_list, obj_radii_list):
+    """
+    Pads the sphere sets of several objects to a common length.
+
+    Parameters:
+    ----------
+    obj_points_list : list of arrays, shape (no_i, 3)
+        Sphere centers of each object.
+    obj_radii_list : list of arrays, shape (no_i, 1)
+        Sphere radii of each object.
+
+    Returns:
+    --------
+    obj_points : array, shape (n_obj, no_max, 3)
+        Padded sphere centers.
+    obj_radii : array, shape (n_obj, no_max, 1)
+        Padded sphere radii.
+    obj_mask : array, shape (n_obj, no_max)
+        True for the valid spheres of each object. Padded spheres follow the valid ones.
+    """
+
+    obj_counts = [np.shape(points)[0] for points in obj_points_list]
+    n_obj, max_count = len(obj_counts), max(obj_counts)
+
+    obj_points = np.zeros((n_obj, max_count, 3))
+    obj_radii = np.zeros((n_obj, max_count, 1))
+    obj_mask = np.zeros((n_obj, max_count), dtype=bool)
+
+    for i, (points, radii, count) in enumerate(zip(obj_points_list, obj_radii_list, obj_counts)):
+        obj_points[i, :count] = np.reshape(points, (-1, 3))
+        obj_radii[i, :count] = np.reshape(radii, (-1, 1))
+        obj_mask[i, :count] = True
+
+    return jnp.array(obj_points), jnp.array(obj_radii), jnp.array(obj_mask)
+
+
+@partial(jit, static_argnames='window_shape')
+def project_components_batched(grid_centers, grid_size, obj_points, obj_radii, obj_mask,
+                               kernel_points, kernel_radii, window_shape):
+    """
+    Projects several objects to the grid in one vectorized call.
+
+    Every object uses the same static window shape, so the projections are vectorized with vmap and
+    compiled together. Padded spheres are moved onto the object's first sphere and given a zero radius
+    so they neither contribute density nor change the object's AABB.
+
+    Parameters:
+    ----------
+    grid_centers : array, shape (nx, ny, nz, 1, 3)
+        Grid element centers.
+    grid_size : float
+        Size of each grid element.
+    obj_points : array, shape (n_obj, no_max, 3)
+        Padded sphere centers, see pad_spheres.
+    obj_radii : array, shape (n_obj, no_max, 1)
+        Padded sphere radii.
+    obj_mask : array, shape (n_obj, no_max)
+        True for the valid spheres of each object.
+    kernel_points : array, shape (nk, 3)
+        Points representing the mesh kernel.
+    kernel_radii : array, shape (nk, 1)
+        Radii of kernel points.
+    window_shape : tuple of int
+        Static shape of the active window, large enough for every object (see get_window_shape).
+
+    Returns:
+    --------
+    all_densities : array, shape (n_obj, nx, ny, nz)
+        Pseudo-densities of each object.
+    """
+
+    # Neutralize the padded spheres
+    obj_points = jnp.where(obj_mask[..., None], obj_points, obj_points[:, :1, :])
+    obj_radii = jnp.where(obj_mask[..., None], obj_radii, 0.0)
+
+    def project(points, radii):
+        densities, _, _ = project_component_windowed(grid_centers, grid_size, points, radii,
+                                                     kernel_points, kernel_radii, window_shape)
+        return densities
+
+    all_densities = vmap(project)(obj_points, obj_radii)
+
+    return all_densities
+
+
+def _project_component_window_gradient(active_grid_centers, grid_size, obj_points, obj_radii,
+                                       kernel_points, kernel_radii):
+    """
+    Calculates the pseudo-densities of an active window and their derivatives with respect to the object points.
+
+    The derivatives follow from the derivative of the overlap volume with respect to the center distance,
+    so they are computed in the same pass as the densities.
+
+    Returns:
+    --------
+    densities : array, shape (nxs, nys, nzs)
+        Pseudo-densities of the active window.
+    densities_derivatives : array, shape (nxs, nys, nzs, no, 3)
+        Derivatives of each density with respect to each object point.
+    """
+
+    obj_count, _ = obj_points.shape
+
+    # Apply the kernel to active grid elements
+    kernel_points, kernel_radii = apply_kernel(active_grid_centers, grid_size, kernel_points, kernel_radii)
 
-from .grid_kernels import apply_kernel
-from ..geometry.cylinders import create_cylinders
-from ..geometry.intersection import volume_intersection_two_spheres
-from ..mechanics.distance import minimum_distances_points_segments, minimum_distances_segments_segments
-from ..projection.grid_kernels import apply_kernel
-from ..physics.distributed.mesh import generate_mesh_vec
-from ..geometry.spheres import get_aabb_indices
-from ..utilities.aggregation import kreisselmeier_steinhauser_max, kreisselmeier_steinhauser_min
+    # Calculate the overlaps and their derivatives in the compute precision
+    kernel_points, kernel_radii, obj_points, obj_radii = to_compute_dtype(kernel_points, kernel_radii,
+                                                                          obj_points, obj_radii)
+
+    # Calculate element volumes
+    sample_volumes = (4 / 3) * jnp.pi * kernel_radii ** 3
+    element_volumes = jnp.sum(sample_volumes, axis=3).astype(get_storage_dtype())
+
+    # Compute distances between kernel and object points
+    offsets = kernel_points[..., None, :] - obj_points
+    distances = jnp.linalg.norm(offsets, axis=-1)
+    obj_radii_bc = obj_radii.reshape(obj_count)
 
+    # Calculate volume overlaps and their derivatives with respect to the distances
+    overlaps = volume_intersection_two_spheres(obj_radii_bc, kernel_radii, distances)
+    overlap_derivatives = volume_intersection_two_spheres_derivative(obj_radii_bc, kernel_radii, distances)
+
+    # Chain the distance derivatives to the object points, d(distance)/d(point) = -offset / distance
+    safe_distances = jnp.where(distances > 0, distances, 1.0)
+    point_derivatives = -(overlap_derivatives / safe_distances)[..., None] * offsets
+
+    # Accumulate in the storage precision
+    overlaps = overlaps.astype(get_storage_dtype())
+    point_derivatives = point_derivatives.astype(get_storage_dtype())
+
+    # Sum the volume fractions to compute pseudo-densities
+    densities = jnp.sum(overlaps, axis=(3, 4)) / element_volumes[..., 0]
+    densities_derivatives = jnp.sum(point_derivatives, axis=3) / element_volumes[..., None]
 
-def project_component(grid_centers, grid_size, obj_points, obj_radii, kernel_points, kernel_radii):
+    return densities, densities_derivatives
+
+
+def _transform_points_storage(obj_points, reference_point, translation, rotation):
     """
-    Projects object points to the grid and calculates pseudo-densities.
+    Transforms the object points to a pose in the storage precision, see transform_points.
+    """
+
+    return transform_points(obj_points, reference_point, translation, rotation).astype(get_storage_dtype())
+
+
+def _project_component_pose_gradient(grid_centers, grid_size, obj_points, obj_radii, kernel_points, kernel_radii,
+                                     reference_point, translation, rotation, window_shape):
+    """
+    Transforms and projects the object, returning the masked window densities and their derivatives.
+    """
+
+    # Check the input shapes
+    assert_shape(grid_centers, (None, None, None, None, 3))
+    assert_shape(grid_size, ())
+    assert_shape(obj_points, (None, 3))
+    assert_shape(obj_radii, (None, 1))
+    assert_shape(kernel_points, (None, 3))
+    assert_shape(kernel_radii, (None, 1))
+
+    # Check the input types
+    assert_type(grid_centers, get_storage_dtype())
+    assert_type(grid_size, get_storage_dtype())
+    assert_type(obj_points, get_storage_dtype())
+    assert_type(obj_radii, get_storage_dtype())
+    assert_type(kernel_points, get_storage_dtype())
+    assert_type(kernel_radii, get_storage_dtype())
+
+    # Transform the object to its pose
+    points = _transform_points_storage(obj_points, reference_point, translation, rotation)
+
+    # Locate the active grid window
+    window_start, mask, active_grid_centers = _locate_window(grid_centers, grid_size, points, obj_radii,
+                                                             window_shape)
+
+    # Project the object and differentiate with respect to the transformed points
+    densities, densities_derivatives = _project_component_window_gradient(active_grid_centers, grid_size,
+                                                                          points, obj_radii,
+                                                                          kernel_points, kernel_radii)
+
+    # Remove the contributions of elements outside the object's AABB
+    densities = jnp.where(mask, densities, 0.0)
+    densities_derivatives = jnp.where(mask[..., None, None], densities_derivatives, 0.0)
+
+    return window_start, densities, densities_derivatives
+
+
+@partial(custom_vjp, nondiff_argnums=(9,))
+def project_component_pose(grid_centers, grid_size, obj_points, obj_radii, kernel_points, kernel_radii,
+                           reference_point, translation, rotation, window_shape):
+    """
+    Transforms an object to a pose and projects it to the grid with an analytic reverse-mode derivative.
+
+    The object points are transformed with transform_points and projected with a fixed-shape window
+    like project_component_windowed. The derivative with respect to translation and rotation is computed
+    from the overlap-volume derivative over the active window only, so a gradient costs about as much as
+    one forward projection. The other inputs are treated as constants.
 
     Parameters:
     ----------
-    grid_centers : array, shape (nx, ny, nz, nk, 3)
+    grid_centers : array, shape (nx, ny, nz, 1, 3)
+        Grid element centers.
+    grid_size : float
+        Size of each grid element.
+    obj_points : array, shape (no, 3)
+        Object points in the reference pose.
+    obj_radii : array, shape (no, 1)
+        Radii of the object points.
+    kernel_points : array, shape (nk, 3)
+        Points representing the mesh kernel.
+    kernel_radii : array, shape (nk, 1)
+        Radii of kernel points.
+    reference_point : array, shape (3,)
+        Point about which the object is rotated.
+    translation : array, shape (3,)
+        Translation of the object.
+    rotation : array, shape (3,)
+        Rotation angles of the object in radians.
+    window_shape : tuple of int
+        Static shape of the active window, see get_window_shape.
+
+    Returns:
+    --------
+    all_densities : array, shape (nx, ny, nz)
+        Pseudo-densities calculated for each grid element.
+    """
+
+    grid_nx, grid_ny, grid_nz, _, _ = grid_centers.shape
+
+    window_start, densities, _ = _project_component_pose_gradient(grid_centers, grid_size, obj_points, obj_radii,
+                                                                  kernel_points, kernel_radii, reference_point,
+                                                                  translation, rotation, window_shape)
+
+    # Store the densities in the output array
+    all_densities = jnp.zeros((grid_nx, grid_ny, grid_nz), dtype=get_storage_dtype())
+    all_densities = lax.dynamic_update_slice(all_densities, densities, window_start)
+
+    return all_densities
+
+
+def _project_component_pose_fwd(grid_centers, grid_size, obj_points, obj_radii, kernel_points, kernel_radii,
+                                reference_point, translation, rotation, window_shape):
+
+    grid_nx, grid_ny, grid_nz, _, _ = grid_centers.shape
+
+    window_start, densities, densities_derivatives = _project_component_pose_gradient(grid_centers, grid_size,
+                                                                                      obj_points, obj_radii,
+                                                                                      kernel_points, kernel_radii,
+                                                                                      reference_point, translation,
+                                                                                      rotation, window_shape)
+
+    # Store the densities in the output array
+    all_densities = jnp.zeros((grid_nx, grid_ny, grid_nz), dtype=get_storage_dtype())
+    all_densities = lax.dynamic_update_slice(all_densities, densities, window_start)
+
+    residuals = (window_start, densities_derivatives, obj_points, reference_point, translation, rotation)
+
+    return all_densities, residuals
+
+
+def _project_component_pose_bwd(window_shape, residuals, cotangent):
+
+    window_start, densities_derivatives, obj_points, reference_point, translation, rotation = residuals
+
+    # Only the active window depends on the pose
+    window_cotangent = lax.dynamic_slice(cotangent, window_start, window_shape)
+    points_cotangent = jnp.einsum('xyz,xyzjc->jc', window_cotangent, densities_derivatives)
+
+    # Chain the point derivatives to the pose
+    _, transform_vjp = vjp(lambda t, r: _transform_points_storage(obj_points, reference_point, t, r),
+                           translation, rotation)
+    translation_cotangent, rotation_cotangent = transform_vjp(points_cotangent)
+
+    return None, None, None, None, None, None, None, translation_cotangent, rotation_cotangent
+
+
+project_component_pose.defvjp(_project_component_pose_fwd, _project_component_pose_bwd)
+
+
+@partial(jit, static_argnames='window_shape')
+def project_component_pose_jacobian(grid_centers, grid_size, obj_points, obj_radii, kernel_points, kernel_radii,
+                                    reference_point, translation, rotation, window_shape):
+    """
+    Calculates the pseudo-densities of a posed object and their sparse Jacobian with respect to the pose.
+
+    Only the elements of the active window have nonzero derivatives, so the Jacobian is returned in the
+    (rows, cols, values) format that OpenMDAO uses for sparse partials of the flattened densities.
+
+    Parameters:
+    ----------
+    See project_component_pose.
+
+    Returns:
+    --------
+    all_densities : array, shape (nx, ny, nz)
+        Pseudo-densities calculated for each grid element.
+    rows : array, shape (wx * wy * wz * 3,)
+        Flattened grid element indices of the Jacobian entries.
+    cols : array, shape (wx * wy * wz * 3,)
+        Pose component (x, y, z) of the Jacobian entries.
+    jac_translation : array, shape (wx * wy * wz * 3,)
+        Derivatives of the densities with respect to the translation.
+    jac_rotation : array, shape (wx * wy * wz * 3,)
+        Derivatives of the densities with respect to the rotation.
+    """
+
+    grid_nx, grid_ny, grid_nz, _, _ = grid_centers.shape
+    window_nx, window_ny, window_nz = window_shape
+
+    window_start, densities, densities_derivatives = _project_component_pose_gradient(grid_centers, grid_size,
+                                                                                      obj_points, obj_radii,
+                                                                                      kernel_points, kernel_radii,
+                                                                                      reference_point, translation,
+                                                                                      rotation, window_shape)
+
+    # Store the densities in the output array
+    all_densities = jnp.zeros((grid_nx, grid_ny, grid_nz), dtype=get_storage_dtype())
+    all_densities = lax.dynamic_update_slice(all_densities, densities, window_start)
+
+    # Calculate the derivatives of the transformed points with respect to the rotation
+    obj_count, _ = obj_points.shape
+    points_rotation_derivatives = jacfwd(transform_points, argnums=3)(obj_points, reference_point, translation, rotation)
+    points_rotation_derivatives = points_rotation_derivatives.reshape(obj_count, 3, 3)
+
+    # Chain the point derivatives to the pose, d(points)/d(translation) is the identity
+    jac_translation = jnp.sum(densities_derivatives, axis=3)
+    jac_rotation = jnp.einsum('xyzjc,jck->xyzk', densities_derivatives, points_rotation_derivatives)
+
+    # Number the window's elements in the flattened grid
+    i1, j1, k1 = window_start
+    ii, jj, kk = jnp.meshgrid(i1 + jnp.arange(window_nx), j1 + jnp.arange(window_ny), k1 + jnp.arange(window_nz),
+                              indexing='ij')
+    element_rows = (ii * grid_ny + jj) * grid_nz + kk
+    rows = jnp.repeat(element_rows.reshape(-1), 3)
+    cols = jnp.tile(jnp.arange(3), element_rows.size)
+
+    return all_densities, rows, cols, jac_translation.reshape(-1), jac_rotation.reshape(-1)
+
+
+def create_neighbor_list(grid_centers, grid_size, obj_points, obj_radii, kernel_points, kernel_radii):
+    """
+    Finds the object spheres that can overlap the kernel of each grid element.
+
+    The candidate elements of each object sphere are found with a k-d tree of the element centers,
+    searching within the sphere's own radius plus the reach of the element's kernel spheres, i.e., the
+    farthest kernel surface from the element center. The number of candidates thus follows the actual
+    overlaps, even if a few large spheres are mixed with many small ones.
+
+    Parameters:
+    ----------
+    grid_centers : array, shape (nx, ny, nz, 1, 3)
+        Grid element centers.
+    grid_size : float
+        Size of each grid element.
+    obj_points : array, shape (no, 3)
+        Object points in 3D space.
+    obj_radii : array, shape (no, 1)
+        Radii of the object points.
+    kernel_points : array, shape (nk, 3)
+        Points representing the mesh kernel.
+    kernel_radii : array, shape (nk, 1)
+        Radii of kernel points.
+
+    Returns:
+    --------
+    element_indices : array, shape (na, 3)
+        Grid indices of the elements that overlap at least one object sphere.
+    neighbors : array, shape (na, nn)
+        Object sphere indices for each element, padded with zeros.
+    neighbor_mask : array, shape (na, nn)
+        True for the valid entries of neighbors.
+    """
+
+    grid_centers = np.asarray(grid_centers)
+    grid_size = float(grid_size)
+    obj_points = np.asarray(obj_points).reshape(-1, 3)
+    obj_radii = np.asarray(obj_radii).reshape(-1)
+    kernel_points = np.asarray(kernel_points).reshape(-1, 3)
+    kernel_radii = np.asarray(kernel_radii).reshape(-1)
+
+    # Find the candidate elements within the object's AABB
+    i1, i2, j1, j2, k1, k2 = get_aabb_indices(grid_centers, grid_size, obj_points, obj_radii.reshape(-1, 1))
+    ii, jj, kk = np.meshgrid(np.arange(i1, i2 + 1), np.arange(j1, j2 + 1), np.arange(k1, k2 + 1), indexing='ij')
+    element_indices = np.stack([ii.ravel(), jj.ravel(), kk.ravel()], axis=1)
+    element_centers = grid_centers[ii, jj, kk, 0].reshape(-1, 3)
+
+    # Calculate how far a kernel sphere can reach from its element center
+    kernel_reach = grid_size * np.max(np.linalg.norm(kernel_points, axis=1) + kernel_radii)
+
+    # Find the elements within reach of each sphere
+    tree = cKDTree(element_centers)
+    neighbors = tree.query_ball_point(obj_points, obj_radii + kernel_reach, return_sorted=False)
+    counts = np.array([len(sphere_neighbors) for sphere_neighbors in neighbors])
+    sphere_ids = np.repeat(np.arange(obj_points.shape[0]), counts)
+    element_ids = np.concatenate(neighbors).astype(int) if counts.sum() > 0 else np.zeros(0, dtype=int)
+
+    # Keep the pairs that are close enough to overlap
+    pair_distances = np.linalg.norm(element_centers[element_ids] - obj_points[sphere_ids], axis=1)
+    is_close = pair_distances < obj_radii[sphere_ids] + kernel_reach
+    element_ids = element_ids[is_close]
+    sphere_ids = sphere_ids[is_close]
+
+    # Only keep the elements that have neighbors
+    active_elements, element_ids, neighbor_counts = np.unique(element_ids, return_inverse=True, return_counts=True)
+    n_active = active_elements.shape[0]
+    n_neighbors = np.max(neighbor_counts, initial=0)
+
+    # Pad the neighbors of each element to a common length
+    order = np.argsort(element_ids, kind='stable')
+    element_ids = element_ids[order]
+    sphere_ids = sphere_ids[order]
+    slots = np.arange(element_ids.shape[0]) - np.repeat(np.cumsum(neighbor_counts) - neighbor_counts, neighbor_counts)
+
+    neighbors = np.zeros((n_active, n_neighbors), dtype=int)
+    neighbor_mask = np.zeros((n_active, n_neighbors), dtype=bool)
+    neighbors[element_ids, slots] = sphere_ids
+    neighbor_mask[element_ids, slots] = True
+
+    return element_indices[active_elements], neighbors, neighbor_mask
+
+
+def project_component_neighbors(grid_centers, grid_size, obj_points, obj_radii, kernel_points, kernel_radii,
+                                neighbor_list):
+    """
+    Projects object points to the grid using a precomputed neighbor list.
+
+    Each kernel sphere is only compared with the object spheres listed for its element, so the cost
+    scales with the number of overlapping element-sphere pairs rather than the AABB volume times the
+    number of spheres. The densities and their derivatives with respect to the object points match
+    project_component as long as the neighbor list was created for the same pose.
+
+    Parameters:
+    ----------
+    grid_centers : array, shape (nx, ny, nz, 1, 3)
         Grid element centers.
     grid_size : float
         Size of each grid element.
@@ -33,15 +1030,17 @@ def project_component(grid_centers, grid_size, obj_points, obj_radii, kernel_poi
         Points representing the mesh kernel.
     kernel_radii : array, shape (nk, 1)
         Radii of kernel points.
+    neighbor_list : tuple
+        The output of create_neighbor_list.
 
     Returns:
     --------
     all_densities : array, shape (nx, ny, nz)
         Pseudo-densities calculated for each grid element.
-    kernel_points : array, shape (nxs, nys, nzs, nk, 3)
-        Kernel points in the grid's active area.
-    kernel_radii : array, shape (nxs, nys, nzs, nk, 1)
-        Kernel radii in the grid's active area.
+    kernel_points : array, shape (na, nk, 3)
+        Kernel points of the active elements.
+    kernel_radii : array, shape (na, nk, 1)
+        Kernel radii of the active elements.
     """
 
     # Check the input shapes
@@ -53,64 +1052,73 @@ def project_component(grid_centers, grid_size, obj_points, obj_radii, kernel_poi
     assert_shape(kernel_radii, (None, 1))
 
     # Check the input types
-    assert_type(grid_centers, "float64")
-    assert_type(grid_size, "float64")
-    assert_type(obj_points, "float64")
-    assert_type(obj_radii, "float64")
-    assert_type(kernel_points, "float64")
-    assert_type(kernel_radii, "float64")
+    assert_type(grid_centers, get_storage_dtype())
+    assert_type(grid_size, get_storage_dtype())
+    assert_type(obj_points, get_storage_dtype())
+    assert_type(obj_radii, get_storage_dtype())
+    assert_type(kernel_points, get_storage_dtype())
+    assert_type(kernel_radii, get_storage_dtype())
 
-    # Unpack the AABB indices
-    i1, i2, j1, j2, k1, k2 = get_aabb_indices(grid_centers, grid_size, obj_points, obj_radii)
+    # Unpack the neighbor list
+    element_indices, neighbors, neighbor_mask = neighbor_list
+    ii, jj, kk = element_indices.T
 
     # Extract grid dimensions
     grid_nx, grid_ny, grid_nz, _, _ = grid_centers.shape
-    aabb_nx, aabb_ny, aabb_nz = (i2 - i1 + 1), (j2 - j1 + 1), (k2 - k1 + 1)
-    obj_count, _ = obj_points.shape
-    kernel_count, _ = kernel_points.shape
-
-    # Initialize the output density array
-    all_densities = jnp.zeros((grid_nx, grid_ny, grid_nz), dtype='float64')
-
-    # Extract the active grid region within the object's AABB
-    active_grid_centers = grid_centers[i1:i2 + 1, j1:j2 + 1, k1:k2 + 1]
 
-    # Apply the kernel to active grid elements
+    # Apply the kernel to the active elements
+    active_grid_centers = grid_centers[ii, jj, kk].reshape(-1, 1, 1, 1, 3)
     kernel_points, kernel_radii = apply_kernel(active_grid_centers, grid_size, kernel_points, kernel_radii)
+    kernel_points = kernel_points.reshape(-1, kernel_points.shape[3], 3)
+    kernel_radii = kernel_radii.reshape(-1, kernel_radii.shape[3], 1)
+
+    # Calculate the overlaps in the compute precision
+    kernel_points_c, kernel_radii_c, obj_points_c, obj_radii_c = to_compute_dtype(kernel_points, kernel_radii,
+                                                                                  obj_points, obj_radii)
 
     # Calculate sample volumes and element volumes
-    sample_volumes = (4 / 3) * jnp.pi * kernel_radii ** 3
-    element_volumes = jnp.sum(sample_volumes, axis=3, keepdims=True)
+    sample_volumes = (4 / 3) * jnp.pi * kernel_radii_c ** 3
+    element_volumes = jnp.sum(sample_volumes, axis=1).astype(get_storage_dtype())
 
-    # Expand dimensions for broadcasting
-    # Transpose object radii for broadcasting
-    kernel_points_bc = kernel_points.reshape(aabb_nx, aabb_ny, aabb_nz, kernel_count, 1, 3)
-    obj_points_bc = obj_points.reshape(1, 1, 1, 1, obj_count, 3)
-    obj_radii_bc = obj_radii.T.reshape(1, 1, 1, 1, obj_count)
+    # Gather the neighboring object spheres of each element
+    neighbor_points = obj_points_c[neighbors]
+    neighbor_radii = obj_radii_c[neighbors, 0]
 
     # Compute distances between kernel and object points
-    distances = minimum_distances_points_segments(kernel_points_bc, obj_points_bc, obj_points_bc)
-
-    # Calculate volume overlaps
-    overlaps = volume_intersection_two_spheres(obj_radii_bc, kernel_radii, distances)
-    element_overlaps = jnp.sum(overlaps, axis=4, keepdims=True)
+    distances = jnp.linalg.norm(kernel_points_c[:, :, None, :] - neighbor_points[:, None, :, :], axis=-1)
 
-    # Calculate volume fractions
-    volume_fractions = (element_overlaps / element_volumes).reshape(aabb_nx, aabb_ny, aabb_nz, kernel_count)
+    # Calculate volume overlaps, ignoring the padded neighbors
+    overlaps = volume_intersection_two_spheres(neighbor_radii[:, None, :], kernel_radii_c, distances)
+    overlaps = jnp.where(neighbor_mask[:, None, :], overlaps, 0.0).astype(get_storage_dtype())
+    element_overlaps = jnp.sum(overlaps, axis=2)
 
-    # Sum fractions to compute pseudo-densities
-    densities = jnp.sum(volume_fractions, axis=3)
+    # Sum the volume fractions to compute pseudo-densities
+    densities = jnp.sum(element_overlaps / element_volumes, axis=1)
 
     # Store the densities in the output array
-    all_densities = all_densities.at[i1:i2 + 1, j1:j2 + 1, k1:k2 + 1].set(densities)
+    all_densities = jnp.zeros((grid_nx, grid_ny, grid_nz), dtype=get_storage_dtype())
+    all_densities = all_densities.at[ii, jj, kk].set(densities)
 
     return all_densities, kernel_points, kernel_radii
 
 
+def project_component_cell_list(grid_centers, grid_size, obj_points, obj_radii, kernel_points, kernel_radii):
+    """
+    Projects object points to the grid using a neighbor list instead of the dense kernel-sphere broadcast.
+
+    See create_neighbor_list and project_component_neighbors.
+    """
+
+    neighbor_list = create_neighbor_list(grid_centers, grid_size, obj_points, obj_radii, kernel_points, kernel_radii)
+
+    return project_component_neighbors(grid_centers, grid_size, obj_points, obj_radii, kernel_points, kernel_radii,
+                                       neighbor_list)
+
 
 def project_interconnect(grid_centers, grid_size,
                          cyl_points, cyl_radius,
-                         kernel_points, kernel_radii):
+                         kernel_points, kernel_radii,
+                         max_bytes=None):
     """
     Projects the points to the mesh and calculates the pseudo-densities
 
@@ -128,6 +1136,8 @@ def project_interconnect(grid_centers, grid_size,
     cylinder_radii_expanded: (1, 1, 1, 1, n_segments) tensor
 
     pseudo_densities: (n_el_x, n_el_y, n_el_z) tensor
+
+    max_bytes: Optional memory budget, see project_component
     """
 
     # Create the cylinders
@@ -138,16 +1148,42 @@ def project_interconnect(grid_centers, grid_size,
 
     # Extract grid dimensions
     grid_nx, grid_ny, grid_nz, _, _ = grid_centers.shape
-    aabb_nx, aabb_ny, aabb_nz = (i2 - i1 + 1), (j2 - j1 + 1), (k2 - k1 + 1)
-    cyl_count, _ = cyl_rad.shape
-    kernel_count, _ = kernel_points.shape
 
     # Initialize the output density array
-    all_densities = jnp.zeros((grid_nx, grid_ny, grid_nz), dtype='float64')
+    all_densities = jnp.zeros((grid_nx, grid_ny, grid_nz), dtype=get_storage_dtype())
 
     # Extract the active grid region within the object's AABB
     active_grid_centers = grid_centers[i1:i2 + 1, j1:j2 + 1, k1:k2 + 1]
 
+    # Project the interconnect onto the active grid region
+    if max_bytes is None:
+        densities, kernel_points, kernel_radii = _project_interconnect_window(active_grid_centers, grid_size,
+                                                                              cyl_starts, cyl_stops, cyl_rad,
+                                                                              kernel_points, kernel_radii)
+    else:
+        slab_size = get_slab_size(active_grid_centers, kernel_points, cyl_starts, max_bytes)
+        densities = _project_in_slabs(_project_interconnect_slab, active_grid_centers, slab_size,
+                                      grid_size, cyl_starts, cyl_stops, cyl_rad, kernel_points, kernel_radii)
+        kernel_points, kernel_radii = apply_kernel(active_grid_centers, grid_size, kernel_points, kernel_radii)
+
+    # Store the densities in the output array
+    all_densities = all_densities.at[i1:i2 + 1, j1:j2 + 1, k1:k2 + 1].set(densities)
+
+    return all_densities, kernel_points, kernel_radii
+
+
+def _project_interconnect_window(active_grid_centers, grid_size,
+                                 cyl_starts, cyl_stops, cyl_rad,
+                                 kernel_points, kernel_radii):
+    """
+    Calculates the pseudo-densities of the grid elements in an active window for a set of cylinders.
+    """
+
+    # Extract the window dimensions
+    aabb_nx, aabb_ny, aabb_nz, _, _ = active_grid_centers.shape
+    cyl_count, _ = cyl_rad.shape
+    kernel_count, _ = kernel_points.shape
+
     # Apply the kernel to active grid elements
     kernel_points, kernel_radii = apply_kernel(active_grid_centers, grid_size, kernel_points, kernel_radii)
 
@@ -155,9 +1191,13 @@ def project_interconnect(grid_centers, grid_size,
     # sample_volumes = (4 / 3) * jnp.pi * kernel_radii ** 3
     # element_volumes = jnp.sum(sample_volumes, axis=3, keepdims=True)
 
+    # Calculate the densities in the compute precision
+    kernel_points_c, kernel_radii_c, cyl_starts, cyl_stops, cyl_rad = to_compute_dtype(kernel_points, kernel_radii,
+                                                                                       cyl_starts, cyl_stops, cyl_rad)
+
     # Expand the arrays to allow broadcasting
     # Transpose object radii for broadcasting
-    kernel_points_bc = kernel_points.reshape(aabb_nx, aabb_ny, aabb_nz, kernel_count, 1, 3)
+    kernel_points_bc = kernel_points_c.reshape(aabb_nx, aabb_ny, aabb_nz, kernel_count, 1, 3)
     cyl_starts_bc = cyl_starts.reshape(1, 1, 1, 1, cyl_count, 3)
     cyl_stops_bc = cyl_stops.reshape(1, 1, 1, 1, cyl_count, 3)
     cyl_rad_bc = cyl_rad.T.reshape(1, 1, 1, 1, cyl_count)
@@ -166,7 +1206,10 @@ def project_interconnect(grid_centers, grid_size,
     distances = cyl_rad_bc - minimum_distances_points_segments(kernel_points_bc, cyl_starts_bc, cyl_stops_bc)
 
     # Fix rho for mesh_radii?
-    densities = density(distances, kernel_radii)
+    densities = density(distances, kernel_radii_c)
+
+    # Accumulate in the storage precision
+    densities = densities.astype(get_storage_dtype())
 
     # Sum densities across all cylinders
     # Combine the pseudo densities for all cylinders in each kernel sphere
@@ -176,8 +1219,170 @@ def project_interconnect(grid_centers, grid_size,
     # Combine the pseudo densities for all kernel spheres in one grid
     densities = jnp.sum(densities, axis=3)
 
-    # Store the densities in the output array
-    all_densities = all_densities.at[i1:i2 + 1, j1:j2 + 1, k1:k2 + 1].set(densities)
+    return densities, kernel_points, kernel_radii
+
+
+def _project_interconnect_slab(slab_grid_centers, grid_size, cyl_starts, cyl_stops, cyl_rad,
+                               kernel_points, kernel_radii):
+    """
+    Calculates the pseudo-densities of one slab of the active grid region for a set of cylinders.
+    """
+
+    densities, _, _ = _project_interconnect_window(slab_grid_centers, grid_size, cyl_starts, cyl_stops, cyl_rad,
+                                                   kernel_points, kernel_radii)
+
+    return densities
+
+
+def create_interconnect_pair_list(grid_centers, grid_size, cyl_points, cyl_radius, kernel_points, kernel_radii):
+    """
+    Finds the grid elements that each cylinder segment of an interconnect can reach.
+
+    Each segment only visits the elements of its own AABB instead of the whole interconnect's AABB,
+    and an element is kept if its center lies within the cylinder radius plus the reach of the
+    element's kernel spheres. Kernel spheres farther than that from the segment have zero density.
+    The segment windows are clipped to the interconnect's AABB indices, which bound the elements that
+    project_interconnect evaluates, so the culling does not change the result.
+
+    Parameters:
+    ----------
+    grid_centers : array, shape (nx, ny, nz, 1, 3)
+        Grid element centers.
+    grid_size : float
+        Size of each grid element.
+    cyl_points : array, shape (ns + 1, 3)
+        Interconnect control points.
+    cyl_radius : float
+        Radius of the interconnect.
+    kernel_points : array, shape (nk, 3)
+        Points representing the mesh kernel.
+    kernel_radii : array, shape (nk, 1)
+        Radii of kernel points.
+
+    Returns:
+    --------
+    element_indices : array, shape (np, 3)
+        Grid indices of the element of each element-segment pair.
+    segment_indices : array, shape (np,)
+        Segment index of each element-segment pair.
+    """
+
+    grid_centers = np.asarray(grid_centers)
+    grid_size = float(grid_size)
+    cyl_points = np.asarray(cyl_points).reshape(-1, 3)
+    cyl_radius = float(cyl_radius)
+    kernel_points = np.asarray(kernel_points).reshape(-1, 3)
+    kernel_radii = np.asarray(kernel_radii).reshape(-1)
+
+    origin = grid_centers[0, 0, 0, 0] - grid_size / 2
+
+    # Bound the windows by the elements that project_interconnect evaluates
+    i1, i2, j1, j2, k1, k2 = get_aabb_indices(grid_centers, grid_size, cyl_points, cyl_radius)
+    aabb_lower = np.array([i1, j1, k1])
+    aabb_upper = np.array([i2, j2, k2])
+
+    # Calculate how far a kernel sphere can reach from its element center
+    kernel_reach = grid_size * np.max(np.linalg.norm(kernel_points, axis=1) + kernel_radii)
+    cutoff = cyl_radius + kernel_reach
+
+    element_indices = []
+    segment_indices = []
+    for segment_index, (start, stop) in enumerate(zip(cyl_points[:-1], cyl_points[1:])):
+
+        # Find the elements within the segment's AABB
+        lower = np.floor((np.minimum(start, stop) - cutoff - origin) / grid_size).astype(int)
+        upper = np.floor((np.maximum(start, stop) + cutoff - origin) / grid_size).astype(int)
+        lower = np.clip(lower, aabb_lower, aabb_upper)
+        upper = np.clip(upper, aabb_lower, aabb_upper)
+
+        ii, jj, kk = np.meshgrid(np.arange(lower[0], upper[0] + 1),
+                                 np.arange(lower[1], upper[1] + 1),
+                                 np.arange(lower[2], upper[2] + 1), indexing='ij')
+        indices = np.stack([ii.ravel(), jj.ravel(), kk.ravel()], axis=1)
+        centers = grid_centers[ii, jj, kk, 0].reshape(-1, 3)
+
+        # Keep the elements whose kernel can reach the cylinder
+        direction = stop - start
+        length_squared = np.dot(direction, direction)
+        t = np.clip((centers - start) @ direction / length_squared, 0, 1) if length_squared > 0 else 0
+        closest_points = start + np.reshape(t, (-1, 1)) * direction
+        is_close = np.linalg.norm(centers - closest_points, axis=1) <= cutoff
+
+        element_indices.append(indices[is_close])
+        segment_indices.append(np.full(np.sum(is_close), segment_index))
+
+    return np.concatenate(element_indices), np.concatenate(segment_indices)
+
+
+def project_interconnect_culled(grid_centers, grid_size, cyl_points, cyl_radius, kernel_points, kernel_radii,
+                                pair_list=None):
+    """
+    Projects an interconnect to the grid by evaluating each cylinder segment only on the elements it can reach.
+
+    The densities match project_interconnect, but the cost scales with the interconnect's volume rather
+    than the volume of its AABB, which is mostly empty for long diagonal interconnects.
+
+    Parameters:
+    ----------
+    grid_centers : array, shape (nx, ny, nz, 1, 3)
+        Grid element centers.
+    grid_size : float
+        Size of each grid element.
+    cyl_points : array, shape (ns + 1, 3)
+        Interconnect control points.
+    cyl_radius : float
+        Radius of the interconnect.
+    kernel_points : array, shape (nk, 3)
+        Points representing the mesh kernel.
+    kernel_radii : array, shape (nk, 1)
+        Radii of kernel points.
+    pair_list : tuple, optional
+        The output of create_interconnect_pair_list, which is created for the current control points if not given.
+
+    Returns:
+    --------
+    all_densities : array, shape (nx, ny, nz)
+        Pseudo-densities calculated for each grid element.
+    kernel_points : array, shape (np, nk, 3)
+        Kernel points of the element of each element-segment pair.
+    kernel_radii : array, shape (np, nk, 1)
+        Kernel radii of the element of each element-segment pair.
+    """
+
+    if pair_list is None:
+        pair_list = create_interconnect_pair_list(grid_centers, grid_size, cyl_points, cyl_radius,
+                                                  kernel_points, kernel_radii)
+
+    # Unpack the pair list
+    element_indices, segment_indices = pair_list
+    ii, jj, kk = element_indices.T
+
+    # Extract grid dimensions
+    grid_nx, grid_ny, grid_nz, _, _ = grid_centers.shape
+
+    # Apply the kernel to the element of each pair
+    pair_grid_centers = grid_centers[ii, jj, kk].reshape(-1, 1, 1, 1, 3)
+    kernel_points, kernel_radii = apply_kernel(pair_grid_centers, grid_size, kernel_points, kernel_radii)
+    kernel_points = kernel_points.reshape(-1, kernel_points.shape[3], 3)
+    kernel_radii = kernel_radii.reshape(-1, kernel_radii.shape[3], 1)
+
+    # Gather the segment of each pair
+    cyl_starts = cyl_points[:-1][segment_indices].reshape(-1, 1, 3)
+    cyl_stops = cyl_points[1:][segment_indices].reshape(-1, 1, 3)
+
+    # Calculate the signed distances and densities of the kernel spheres in the compute precision
+    kernel_points_c, kernel_radii_c, cyl_starts, cyl_stops, cyl_radius = to_compute_dtype(kernel_points, kernel_radii,
+                                                                                          cyl_starts, cyl_stops,
+                                                                                          cyl_radius)
+    distances = cyl_radius - minimum_distances_points_segments(kernel_points_c, cyl_starts, cyl_stops)
+    densities = density(distances, kernel_radii_c[..., 0]).astype(get_storage_dtype())
+
+    # Combine the pseudo densities for all kernel spheres of each pair
+    densities = jnp.sum(densities, axis=1)
+
+    # Scatter-add the contribution of each pair to its element
+    all_densities = jnp.zeros((grid_nx, grid_ny, grid_nz), dtype=get_storage_dtype())
+    all_densities = all_densities.at[ii, jj, kk].add(densities)
 
     return all_densities, kernel_points, kernel_radii
 
@@ -247,11 +1452,8 @@ def combine_densities(*densities, min_density=1e-3, penalty_factor=3):
         Combined density values.
     """
 
-    # Stack the densities along the last axis
-    densities = jnp.stack(densities, axis=3)
-
-    # Combine the densities
-    combined_density = kreisselmeier_steinhauser_max(densities, axis=3)
+    # Combine the densities one object at a time instead of stacking them
+    combined_density = kreisselmeier_steinhauser_max_online(densities)
 
     # Apply Solid Isotropic Material Penalization (SIMP) to the densities
     combined_density = penalize_densities(combined_density, penalty_factor=penalty_factor)
@@ -0,0 +1,62 @@
+"""Windowed densities
+
+Stores the pseudo-densities of an object as a dense block at an offset in the grid instead of a full-grid array.
+"""
+
+from typing import NamedTuple
+
+import jax.numpy as jnp
+from jax import lax
+
+
+class WindowedDensity(NamedTuple):
+    """
+    Pseudo-densities of one object within its active window.
+
+    Attributes:
+    - offset: The grid indices (i1, j1, k1) of the window's first element, shape (3,).
+    - values: The pseudo-densities of the window, shape (wx, wy, wz).
+    """
+
+    offset: jnp.ndarray
+    values: jnp.ndarray
+
+
+def densify(windowed_density, grid_shape):
+    """
+    Expands a windowed density to a full-grid array.
+
+    Parameters:
+    - windowed_density: The WindowedDensity to expand.
+    - grid_shape: The grid dimensions (nx, ny, nz).
+
+    Returns:
+    - The pseudo-densities of every grid element, shape (nx, ny, nz).
+    """
+
+    all_densities = jnp.zeros(grid_shape, dtype=windowed_density.values.dtype)
+    all_densities = lax.dynamic_update_slice(all_densities, windowed_density.values, tuple(windowed_density.offset))
+
+    return all_densities
+
+
+def aggregate_windowed_densities(windowed_densities, grid_shape):
+    """
+    Sums the windowed densities of several objects by scatter-adding each window into the grid.
+
+    Parameters:
+    - windowed_densities: A sequence of WindowedDensity, whose windows may have different shapes.
+    - grid_shape: The grid dimensions (nx, ny, nz).
+
+    Returns:
+    - The summed pseudo-densities, shape (nx, ny, nz).
+    """
+
+    aggregate_densities = jnp.zeros(grid_shape, dtype=windowed_densities[0].values.dtype)
+
+    for offset, values in windowed_densities:
+        offset = tuple(offset)
+        window = lax.dynamic_slice(aggregate_densities, offset, values.shape)
+        aggregate_densities = lax.dynamic_update_slice(aggregate_densities, window + values, offset)
+
+    return aggregate_densities
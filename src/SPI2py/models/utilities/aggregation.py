@@ -1,5 +1,9 @@
+from functools import partial
+
 import jax.numpy as jnp
-from chex import assert_shape, assert_type
+from jax import custom_vjp
+
+from .validation import assert_shape, assert_type
 
 
 def kreisselmeier_steinhauser_max(constraints, rho=100, axis=None):
@@ -59,3 +63,89 @@ def kreisselmeier_steinhauser_min(constraints, rho=100, axis=None):
     return ks_aggregated_min
 
 
+def kreisselmeier_steinhauser_max_init(constraints):
+    """
+    Starts an online KS aggregation from the first array of constraint values.
+
+    Returns:
+    - The accumulator state (running maximum, running sum of the shifted exponentials).
+    """
+
+    return constraints, jnp.ones_like(constraints)
+
+
+def kreisselmeier_steinhauser_max_update(state, constraints, rho=100):
+    """
+    Folds one array of constraint values into an online KS aggregation.
+
+    The running sum is rescaled whenever the running maximum increases, so no exponential overflows.
+
+    Parameters:
+    - state: The accumulator state from kreisselmeier_steinhauser_max_init or a previous update.
+    - constraints: A JAX array with the same shape as the state arrays.
+    - rho: A positive scalar that controls the sharpness of the approximation.
+
+    Returns:
+    - The updated accumulator state.
+    """
+
+    running_max, running_sum = state
+
+    new_max = jnp.maximum(running_max, constraints)
+    new_sum = running_sum * jnp.exp(rho * (running_max - new_max)) + jnp.exp(rho * (constraints - new_max))
+
+    return new_max, new_sum
+
+
+def kreisselmeier_steinhauser_max_finalize(state, rho=100):
+    """
+    Returns the smooth maximum of all the arrays folded into an online KS aggregation.
+    """
+
+    running_max, running_sum = state
+
+    return running_max + jnp.log(running_sum) / rho
+
+
+@partial(custom_vjp, nondiff_argnums=(1,))
+def kreisselmeier_steinhauser_max_online(constraints_list, rho=100):
+    """
+    Computes the element-wise KS maximum of a sequence of arrays without stacking them.
+
+    Equivalent to kreisselmeier_steinhauser_max(jnp.stack(constraints_list), axis=0), but the arrays are
+    folded in one at a time, so the peak memory does not grow with the number of arrays. The VJP is
+    computed from the inputs and the result, so the stacked array is never stored either.
+
+    Parameters:
+    - constraints_list: A sequence of JAX arrays with the same shape.
+    - rho: A positive scalar that controls the sharpness of the approximation.
+
+    Returns:
+    - The smooth maximum of the arrays, with the same shape as each array.
+    """
+
+    state = kreisselmeier_steinhauser_max_init(constraints_list[0])
+    for constraints in constraints_list[1:]:
+        state = kreisselmeier_steinhauser_max_update(state, constraints, rho=rho)
+
+    return kreisselmeier_steinhauser_max_finalize(state, rho=rho)
+
+
+def _kreisselmeier_steinhauser_max_online_fwd(constraints_list, rho):
+    ks_aggregated_max = kreisselmeier_steinhauser_max_online(constraints_list, rho)
+    return ks_aggregated_max, (constraints_list, ks_aggregated_max)
+
+
+def _kreisselmeier_steinhauser_max_online_bwd(rho, residuals, cotangent):
+
+    constraints_list, ks_aggregated_max = residuals
+
+    # The weight of each array is its softmax share, exp(rho * (g_i - KS))
+    gradients = type(constraints_list)(cotangent * jnp.exp(rho * (constraints - ks_aggregated_max))
+                                       for constraints in constraints_list)
+
+    return (gradients,)
+
+
+kreisselmeier_steinhauser_max_online.defvjp(_kreisselmeier_steinhauser_max_online_fwd,
+                                            _kreisselmeier_steinhauser_max_online_bwd)
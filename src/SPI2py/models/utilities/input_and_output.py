@@ -1,5 +1,7 @@
+import numpy as np
 import tomli
 
+
 def read_input_file(input_file_path):
     with open(input_file_path, 'rb') as f:
         input_file = tomli.load(f)
@@ -37,3 +39,17 @@ def read_xyzr_file(filepath, num_spheres=100):
         radii.append(float(r))
 
     return positions, radii
+
+
+def write_xyzr_file(filepath, positions, radii):
+    """
+    Writes the positions and radii of spheres to a .xyzr file that read_xyzr_file can read.
+
+    :param filepath:
+    :param positions: (n, 3) sphere positions
+    :param radii: (n,) or (n, 1) sphere radii
+    """
+
+    xyzr = np.hstack([np.reshape(positions, (-1, 3)), np.reshape(radii, (-1, 1))])
+
+    np.savetxt(filepath, xyzr, fmt='%.17g')
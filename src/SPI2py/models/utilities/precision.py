@@ -0,0 +1,79 @@
+"""Precision policy
+
+Selects the floating-point types used by the projection, distance, and aggregation functions.
+
+- 'float64': Every array is float64 (default).
+- 'float32': Every array is float32.
+- 'mixed': Inputs, outputs, and sums are float64, but distances and overlap volumes are computed in float32.
+
+The policy is read when a function is traced, so set it before running a model. Changing it clears
+JAX's compilation caches so that jitted functions are retraced with the new types.
+"""
+
+import jax
+import jax.numpy as jnp
+
+PRECISIONS = ('float64', 'float32', 'mixed')
+
+_precision = 'float64'
+
+
+def set_precision(precision):
+    """
+    Sets the package-level precision policy.
+
+    Parameters:
+    - precision: One of 'float64', 'float32', or 'mixed'.
+    """
+
+    global _precision
+
+    if precision not in PRECISIONS:
+        raise ValueError(f"Invalid precision '{precision}'. Use one of {PRECISIONS}.")
+
+    if precision != _precision:
+        _precision = precision
+        jax.clear_caches()
+
+
+def get_precision():
+    """
+    Returns the package-level precision policy.
+    """
+
+    return _precision
+
+
+def get_storage_dtype():
+    """
+    Returns the type of the inputs, outputs, and accumulated sums.
+    """
+
+    return 'float32' if _precision == 'float32' else 'float64'
+
+
+def get_compute_dtype():
+    """
+    Returns the type of the element-wise distance and overlap calculations.
+    """
+
+    return 'float64' if _precision == 'float64' else 'float32'
+
+
+def get_kernel_dtype():
+    """
+    Returns the type accepted by the distance and intersection kernels.
+
+    In mixed precision the kernels receive float32 arrays from the projections and float64 arrays from
+    other callers, so any floating type is accepted.
+    """
+
+    return float if _precision == 'mixed' else get_compute_dtype()
+
+
+def to_compute_dtype(*arrays):
+    """
+    Casts arrays to the compute type.
+    """
+
+    return tuple(jnp.asarray(array, dtype=get_compute_dtype()) for array in arrays)
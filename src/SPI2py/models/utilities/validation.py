@@ -0,0 +1,44 @@
+"""Validation
+
+Shape and type assertions for the numerical kernels that can be switched off in production.
+
+- 'strict': Every assertion is checked with chex (default).
+- 'off': The assertions are no-ops.
+
+The mode is read once from the SPI2PY_VALIDATION environment variable when this module is imported, and
+assert_shape and assert_type are bound to either the chex functions or a no-op, so a disabled assertion
+does not check the mode on every call. Set the variable before importing SPI2py.
+"""
+
+import os
+
+import chex
+
+VALIDATION_MODES = ('strict', 'off')
+
+_mode = os.environ.get('SPI2PY_VALIDATION', 'strict')
+
+if _mode not in VALIDATION_MODES:
+    raise ValueError(f"Invalid SPI2PY_VALIDATION value '{_mode}'. Use one of {VALIDATION_MODES}.")
+
+
+def get_validation():
+    """
+    Returns the validation mode.
+    """
+
+    return _mode
+
+
+def _skip_assertion(inputs, expected):
+    """
+    Accepts any inputs without checking them.
+    """
+
+
+if _mode == 'strict':
+    assert_shape = chex.assert_shape
+    assert_type = chex.assert_type
+else:
+    assert_shape = _skip_assertion
+    assert_type = _skip_assertion
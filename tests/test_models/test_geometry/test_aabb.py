@@ -0,0 +1,72 @@
+import numpy as np
+import jax
+import jax.numpy as jnp
+from SPI2py.models.geometry.spheres import get_aabb_indices, get_aabb_indices_from_grid
+from SPI2py.models.physics.distributed.mesh import generate_mesh_vec, create_grid_descriptor
+
+
+def create_test_problem():
+
+    _, _, centers, nx, ny, nz, _, _, _ = generate_mesh_vec(0, 3, 0, 3, 0, 2, element_size=0.25)
+    grid_centers = jnp.array(centers).reshape(nx, ny, nz, 1, 3)
+    grid_size = jnp.array(0.25)
+
+    return grid_centers, grid_size
+
+
+def get_expected_indices(grid_centers, grid_size, obj_points, obj_radii):
+
+    obj_min = np.min(obj_points - obj_radii, axis=0)
+    obj_max = np.max(obj_points + obj_radii, axis=0)
+
+    # Test every element for overlap
+    centers = np.asarray(grid_centers)[:, :, :, 0]
+    half_size = float(grid_size) / 2
+    overlap = np.all((obj_min <= centers + half_size) & (obj_max >= centers - half_size), axis=-1)
+    indices = np.argwhere(overlap)
+
+    return tuple(int(index) for pair in zip(indices.min(axis=0), indices.max(axis=0)) for index in pair)
+
+
+def test_aabb_indices_match_overlap_test():
+
+    grid_centers, grid_size = create_test_problem()
+
+    rng = np.random.default_rng(0)
+    for _ in range(50):
+        obj_points = rng.uniform(0.2, 1.8, (5, 3))
+        obj_radii = rng.uniform(0, 0.5, (5, 1))
+
+        # Snap some objects to element faces
+        if rng.uniform() < 0.3:
+            obj_points = np.round(obj_points * 4) / 4
+            obj_radii = np.round(obj_radii * 4) / 4
+
+        expected = get_expected_indices(grid_centers, grid_size, obj_points, obj_radii)
+        indices = get_aabb_indices(grid_centers, grid_size, jnp.array(obj_points), jnp.array(obj_radii))
+
+        assert tuple(int(index) for index in indices) == expected
+
+
+def test_aabb_indices_are_clamped():
+
+    grid_centers, grid_size = create_test_problem()
+
+    obj_points = jnp.array([[-1.0, 1.5, 5.0]])
+    obj_radii = jnp.array([[0.5]])
+
+    assert get_aabb_indices(grid_centers, grid_size, obj_points, obj_radii) == (0, 0, 3, 8, 7, 7)
+
+
+def test_aabb_indices_jit():
+
+    grid_centers, grid_size = create_test_problem()
+    grid = create_grid_descriptor(grid_centers, grid_size)
+
+    obj_points = jnp.array([[1.0, 1.1, 0.9], [1.6, 1.2, 0.8]])
+    obj_radii = jnp.array([[0.3], [0.2]])
+
+    indices = jax.jit(get_aabb_indices_from_grid)(grid, obj_points, obj_radii)
+    expected = get_aabb_indices(grid_centers, grid_size, obj_points, obj_radii)
+
+    assert tuple(int(index) for index in indices) == expected
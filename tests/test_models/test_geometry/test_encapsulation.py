@@ -1,5 +1,6 @@
 import jax.numpy as jnp
-from SPI2py.models.geometry.intersection import volume_intersection_two_spheres
+import jax
+from SPI2py.models.geometry.intersection import volume_intersection_two_spheres, volume_intersection_two_spheres_derivative
 
 
 def test_perfect_overlap():
@@ -48,3 +49,12 @@ def test_partial_overlap():
     result = volume_intersection_two_spheres(r_1, r_2, d)
     result = jnp.round(result, decimals=2)
     assert jnp.allclose(result, expected)
+
+
+def test_partial_overlap_derivative():
+    r_1 = jnp.array(1.0)
+    r_2 = jnp.array(0.5)
+    d = jnp.array(1.2)
+    expected = jax.grad(volume_intersection_two_spheres, argnums=2)(r_1, r_2, d)
+    result = volume_intersection_two_spheres_derivative(r_1, r_2, d)
+    assert jnp.allclose(result, expected)
@@ -0,0 +1,76 @@
+import logging
+
+import numpy as np
+import jax
+import jax.numpy as jnp
+from SPI2py.models.geometry.intersection import (total_overlap_volume, create_overlap_pair_list,
+                                                 total_overlap_volume_pairs)
+
+
+def create_test_problem(n_spheres=400):
+
+    rng = np.random.default_rng(0)
+    centers = jnp.array(rng.uniform(0, 1, (n_spheres, 3)))
+    radii = jnp.array(rng.uniform(0.01, 0.08, (n_spheres, 1)))
+
+    return centers, radii
+
+
+def test_pair_list_finds_every_overlap():
+
+    centers, radii = create_test_problem()
+
+    first, second = create_overlap_pair_list(centers, radii)
+
+    # Compare with every pair
+    c = np.asarray(centers)
+    r = np.asarray(radii).reshape(-1)
+    distances = np.linalg.norm(c[:, None] - c[None], axis=-1)
+    i, j = np.nonzero(np.triu(distances < r[:, None] + r[None], k=1))
+
+    expected = {(a, b) for a, b in zip(i, j)}
+    pairs = {(min(a, b), max(a, b)) for a, b in zip(first, second)}
+    assert pairs == expected
+    assert len(first) == len(expected)
+
+
+def test_neighbors_match_dense():
+
+    centers, radii = create_test_problem()
+
+    expected = total_overlap_volume(centers, radii)
+    result = total_overlap_volume(centers, radii, method='neighbors')
+
+    assert jnp.allclose(result, expected)
+
+
+def test_chunked_gradients_match_all_pairs():
+
+    centers, radii = create_test_problem()
+    pair_list = create_overlap_pair_list(centers, radii)
+
+    # The dense method is not differentiable since it includes the zero distance of each sphere to itself
+    all_pairs = np.triu_indices(len(centers), k=1)
+
+    expected = jax.grad(total_overlap_volume_pairs, argnums=(0, 1))(centers, radii, all_pairs)
+    result = jax.grad(total_overlap_volume_pairs, argnums=(0, 1))(centers, radii, pair_list, 64)
+
+    assert jnp.allclose(total_overlap_volume_pairs(centers, radii, pair_list, 64), total_overlap_volume(centers, radii))
+    assert jnp.allclose(result[0], expected[0])
+    assert jnp.allclose(result[1], expected[1])
+
+
+def test_chunks_compile_once(caplog):
+
+    # Use a size that the other tests have not compiled
+    centers, radii = create_test_problem(n_spheres=300)
+
+    # Move the spheres so that the number of pairs changes
+    with caplog.at_level(logging.WARNING), jax.log_compiles():
+        for scale in (1.0, 0.9, 0.8):
+            pair_list = create_overlap_pair_list(centers * scale, radii)
+            total_overlap_volume_pairs(centers * scale, radii, pair_list, 64).block_until_ready()
+
+    compilations = [record for record in caplog.records
+                    if record.getMessage().startswith('Compiling jit(_chunk_overlap_volume)')]
+    assert len(compilations) == 1
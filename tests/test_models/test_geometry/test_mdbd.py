@@ -0,0 +1,77 @@
+import numpy as np
+from SPI2py.models.geometry.spheres import (recurse_mdbd, compute_distances_to_faces, sample_octree_points,
+                                          convert_primitive_to_mdbd)
+
+
+def create_test_problem():
+
+    x = np.linspace(0, 1, 30)
+    z = np.linspace(0, 0.3, 10)
+    xx, yy, zz = np.meshgrid(x, x, z, indexing='ij')
+    points = np.stack([xx.ravel(), yy.ravel(), zz.ravel()], axis=1)
+    distances = compute_distances_to_faces(points, 0, 1, 0, 1, 0, 0.3)
+
+    # Sort the candidates by their distance from the surface, descending
+    sorted_indices = np.argsort(distances)[::-1]
+    points = points[sorted_indices]
+    distances = distances[sorted_indices]
+
+    return distances[distances > 0], points[distances > 0]
+
+
+def test_kdtree_packing_matches_dense():
+
+    distances, points = create_test_problem()
+
+    expected_count, expected_points, expected_radii = recurse_mdbd(200, distances, points, method='dense')
+    count, sphere_points, sphere_radii = recurse_mdbd(200, distances, points, method='kdtree')
+
+    assert count == expected_count
+    assert np.array_equal(sphere_points, expected_points)
+    assert np.array_equal(sphere_radii, expected_radii)
+
+
+def test_packing_returns_every_sphere():
+
+    distances, points = create_test_problem()
+
+    count, sphere_points, sphere_radii = recurse_mdbd(10, distances, points)
+
+    assert count == 10
+    assert sphere_points.shape == (10, 3)
+    assert sphere_radii.shape == (10, 1)
+
+
+def test_octree_sampling_resolves_thin_features():
+
+    # A unit cube with a thin fin, which a coarse uniform grid barely samples
+    def signed_distance(points):
+        cube = compute_distances_to_faces(points, 0, 1, 0, 1, 0, 1)
+        fin = compute_distances_to_faces(points, 1, 2, 0, 1, 0.47, 0.51)
+        return np.maximum(cube, fin)
+
+    n_steps = 27
+    x = np.linspace(0, 2, n_steps)
+    y = np.linspace(0, 1, n_steps)
+    xx, yy, zz = np.meshgrid(x, y, y, indexing='ij')
+    uniform_points = np.stack([xx.ravel(), yy.ravel(), zz.ravel()], axis=1)
+    uniform_distances = signed_distance(uniform_points)
+
+    octree_points, octree_distances = sample_octree_points(signed_distance, (0, 2, 0, 1, 0, 1),
+                                                           n_steps=8, max_points=n_steps ** 3)
+
+    assert np.all(octree_distances > 0)
+
+    # With a similar number of evaluations, the octree finds larger spheres inside the fin
+    in_fin = octree_points[:, 0] > 1.02
+    uniform_in_fin = uniform_points[:, 0] > 1.02
+    assert octree_distances[in_fin].max() > uniform_distances[uniform_in_fin].max()
+
+
+def test_primitive_octree_sampling():
+
+    sphere_points, sphere_radii = convert_primitive_to_mdbd(0, 1, 0, 0.5, 0, 0.25, n_spheres=20,
+                                                            meshgrid_increment=8, sampling='octree')
+
+    assert sphere_points.shape == (20, 3)
+    assert sphere_radii.shape == (20, 1)
@@ -0,0 +1,59 @@
+import os
+import numpy as np
+import pyvista as pv
+from SPI2py.models.geometry import mdbd_cache
+from SPI2py.models.geometry.mdbd_cache import convert_stl_files_to_mdbd, get_conversion_key
+from SPI2py.models.geometry.spheres import convert_stl_to_mdbd
+
+
+def create_test_problem(directory):
+
+    stl_paths = []
+    for name, bounds in [('box_a', (0, 1, 0, 0.5, 0, 0.5)), ('box_b', (0, 0.4, 0, 0.4, 0, 0.8))]:
+        stl_path = os.path.join(directory, f'{name}.stl')
+        pv.Cube(bounds=bounds).save(stl_path)
+        stl_paths.append(stl_path)
+
+    return stl_paths
+
+
+def test_batch_conversion_matches_sequential(tmp_path):
+
+    stl_paths = create_test_problem(str(tmp_path))
+
+    sphere_sets = convert_stl_files_to_mdbd(stl_paths, str(tmp_path / 'cache'), n_spheres=20, n_steps=15,
+                                            max_workers=2)
+
+    for stl_path, (sphere_points, sphere_radii) in zip(stl_paths, sphere_sets):
+        expected_points, expected_radii = convert_stl_to_mdbd('', stl_path, n_spheres=20, n_steps=15)
+        assert np.allclose(sphere_points, expected_points)
+        assert np.allclose(sphere_radii, expected_radii)
+
+
+def test_cached_conversions_are_reused(tmp_path):
+
+    stl_paths = create_test_problem(str(tmp_path))
+    cache_directory = str(tmp_path / 'cache')
+
+    convert_stl_files_to_mdbd(stl_paths, cache_directory, n_spheres=20, n_steps=15, max_workers=2)
+
+    # Replace a cached entry to detect whether it is converted again
+    key = get_conversion_key(stl_paths[0], n_spheres=20, n_steps=15, scale=1, sdf_method='batch')
+    with open(os.path.join(cache_directory, key + '.xyzr'), 'w') as f:
+        f.write('1 2 3 4\n')
+
+    sphere_sets = convert_stl_files_to_mdbd(stl_paths, cache_directory, n_spheres=20, n_steps=15)
+    assert np.allclose(sphere_sets[0][0], [[1, 2, 3]])
+
+    # Changing a parameter changes the key
+    assert get_conversion_key(stl_paths[0], n_spheres=20, n_steps=16, scale=1, sdf_method='batch') != key
+
+
+def test_cache_version_changes_key(tmp_path, monkeypatch):
+
+    stl_paths = create_test_problem(str(tmp_path))
+    key = get_conversion_key(stl_paths[0], n_spheres=20, n_steps=15)
+
+    monkeypatch.setattr(mdbd_cache, 'MDBD_CACHE_VERSION', mdbd_cache.MDBD_CACHE_VERSION + 1)
+
+    assert get_conversion_key(stl_paths[0], n_spheres=20, n_steps=15) != key
@@ -0,0 +1,38 @@
+import numpy as np
+import pyvista as pv
+from SPI2py.models.geometry.spheres import compute_signed_distance, compute_signed_distance_edt
+
+
+def create_test_problem():
+
+    mesh = pv.Sphere(radius=1.0, theta_resolution=60, phi_resolution=60)
+
+    x = y = z = np.linspace(-1.2, 1.2, 25)
+    xx, yy, zz = np.meshgrid(x, y, z, indexing='ij')
+    points = np.stack([xx.ravel(), yy.ravel(), zz.ravel()], axis=1)
+
+    return mesh, x, y, z, points
+
+
+def test_batch_signed_distance_matches_loop():
+
+    mesh, _, _, _, points = create_test_problem()
+
+    expected = compute_signed_distance(mesh, points, method='loop')
+    result = compute_signed_distance(mesh, points, method='batch')
+
+    assert np.allclose(result, expected)
+    assert np.allclose(result, 1.0 - np.linalg.norm(points, axis=1), atol=1e-2)
+
+
+def test_edt_signed_distance_matches_loop():
+
+    mesh, x, y, z, points = create_test_problem()
+    spacing = x[1] - x[0]
+
+    expected = compute_signed_distance(mesh, points, method='loop').reshape(len(x), len(y), len(z))
+    result = compute_signed_distance_edt(mesh, x, y, z)
+
+    assert result.shape == expected.shape
+    assert np.max(np.abs(result - expected)) < 1.5 * spacing
+    assert np.mean(np.abs(result - expected)) < 0.5 * spacing
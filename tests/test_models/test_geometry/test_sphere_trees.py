@@ -0,0 +1,71 @@
+import numpy as np
+from SPI2py.models.geometry.spheres import convert_primitive_to_mdbd
+from SPI2py.models.geometry.sphere_trees import create_sphere_tree, get_sphere_tree_level, refine_sphere_tree
+
+
+def create_test_problem():
+
+    positions, radii = convert_primitive_to_mdbd(0, 2, 0, 1, 0, 0.5, n_spheres=300, meshgrid_increment=20)
+
+    return positions, radii
+
+
+def test_parents_bound_children():
+
+    positions, radii = create_test_problem()
+    sphere_tree = create_sphere_tree(positions, radii)
+
+    for level, starts in enumerate(sphere_tree.child_starts):
+        parents = np.repeat(np.arange(len(starts) - 1), np.diff(starts))
+        parent_centers = sphere_tree.centers[level][parents]
+        parent_radii = sphere_tree.radii[level][parents]
+        children_centers = sphere_tree.centers[level + 1]
+        children_radii = sphere_tree.radii[level + 1]
+
+        extents = np.linalg.norm(children_centers - parent_centers, axis=1, keepdims=True) + children_radii
+        assert np.all(extents <= parent_radii + 1e-12)
+
+
+def test_levels():
+
+    positions, radii = create_test_problem()
+    sphere_tree = create_sphere_tree(positions, radii)
+
+    assert len(sphere_tree.centers[0]) == 1
+
+    # The leaves are the original spheres
+    leaves = np.hstack([sphere_tree.centers[-1], sphere_tree.radii[-1]])
+    spheres = np.hstack([positions, radii])
+    assert np.array_equal(np.unique(leaves, axis=0), np.unique(spheres, axis=0))
+
+    level, centers, level_radii = get_sphere_tree_level(sphere_tree, max_spheres=64)
+    assert 8 < len(centers) <= 64
+    assert len(sphere_tree.centers[level + 1]) > 64
+
+
+def test_refine_sphere_tree():
+
+    positions, radii = create_test_problem()
+    sphere_tree = create_sphere_tree(positions, radii)
+
+    # Refining everywhere or nowhere returns the leaves or the root
+    centers, _ = refine_sphere_tree(sphere_tree, lambda c, r: np.ones(len(c), dtype=bool))
+    assert len(centers) == len(positions)
+
+    centers, _ = refine_sphere_tree(sphere_tree, lambda c, r: np.zeros(len(c), dtype=bool))
+    assert len(centers) == 1
+
+    # Refine only near the face x = 2
+    def refine(c, r):
+        return c[:, 0] + r[:, 0] > 1.8
+
+    centers, selected_radii = refine_sphere_tree(sphere_tree, refine)
+    assert len(centers) < len(positions)
+
+    # Every leaf near the face is selected, and every leaf is bounded by a selected sphere
+    near = positions[:, 0] + radii[:, 0] > 1.8
+    selected = {tuple(sphere) for sphere in np.hstack([centers, selected_radii])}
+    assert all(tuple(sphere) in selected for sphere in np.hstack([positions, radii])[near])
+
+    extents = np.linalg.norm(positions[:, None] - centers[None], axis=-1) + radii
+    assert np.all(np.any(extents <= selected_radii[:, 0] + 1e-12, axis=1))
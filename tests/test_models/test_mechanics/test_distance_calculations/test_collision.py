@@ -0,0 +1,123 @@
+import numpy as np
+import jax
+import jax.numpy as jnp
+from SPI2py.models.geometry.sphere_trees import create_sphere_tree, refit_sphere_tree
+from SPI2py.models.mechanics.collision import (find_sphere_pairs_within, find_closest_sphere_pairs,
+                                               find_close_component_pairs, get_object_aabbs, sweep_and_prune)
+from SPI2py.models.mechanics.distance import signed_distances_spheres_spheres, signed_distances_sphere_pairs
+
+
+def create_test_problem():
+
+    rng = np.random.default_rng(0)
+    centers_a = rng.uniform(0, 1, (300, 3))
+    radii_a = rng.uniform(0.01, 0.05, (300, 1))
+    centers_b = rng.uniform(0, 1, (200, 3)) + [0.9, 0, 0]
+    radii_b = rng.uniform(0.01, 0.05, (200, 1))
+
+    return centers_a, radii_a, centers_b, radii_b
+
+
+def get_separations(centers_a, radii_a, centers_b, radii_b):
+
+    return -np.asarray(signed_distances_spheres_spheres(jnp.array(centers_a), jnp.array(radii_a),
+                                                        jnp.array(centers_b), jnp.array(radii_b)))
+
+
+def test_pairs_within_cutoff():
+
+    centers_a, radii_a, centers_b, radii_b = create_test_problem()
+    sphere_tree_a = create_sphere_tree(centers_a, radii_a)
+    sphere_tree_b = create_sphere_tree(centers_b, radii_b)
+
+    indices_a, indices_b = find_sphere_pairs_within(sphere_tree_a, sphere_tree_b, cutoff=0.02)
+
+    expected = set(zip(*np.nonzero(get_separations(centers_a, radii_a, centers_b, radii_b) <= 0.02)))
+    assert set(zip(indices_a, indices_b)) == expected
+    assert len(indices_a) == len(expected)
+
+
+def test_closest_pairs():
+
+    centers_a, radii_a, centers_b, radii_b = create_test_problem()
+    sphere_tree_a = create_sphere_tree(centers_a, radii_a)
+    sphere_tree_b = create_sphere_tree(centers_b, radii_b)
+
+    indices_a, indices_b = find_closest_sphere_pairs(sphere_tree_a, sphere_tree_b, k=10)
+
+    separations = get_separations(centers_a, radii_a, centers_b, radii_b)
+    assert np.allclose(separations[indices_a, indices_b], np.sort(separations.reshape(-1))[:10])
+
+
+def test_refit_and_component_pairs():
+
+    centers_a, radii_a, centers_b, radii_b = create_test_problem()
+    sphere_trees = [create_sphere_tree(centers_a, radii_a), create_sphere_tree(centers_b, radii_b),
+                    create_sphere_tree(centers_b + [5, 0, 0], radii_b)]
+
+    # Move the first component toward the second
+    centers_a = centers_a + [0.2, 0, 0]
+    sphere_trees[0] = refit_sphere_tree(sphere_trees[0], centers_a, radii_a)
+
+    component_pairs, _ = find_close_component_pairs(sphere_trees, cutoff=0.0)
+
+    assert [(i, j) for i, j, _ in component_pairs] == [(0, 1)]
+
+    _, _, pair_list = component_pairs[0]
+    expected = set(zip(*np.nonzero(get_separations(centers_a, radii_a, centers_b, radii_b) <= 0.0)))
+    assert set(zip(*pair_list)) == expected
+
+
+def test_pair_signed_distance_gradients():
+
+    centers_a, radii_a, centers_b, radii_b = create_test_problem()
+    centers_a, radii_a, centers_b, radii_b = map(jnp.array, (centers_a, radii_a, centers_b, radii_b))
+    pair_list = find_sphere_pairs_within(create_sphere_tree(centers_a, radii_a),
+                                         create_sphere_tree(centers_b, radii_b), cutoff=0.02)
+
+    def pair_sum(centers):
+        return jnp.sum(signed_distances_sphere_pairs(centers, radii_a, centers_b, radii_b, pair_list))
+
+    def dense_sum(centers):
+        signed_distances = signed_distances_spheres_spheres(centers, radii_a, centers_b, radii_b)
+        return jnp.sum(signed_distances[pair_list])
+
+    assert jnp.allclose(jax.grad(pair_sum)(centers_a), jax.grad(dense_sum)(centers_a))
+
+
+def get_expected_aabb_pairs(aabb_min, aabb_max, margin=0.0):
+
+    overlap = np.all((aabb_min[:, None] - margin <= aabb_max[None]) & (aabb_min[None] - margin <= aabb_max[:, None]), axis=-1)
+
+    return set(zip(*np.nonzero(np.triu(overlap, k=1))))
+
+
+def test_sweep_and_prune():
+
+    rng = np.random.default_rng(0)
+    centers = rng.uniform(0, 10, (500, 3))
+    extents = rng.uniform(0.1, 0.5, (500, 3))
+
+    (first, second), order = sweep_and_prune(centers - extents, centers + extents, margin=0.2)
+
+    assert set(zip(first, second)) == get_expected_aabb_pairs(centers - extents, centers + extents, margin=0.2)
+    assert len(first) == len(set(zip(first, second)))
+
+    # Reuse the order after the objects move
+    centers = centers + rng.normal(0, 0.05, centers.shape)
+    (first, second), _ = sweep_and_prune(centers - extents, centers + extents, margin=0.2, order=order)
+
+    assert set(zip(first, second)) == get_expected_aabb_pairs(centers - extents, centers + extents, margin=0.2)
+
+
+def test_object_aabbs():
+
+    # A component and an interconnect with a single radius
+    centers_list = [np.array([[0., 0., 0.], [1., 0., 0.]]), np.array([[0., 2., 0.], [0., 3., 1.]])]
+    radii_list = [np.array([[0.5], [0.25]]), 0.1]
+
+    aabb_min, aabb_max = get_object_aabbs(centers_list, radii_list)
+
+    assert np.allclose(aabb_min, [[-0.5, -0.5, -0.5], [-0.1, 1.9, -0.1]])
+    assert np.allclose(aabb_max, [[1.25, 0.5, 0.5], [0.1, 3.1, 1.1]])
+
@@ -1,5 +1,7 @@
+import numpy as np
+import jax
 import jax.numpy as jnp
-from SPI2py.models.mechanics.distance import minimum_distances_segments_segments
+from SPI2py.models.mechanics.distance import minimum_distances_segments_segments, minimum_distances_points_segments
 
 # AB is a Point and CD is a Point
 
@@ -444,3 +446,70 @@ def test_skew_vectorized():
 
     assert jnp.all(jnp.isclose(dist, 1.0))
 
+
+def create_random_segments(n=200):
+
+    rng = np.random.default_rng(0)
+    a, b, c, d = (jnp.array(rng.normal(size=(n, 3))) for _ in range(4))
+
+    # Make some segments points and some pairs parallel
+    b = b.at[:20].set(a[:20])
+    d = d.at[20:40].set(c[20:40])
+    d = d.at[40:60].set(c[40:60] + 2 * (b[40:60] - a[40:60]))
+
+    return a, b, c, d
+
+
+def test_random_segments_match_sampling():
+
+    a, b, c, d = create_random_segments()
+
+    dist = minimum_distances_segments_segments(a, b, c, d)
+
+    # Sample both segments densely, which can only overestimate the minimum distance
+    s = np.linspace(0, 1, 201)[:, None]
+    for i in range(0, 200, 5):
+        p = np.asarray(a[i]) + s * np.asarray(b[i] - a[i])
+        q = np.asarray(c[i]) + s * np.asarray(d[i] - c[i])
+        sampled = np.min(np.linalg.norm(p[:, None] - q[None], axis=-1))
+
+        assert dist[i] <= sampled + 1e-12
+        assert dist[i] >= sampled - 1e-3
+
+
+def test_point_segment_matches_segment_segment():
+
+    a, _, c, d = create_random_segments()
+
+    assert jnp.allclose(minimum_distances_points_segments(a, c, d), minimum_distances_segments_segments(a, a, c, d))
+
+
+def test_gradients_are_finite():
+
+    a, b, c, d = create_random_segments()
+
+    # Include coincident points, where the distance is zero
+    c = c.at[60:70].set(a[60:70])
+    d = d.at[60:70].set(a[60:70])
+
+    gradients = jax.grad(lambda *args: jnp.sum(minimum_distances_segments_segments(*args)), argnums=(0, 1, 2, 3))(a, b, c, d)
+    assert all(jnp.all(jnp.isfinite(gradient)) for gradient in gradients)
+
+    gradients = jax.grad(lambda *args: jnp.sum(minimum_distances_points_segments(*args)), argnums=(0, 1, 2))(a, c, d)
+    assert all(jnp.all(jnp.isfinite(gradient)) for gradient in gradients)
+
+
+def test_gradients_match_finite_differences():
+
+    # Skip the degenerate and parallel segments, where the distance is not differentiable
+    a, b, c, d = (array[60:] for array in create_random_segments())
+
+    def total_distance(a):
+        return jnp.sum(minimum_distances_segments_segments(a, b, c, d))
+
+    direction = jnp.array(np.random.default_rng(1).normal(size=a.shape))
+    step = 1e-6
+    finite_difference = (total_distance(a + step * direction) - total_distance(a - step * direction)) / (2 * step)
+
+    assert jnp.isclose(jnp.sum(jax.grad(total_distance)(a) * direction), finite_difference, rtol=1e-5)
+
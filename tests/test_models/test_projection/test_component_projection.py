@@ -1 +1,242 @@
-# def test
\ No newline at end of file
+import logging
+
+import numpy as np
+import jax
+import jax.numpy as jnp
+from SPI2py.models.physics.distributed.mesh import generate_mesh_vec
+from SPI2py.models.geometry.spheres import convert_primitive_to_mdbd
+from SPI2py.models.mechanics.transformations_rigidbody import transform_points
+from SPI2py.models.projection.mesh_kernels import uniform_8_kernel_positions, uniform_8_kernel_radii, create_grid_kernel
+from SPI2py.models.projection.projection import project_component, project_component_jit, get_window_shape, \
+    create_neighbor_list, project_component_neighbors, project_component_cell_list, pad_spheres, \
+    project_components_batched, project_component_pose, project_component_pose_jacobian, project_component_to_window, \
+    project_component_grid_kernel, project_component_grid_kernel_jit
+from SPI2py.models.projection.windows import densify
+
+
+def create_test_problem():
+
+    _, _, centers, nx, ny, nz, _, _, _ = generate_mesh_vec(0, 3, 0, 3, 0, 2, element_size=0.25)
+    grid_centers = centers.reshape(nx, ny, nz, 1, 3)
+    grid_size = jnp.array(0.25)
+
+    kernel_points = jnp.array(uniform_8_kernel_positions)
+    kernel_radii = jnp.array(uniform_8_kernel_radii).reshape(-1, 1)
+
+    rng = np.random.default_rng(0)
+    obj_points = jnp.array(0.7 + 0.5 * rng.random((30, 3)))
+    obj_radii = jnp.array(0.05 + 0.2 * rng.random((30, 1)))
+
+    return grid_centers, grid_size, obj_points, obj_radii, kernel_points, kernel_radii
+
+
+def test_windowed_projection_matches_eager():
+
+    grid_centers, grid_size, obj_points, obj_radii, kernel_points, kernel_radii = create_test_problem()
+    window_shape = get_window_shape(grid_centers, grid_size, obj_points, obj_radii)
+
+    for translation, rotation in [((0., 0., 0.), (0., 0., 0.)),
+                                  ((1.2, 1.5, 0.5), (0.3, 0.2, 0.1)),
+                                  ((-1., 0., 0.), (0., 0., 1.))]:
+
+        points = transform_points(obj_points, obj_points.mean(axis=0), translation, rotation)
+
+        expected, _, _ = project_component(grid_centers, grid_size, points, obj_radii, kernel_points, kernel_radii)
+        result, _, _ = project_component_jit(grid_centers, grid_size, points, obj_radii, kernel_points, kernel_radii,
+                                             window_shape=window_shape)
+
+        assert jnp.allclose(result, expected)
+
+
+def test_window_shape_is_pose_invariant():
+
+    grid_centers, grid_size, obj_points, obj_radii, _, _ = create_test_problem()
+    window_shape = get_window_shape(grid_centers, grid_size, obj_points, obj_radii)
+
+    points = transform_points(obj_points, obj_points.mean(axis=0), (0.5, 0.5, 0.5), (1.0, 0.5, 0.25))
+
+    assert get_window_shape(grid_centers, grid_size, points, obj_radii) == window_shape
+
+
+def test_cell_list_projection_matches_dense():
+
+    grid_centers, grid_size, obj_points, obj_radii, kernel_points, kernel_radii = create_test_problem()
+
+    expected, _, _ = project_component(grid_centers, grid_size, obj_points, obj_radii, kernel_points, kernel_radii)
+    result, _, _ = project_component_cell_list(grid_centers, grid_size, obj_points, obj_radii, kernel_points, kernel_radii)
+
+    assert jnp.allclose(result, expected)
+
+
+def test_neighbor_list_mixed_radii():
+
+    # An MDBD packing mixes a few large spheres with many small ones
+    obj_points, obj_radii = convert_primitive_to_mdbd(0, 1, 0, 1, 0, 1, n_spheres=703, meshgrid_increment=50)
+    obj_radii = obj_radii.reshape(-1, 1)
+    _, _, centers, nx, ny, nz, _, _, _ = generate_mesh_vec(-0.1, 1.1, -0.1, 1.1, -0.1, 1.1, element_size=0.05)
+    grid_centers = np.asarray(centers).reshape(nx, ny, nz, 1, 3)
+    kernel_points = np.array(uniform_8_kernel_positions)
+    kernel_radii = np.array(uniform_8_kernel_radii).reshape(-1, 1)
+
+    element_indices, neighbors, neighbor_mask = create_neighbor_list(grid_centers, 0.05, obj_points, obj_radii,
+                                                                     kernel_points, kernel_radii)
+
+    # Compare with every element-sphere pair
+    kernel_reach = 0.05 * np.max(np.linalg.norm(kernel_points, axis=1) + kernel_radii[:, 0])
+    expected = set()
+    for sphere_id, (point, radius) in enumerate(zip(obj_points, obj_radii[:, 0])):
+        is_close = np.linalg.norm(grid_centers[..., 0, :] - point, axis=-1) < radius + kernel_reach
+        expected.update((tuple(index), sphere_id) for index in np.argwhere(is_close))
+
+    pairs = {(tuple(element_indices[i]), neighbors[i, j]) for i, j in np.argwhere(neighbor_mask)}
+    assert pairs == expected
+    assert np.sum(neighbor_mask) == len(expected)
+
+
+def test_cell_list_projection_gradient():
+
+    grid_centers, grid_size, obj_points, obj_radii, kernel_points, kernel_radii = create_test_problem()
+    neighbor_list = create_neighbor_list(grid_centers, grid_size, obj_points, obj_radii, kernel_points, kernel_radii)
+
+    def total_density(points):
+        densities, _, _ = project_component_neighbors(grid_centers, grid_size, points, obj_radii,
+                                                      kernel_points, kernel_radii, neighbor_list)
+        return jnp.sum(densities)
+
+    gradient = jax.grad(total_density)(obj_points)
+
+    step = 1e-6
+    perturbed_points = obj_points.at[0, 0].add(step)
+    finite_difference = (total_density(perturbed_points) - total_density(obj_points)) / step
+
+    assert jnp.isclose(gradient[0, 0], finite_difference, rtol=1e-4, atol=1e-6)
+
+
+def test_chunked_projection_matches_unchunked():
+
+    grid_centers, grid_size, obj_points, obj_radii, kernel_points, kernel_radii = create_test_problem()
+
+    expected, _, _ = project_component(grid_centers, grid_size, obj_points, obj_radii, kernel_points, kernel_radii)
+    result, _, _ = project_component(grid_centers, grid_size, obj_points, obj_radii, kernel_points, kernel_radii,
+                                     max_bytes=100_000)
+
+    assert jnp.allclose(result, expected)
+
+
+def count_compilations(caplog, function):
+
+    caplog.clear()
+    with caplog.at_level(logging.WARNING), jax.log_compiles():
+        jax.block_until_ready(function())
+
+    return sum(record.getMessage().startswith('Compiling') for record in caplog.records)
+
+
+def test_chunked_projection_compiles_once(caplog):
+
+    grid_centers, grid_size, obj_points, obj_radii, kernel_points, kernel_radii = create_test_problem()
+    grid_kernel = create_grid_kernel(grid_centers, grid_size, kernel_points, kernel_radii)
+
+    def project():
+        return project_component(grid_centers, grid_size, obj_points, obj_radii, kernel_points, kernel_radii,
+                                 max_bytes=100_000)
+
+    def project_grid_kernel():
+        return project_component_grid_kernel(grid_kernel, obj_points, obj_radii, max_bytes=100_000)
+
+    for function in (project, project_grid_kernel):
+        count_compilations(caplog, function)
+        assert count_compilations(caplog, function) == 0
+
+
+def test_batched_projection_matches_individual():
+
+    grid_centers, grid_size, obj_points, obj_radii, kernel_points, kernel_radii = create_test_problem()
+
+    # Split the spheres into objects of different sizes and poses
+    obj_points_list = [obj_points[:5], obj_points[5:20] + 1.0, obj_points[20:] + jnp.array([1.5, 0.0, -0.5])]
+    obj_radii_list = [obj_radii[:5], obj_radii[5:20], obj_radii[20:]]
+
+    window_shapes = [get_window_shape(grid_centers, grid_size, points, radii)
+                     for points, radii in zip(obj_points_list, obj_radii_list)]
+    window_shape = tuple(int(n) for n in np.max(window_shapes, axis=0))
+
+    padded_points, padded_radii, mask = pad_spheres(obj_points_list, obj_radii_list)
+    result = project_components_batched(grid_centers, grid_size, padded_points, padded_radii, mask,
+                                        kernel_points, kernel_radii, window_shape=window_shape)
+
+    assert result.shape == (3,) + grid_centers.shape[:3]
+
+    for i, (points, radii) in enumerate(zip(obj_points_list, obj_radii_list)):
+        expected, _, _ = project_component(grid_centers, grid_size, points, radii, kernel_points, kernel_radii)
+        assert jnp.allclose(result[i], expected)
+
+
+def test_pose_gradient_matches_finite_differences():
+
+    grid_centers, grid_size, obj_points, obj_radii, kernel_points, kernel_radii = create_test_problem()
+    window_shape = get_window_shape(grid_centers, grid_size, obj_points, obj_radii)
+    reference_point = obj_points.mean(axis=0)
+    weights = jnp.array(np.random.default_rng(1).random(grid_centers.shape[:3]))
+
+    def weighted_density(translation, rotation):
+        densities = project_component_pose(grid_centers, grid_size, obj_points, obj_radii, kernel_points,
+                                           kernel_radii, reference_point, translation, rotation, window_shape)
+        return jnp.sum(weights * densities)
+
+    translation = jnp.array([0.3, 0.2, 0.1])
+    rotation = jnp.array([0.2, 0.1, 0.3])
+    grad_translation, grad_rotation = jax.grad(weighted_density, argnums=(0, 1))(translation, rotation)
+
+    step = 1e-6
+    for i in range(3):
+        fd_translation = (weighted_density(translation.at[i].add(step), rotation) -
+                          weighted_density(translation.at[i].add(-step), rotation)) / (2 * step)
+        fd_rotation = (weighted_density(translation, rotation.at[i].add(step)) -
+                       weighted_density(translation, rotation.at[i].add(-step))) / (2 * step)
+
+        assert jnp.isclose(grad_translation[i], fd_translation, rtol=1e-5, atol=1e-8)
+        assert jnp.isclose(grad_rotation[i], fd_rotation, rtol=1e-5, atol=1e-8)
+
+    # The sparse Jacobian must agree with the reverse-mode derivative
+    _, rows, cols, jac_translation, jac_rotation = project_component_pose_jacobian(
+        grid_centers, grid_size, obj_points, obj_radii, kernel_points, kernel_radii, reference_point,
+        translation, rotation, window_shape=window_shape)
+
+    flat_weights = weights.reshape(-1)
+    assert jnp.allclose(jnp.zeros(3).at[cols].add(flat_weights[rows] * jac_translation), grad_translation)
+    assert jnp.allclose(jnp.zeros(3).at[cols].add(flat_weights[rows] * jac_rotation), grad_rotation)
+
+
+def test_windowed_density_matches_full_grid():
+
+    grid_centers, grid_size, obj_points, obj_radii, kernel_points, kernel_radii = create_test_problem()
+    window_shape = get_window_shape(grid_centers, grid_size, obj_points, obj_radii)
+
+    expected, _, _ = project_component(grid_centers, grid_size, obj_points, obj_radii, kernel_points, kernel_radii)
+    windowed_density = project_component_to_window(grid_centers, grid_size, obj_points, obj_radii,
+                                                    kernel_points, kernel_radii, window_shape=window_shape)
+
+    assert windowed_density.values.shape == window_shape
+    assert jnp.allclose(densify(windowed_density, grid_centers.shape[:3]), expected)
+
+
+def test_grid_kernel_projection_matches_eager():
+
+    grid_centers, grid_size, obj_points, obj_radii, kernel_points, kernel_radii = create_test_problem()
+    window_shape = get_window_shape(grid_centers, grid_size, obj_points, obj_radii)
+    grid_kernel = create_grid_kernel(grid_centers, grid_size, kernel_points, kernel_radii)
+
+    points = transform_points(obj_points, obj_points.mean(axis=0), (1.2, 1.5, 0.5), (0.3, 0.2, 0.1))
+
+    expected, expected_points, expected_radii = project_component(grid_centers, grid_size, points, obj_radii,
+                                                                  kernel_points, kernel_radii)
+    result, result_points, result_radii = project_component_grid_kernel(grid_kernel, points, obj_radii)
+    chunked, _, _ = project_component_grid_kernel(grid_kernel, points, obj_radii, max_bytes=100_000)
+    windowed, _, _ = project_component_grid_kernel_jit(grid_kernel, points, obj_radii, window_shape=window_shape)
+
+    assert jnp.allclose(result, expected)
+    assert jnp.allclose(result_points, expected_points)
+    assert jnp.allclose(result_radii, expected_radii)
+    assert jnp.allclose(chunked, expected)
+    assert jnp.allclose(windowed, expected)
@@ -72,3 +72,96 @@
 # r = np.array([[0.5],
 #               [0.5]])
 #
+
+
+import logging
+
+import jax
+import jax.numpy as jnp
+from SPI2py.models.physics.distributed.mesh import generate_mesh_vec
+from SPI2py.models.projection.mesh_kernels import uniform_8_kernel_positions, uniform_8_kernel_radii, \
+    create_uniform_kernel
+from SPI2py.models.geometry.spheres import get_aabb_indices
+from SPI2py.models.projection.projection import project_interconnect, project_interconnect_culled, \
+    create_interconnect_pair_list
+
+
+def create_test_problem():
+
+    _, _, centers, nx, ny, nz, _, _, _ = generate_mesh_vec(0, 3, 0, 3, 0, 2, element_size=0.25)
+    grid_centers = centers.reshape(nx, ny, nz, 1, 3)
+    grid_size = jnp.array(0.25)
+
+    kernel_points = jnp.array(uniform_8_kernel_positions)
+    kernel_radii = jnp.array(uniform_8_kernel_radii).reshape(-1, 1)
+
+    cyl_points = jnp.array([[0.3, 0.3, 0.3], [2.5, 0.5, 1.0], [2.5, 2.5, 1.5]])
+    cyl_radius = jnp.array(0.2)
+
+    return grid_centers, grid_size, cyl_points, cyl_radius, kernel_points, kernel_radii
+
+
+def test_chunked_projection_matches_unchunked():
+
+    grid_centers, grid_size, cyl_points, cyl_radius, kernel_points, kernel_radii = create_test_problem()
+
+    expected, _, _ = project_interconnect(grid_centers, grid_size, cyl_points, cyl_radius, kernel_points, kernel_radii)
+    result, _, _ = project_interconnect(grid_centers, grid_size, cyl_points, cyl_radius, kernel_points, kernel_radii,
+                                        max_bytes=10_000)
+
+    assert jnp.allclose(result, expected)
+
+
+def test_chunked_projection_compiles_once(caplog):
+
+    grid_centers, grid_size, cyl_points, cyl_radius, kernel_points, kernel_radii = create_test_problem()
+
+    for _ in range(2):
+        caplog.clear()
+        with caplog.at_level(logging.WARNING), jax.log_compiles():
+            densities, _, _ = project_interconnect(grid_centers, grid_size, cyl_points, cyl_radius,
+                                                   kernel_points, kernel_radii, max_bytes=10_000)
+            densities.block_until_ready()
+
+    assert not any(record.getMessage().startswith('Compiling') for record in caplog.records)
+
+
+def test_culled_projection_matches_dense():
+
+    grid_centers, grid_size, cyl_points, cyl_radius, kernel_points, kernel_radii = create_test_problem()
+
+    expected, _, _ = project_interconnect(grid_centers, grid_size, cyl_points, cyl_radius, kernel_points, kernel_radii)
+    result, _, _ = project_interconnect_culled(grid_centers, grid_size, cyl_points, cyl_radius,
+                                               kernel_points, kernel_radii)
+
+    assert jnp.allclose(result, expected)
+
+
+def test_culled_projection_matches_dense_circumscription():
+
+    grid_centers, grid_size, cyl_points, cyl_radius, _, _ = create_test_problem()
+    kernel_points, kernel_radii = create_uniform_kernel(1, mode='circumscription')
+    kernel_points = jnp.array(kernel_points).reshape(-1, 3)
+    kernel_radii = jnp.array(kernel_radii).reshape(-1, 1)
+
+    # The circumscribed kernel reaches past the interconnect's AABB
+    for points in (cyl_points, jnp.array([[1., 1., 1.], [2., 1., 1.]])):
+        expected, _, _ = project_interconnect(grid_centers, grid_size, points, cyl_radius, kernel_points, kernel_radii)
+        result, _, _ = project_interconnect_culled(grid_centers, grid_size, points, cyl_radius,
+                                                   kernel_points, kernel_radii)
+
+        assert jnp.allclose(result, expected)
+
+
+def test_culled_projection_skips_empty_elements():
+
+    grid_centers, grid_size, cyl_points, cyl_radius, kernel_points, kernel_radii = create_test_problem()
+
+    element_indices, _ = create_interconnect_pair_list(grid_centers, grid_size, cyl_points, cyl_radius,
+                                                       kernel_points, kernel_radii)
+    expected, _, _ = project_interconnect(grid_centers, grid_size, cyl_points, cyl_radius, kernel_points, kernel_radii)
+
+    # Every element with a nonzero density is listed, and fewer than the AABB's elements are visited
+    assert jnp.count_nonzero(expected) <= len(set(map(tuple, element_indices.tolist())))
+    i1, i2, j1, j2, k1, k2 = get_aabb_indices(grid_centers, grid_size, cyl_points, cyl_radius)
+    assert len(element_indices) < (i2 - i1 + 1) * (j2 - j1 + 1) * (k2 - k1 + 1)
@@ -0,0 +1,134 @@
+import numpy as np
+import jax.numpy as jnp
+from SPI2py.models.physics.distributed.mesh import generate_mesh_vec
+from SPI2py.models.projection import kernel_accuracy
+from SPI2py.models.projection.kernel_accuracy import create_kernel_accuracy_table, measure_volume_error, \
+    select_kernel, select_object_kernel, get_phase_tolerance, get_kernel_accuracy_table, select_phase_kernel, \
+    measure_volume_errors
+from SPI2py.models.projection.kernel_library import get_kernel
+from SPI2py.models.projection.mesh_kernels import create_uniform_kernel
+from SPI2py.models.projection.projection import project_component
+from SPI2py.models.utilities.precision import set_precision
+
+
+def test_uniform_kernel_is_centered():
+
+    positions, radii = create_uniform_kernel(2, mode='inscription')
+    expected_positions, expected_radii = get_kernel('uniform_8')
+
+    assert np.allclose(np.sort(positions.reshape(-1, 3), axis=0), np.sort(expected_positions, axis=0))
+    assert np.allclose(radii.reshape(-1, 1), expected_radii)
+    assert np.allclose(create_uniform_kernel(1, mode='circumscription')[0], 0.0)
+
+
+def test_uniform_kernel_is_cached():
+
+    positions, _ = create_uniform_kernel(3, mode='circumscription')
+
+    assert create_uniform_kernel(3, mode='circumscription')[0] is positions
+    assert not positions.flags.writeable
+
+
+def test_kernel_accuracy_table():
+
+    kernels = {name: get_kernel(name) for name in ('mdbd_9', 'uniform_8', 'mdbd_1')}
+    table = create_kernel_accuracy_table(kernels)
+
+    assert [row['name'] for row in table] == ['mdbd_1', 'uniform_8', 'mdbd_9']
+    assert [row['n_samples'] for row in table] == [1, 8, 9]
+    assert table[1]['volume_error'] == measure_volume_error(*kernels['uniform_8'])
+    assert all(0 <= row['volume_error'] < 1e-2 for row in table)
+
+
+def test_padded_kernels_match_projection():
+
+    kernels = {name: get_kernel(name) for name in ('mdbd_1', 'uniform_8', 'mdbd_9', 'uniform_64')}
+    volume_errors = measure_volume_errors(kernels, element_size=0.5)
+
+    # Project the reference sphere with each kernel separately
+    _, _, centers, nx, ny, nz, _, _, _ = generate_mesh_vec(-2, 2, -2, 2, -2, 2, element_size=0.5)
+    grid_centers = centers.reshape(nx, ny, nz, 1, 3)
+    obj_points = jnp.array([[0.1, 0.05, 0.02]])
+    volume = (4 / 3) * np.pi
+    for name, (positions, radii) in kernels.items():
+        densities, _, _ = project_component(grid_centers, jnp.array(0.5), obj_points, jnp.array([[1.0]]),
+                                            jnp.array(positions), jnp.array(radii))
+        assert np.isclose(volume_errors[name], abs(volume - float(jnp.sum(densities)) * 0.5 ** 3) / volume)
+
+
+def test_volume_error_in_float32():
+
+    expected = measure_volume_error(*get_kernel('uniform_8'), element_size=0.5)
+
+    try:
+        set_precision('float32')
+        result = measure_volume_error(*get_kernel('uniform_8'), element_size=0.5)
+    finally:
+        set_precision('float64')
+
+    assert np.isclose(result, expected, rtol=1e-2)
+
+
+def test_kernel_accuracy_table_is_cached(monkeypatch):
+
+    kernels = {name: get_kernel(name) for name in ('mdbd_1', 'uniform_8')}
+    monkeypatch.setattr(kernel_accuracy, 'get_default_kernels', lambda: kernels)
+    get_kernel_accuracy_table.cache_clear()
+
+    # Measure at the mesh's element size
+    table = get_kernel_accuracy_table(0.5)
+
+    assert get_kernel_accuracy_table(0.5) is table
+    assert table[1]['volume_error'] == measure_volume_error(*kernels['uniform_8'], element_size=0.5)
+    assert select_kernel(0.0, element_size=0.5) == min(table, key=lambda row: row['volume_error'])['name']
+    assert get_kernel_accuracy_table.cache_info().misses == 1
+
+    get_kernel_accuracy_table.cache_clear()
+
+
+def test_select_kernel():
+
+    table = [{'name': 'a', 'n_samples': 1, 'volume_error': 1e-2},
+             {'name': 'b', 'n_samples': 8, 'volume_error': 1e-3},
+             {'name': 'c', 'n_samples': 64, 'volume_error': 1e-4}]
+
+    assert select_kernel(5e-3, table=table) == 'b'
+    assert select_kernel(1e-1, table=table) == 'a'
+    assert select_kernel(1e-5, table=table) == 'c'
+
+
+def test_select_object_kernel():
+
+    _, _, centers, nx, ny, nz, _, _, _ = generate_mesh_vec(0, 2, 0, 2, 0, 2, element_size=0.25)
+    grid_centers = centers.reshape(nx, ny, nz, 1, 3)
+    grid_size = jnp.array(0.25)
+    obj_points = jnp.array([[1.02, 0.97, 1.01]])
+    obj_radii = jnp.array([[0.6]])
+    volume = (4 / 3) * jnp.pi * 0.6 ** 3
+
+    kernels = {name: get_kernel(name) for name in ('mdbd_1', 'uniform_8', 'uniform_64')}
+    errors = {name: select_object_kernel(grid_centers, grid_size, obj_points, obj_radii, volume, np.inf,
+                                         {name: kernel})[1]
+              for name, kernel in kernels.items()}
+
+    assert select_object_kernel(grid_centers, grid_size, obj_points, obj_radii, volume, 1.0, kernels)[0] == 'mdbd_1'
+
+    name, volume_error = select_object_kernel(grid_centers, grid_size, obj_points, obj_radii, volume, 0.0, kernels)
+    assert volume_error == min(errors.values())
+    assert errors[name] == volume_error
+
+
+def test_phase_tolerance():
+
+    assert np.isclose(get_phase_tolerance(0.0, 1e-2, 1e-4), 1e-2)
+    assert np.isclose(get_phase_tolerance(0.5, 1e-2, 1e-4), 1e-3)
+    assert np.isclose(get_phase_tolerance(2.0, 1e-2, 1e-4), 1e-4)
+
+
+def test_select_phase_kernel():
+
+    table = [{'name': 'a', 'n_samples': 1, 'volume_error': 1e-2},
+             {'name': 'b', 'n_samples': 8, 'volume_error': 1e-3},
+             {'name': 'c', 'n_samples': 64, 'volume_error': 1e-4}]
+
+    assert [select_phase_kernel(progress, 1e-2, 1e-4, table=table) for progress in (0.0, 0.5, 1.0)] == ['a', 'b', 'c']
@@ -0,0 +1,32 @@
+import numpy as np
+import pytest
+from SPI2py.models.projection.kernel_library import get_kernel, list_kernels
+from SPI2py.models.projection.mesh_kernels import uniform_8_kernel_positions, uniform_8_kernel_radii
+
+
+def test_packaged_kernels():
+
+    assert {'mdbd', 'mdbd_1', 'mdbd_9', 'uniform_8', 'uniform_64'} <= set(list_kernels())
+
+    positions, radii = get_kernel('uniform_8')
+
+    assert positions.shape == (8, 3)
+    assert radii.shape == (8, 1)
+    assert np.allclose(positions, uniform_8_kernel_positions)
+    assert np.allclose(radii.reshape(-1), uniform_8_kernel_radii)
+
+
+def test_min_radius_truncation():
+
+    positions, radii = get_kernel('mdbd')
+    truncated_positions, truncated_radii = get_kernel('mdbd', min_radius=0.06)
+
+    assert np.all(truncated_radii >= 0.06)
+    assert len(truncated_radii) == np.sum(radii >= 0.06)
+    assert np.allclose(truncated_positions, positions[:len(truncated_radii)])
+
+
+def test_unknown_kernel():
+
+    with pytest.raises(ValueError):
+        get_kernel('uniform_7')
@@ -0,0 +1,64 @@
+import numpy as np
+from SPI2py.models.projection.cache import ProjectionCache, get_mesh_key
+from SPI2py.models.projection.windows import WindowedDensity
+
+
+def project_box(translation):
+    return WindowedDensity(np.asarray(translation, dtype=int).reshape(3), np.ones((2, 2, 2)))
+
+
+def densify_box(translation):
+    densities = np.zeros((4, 4, 4))
+    i, j, k = np.asarray(translation, dtype=int).reshape(3)
+    densities[i:i + 2, j:j + 2, k:k + 2] = 1.0
+    return densities
+
+
+def test_only_moved_objects_are_reprojected():
+
+    translations = [np.array([0., 0., 0.]), np.array([2., 0., 0.]), np.array([0., 2., 2.])]
+    rotation = np.zeros(3)
+
+    cache = ProjectionCache(3, (4, 4, 4))
+    for i, translation in enumerate(translations):
+        cache.update(i, (translation, rotation), lambda t=translation: project_box(t))
+
+    assert cache.n_projections == 3
+
+    # Move one object and revisit the others
+    translations[1] = np.array([2., 2., 0.])
+    for i, translation in enumerate(translations):
+        cache.update(i, (translation, rotation), lambda t=translation: project_box(t))
+
+    assert cache.n_projections == 4
+    assert cache.n_hits == 2
+
+    expected = sum(densify_box(translation) for translation in translations)
+    assert np.allclose(cache.aggregate_densities, expected)
+
+    cache.refresh()
+    assert np.allclose(cache.aggregate_densities, expected)
+
+
+def test_mesh_change_is_reprojected():
+
+    translation = np.array([1., 1., 1.])
+    rotation = np.zeros(3)
+    kernel_radii = np.full((8, 1), 0.5)
+
+    cache = ProjectionCache(1, (4, 4, 4))
+    cache.set_mesh(get_mesh_key(kernel_radii))
+    cache.update(0, (translation, rotation), lambda: project_box(translation))
+    cache.set_mesh(get_mesh_key(kernel_radii))
+    cache.update(0, (translation, rotation), lambda: project_box(translation))
+
+    assert cache.n_projections == 1
+    assert cache.n_hits == 1
+
+    # Change the mesh without moving the object
+    cache.set_mesh(get_mesh_key(0.9 * kernel_radii))
+    cache.update(0, (translation, rotation), lambda: project_box(translation))
+
+    assert cache.n_projections == 2
+    assert cache.n_hits == 1
+    assert np.allclose(cache.aggregate_densities, densify_box(translation))
@@ -0,0 +1,17 @@
+import jax.numpy as jnp
+from SPI2py.models.projection.windows import WindowedDensity, densify, aggregate_windowed_densities
+
+
+def test_aggregate_matches_dense_sum():
+
+    grid_shape = (6, 5, 4)
+    windowed_densities = [WindowedDensity(jnp.array([0, 0, 0]), jnp.ones((2, 2, 2))),
+                          WindowedDensity(jnp.array([1, 1, 1]), 2 * jnp.ones((3, 2, 3))),
+                          WindowedDensity(jnp.array([4, 3, 0]), 3 * jnp.ones((2, 2, 1)))]
+
+    expected = sum(densify(windowed_density, grid_shape) for windowed_density in windowed_densities)
+    result = aggregate_windowed_densities(windowed_densities, grid_shape)
+
+    assert jnp.allclose(result, expected)
+    assert jnp.isclose(jnp.sum(result), 8 + 2 * 18 + 3 * 4)
+    assert jnp.isclose(result[1, 1, 1], 3.0)
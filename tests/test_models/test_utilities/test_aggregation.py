@@ -0,0 +1,34 @@
+import numpy as np
+import jax
+import jax.numpy as jnp
+from SPI2py.models.utilities.aggregation import kreisselmeier_steinhauser_max, kreisselmeier_steinhauser_max_online
+
+
+def test_online_ks_max_matches_stacked():
+
+    rng = np.random.default_rng(0)
+    densities = [jnp.array(rng.random((4, 5, 3))) for _ in range(6)]
+
+    expected = kreisselmeier_steinhauser_max(jnp.stack(densities, axis=3), axis=3)
+    result = kreisselmeier_steinhauser_max_online(densities)
+
+    assert jnp.allclose(result, expected)
+
+
+def test_online_ks_max_gradient_matches_stacked():
+
+    rng = np.random.default_rng(1)
+    densities = [jnp.array(rng.random((4, 5, 3))) for _ in range(6)]
+    weights = jnp.array(rng.random((4, 5, 3)))
+
+    def stacked(densities):
+        return jnp.sum(weights * kreisselmeier_steinhauser_max(jnp.stack(densities, axis=3), axis=3))
+
+    def online(densities):
+        return jnp.sum(weights * kreisselmeier_steinhauser_max_online(densities))
+
+    expected = jax.grad(stacked)(densities)
+    result = jax.grad(online)(densities)
+
+    for result_i, expected_i in zip(result, expected):
+        assert jnp.allclose(result_i, expected_i)
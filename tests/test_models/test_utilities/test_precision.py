@@ -0,0 +1,77 @@
+import pytest
+import numpy as np
+import jax
+import jax.numpy as jnp
+from SPI2py.models.physics.distributed.mesh import generate_mesh_vec
+from SPI2py.models.projection.mesh_kernels import uniform_8_kernel_positions, uniform_8_kernel_radii
+from SPI2py.models.projection.projection import project_component, project_component_pose, get_window_shape
+from SPI2py.models.utilities.precision import set_precision, get_precision
+
+
+def create_test_problem():
+
+    _, _, centers, nx, ny, nz, _, _, _ = generate_mesh_vec(0, 3, 0, 3, 0, 2, element_size=0.25)
+    grid_centers = centers.reshape(nx, ny, nz, 1, 3)
+    grid_size = jnp.array(0.25)
+
+    kernel_points = jnp.array(uniform_8_kernel_positions)
+    kernel_radii = jnp.array(uniform_8_kernel_radii).reshape(-1, 1)
+
+    rng = np.random.default_rng(0)
+    obj_points = jnp.array(0.7 + 0.5 * rng.random((30, 3)))
+    obj_radii = jnp.array(0.05 + 0.2 * rng.random((30, 1)))
+
+    return grid_centers, grid_size, obj_points, obj_radii, kernel_points, kernel_radii
+
+
+@pytest.mark.parametrize('precision, dtype', [('mixed', 'float64'), ('float32', 'float32')])
+def test_reduced_precision_projection(precision, dtype):
+
+    inputs = create_test_problem()
+    expected, _, _ = project_component(*inputs)
+
+    try:
+        set_precision(precision)
+        result, _, _ = project_component(*(array.astype(dtype) for array in inputs))
+    finally:
+        set_precision('float64')
+
+    assert result.dtype == dtype
+    assert jnp.allclose(result, expected, atol=1e-5)
+
+
+@pytest.mark.parametrize('precision, dtype', [('mixed', 'float64'), ('float32', 'float32')])
+def test_reduced_precision_pose_gradient(precision, dtype):
+
+    grid_centers, grid_size, obj_points, obj_radii, kernel_points, kernel_radii = create_test_problem()
+    window_shape = get_window_shape(grid_centers, grid_size, obj_points, obj_radii)
+
+    def total_density(inputs, translation):
+        grid_centers, grid_size, obj_points, obj_radii, kernel_points, kernel_radii = inputs
+        densities = project_component_pose(grid_centers, grid_size, obj_points, obj_radii, kernel_points,
+                                           kernel_radii, obj_points.mean(axis=0), translation,
+                                           jnp.zeros(3, dtype=translation.dtype), window_shape)
+        return jnp.sum(densities)
+
+    inputs = (grid_centers, grid_size, obj_points, obj_radii, kernel_points, kernel_radii)
+    translation = jnp.array([0.3, 0.2, 0.1])
+    expected = jax.value_and_grad(total_density, argnums=1)(inputs, translation)
+
+    try:
+        set_precision(precision)
+        result = jax.value_and_grad(total_density, argnums=1)(tuple(array.astype(dtype) for array in inputs),
+                                                              translation.astype(dtype))
+    finally:
+        set_precision('float64')
+
+    assert result[1].dtype == dtype
+    assert jnp.allclose(result[0], expected[0], rtol=1e-4)
+    assert jnp.allclose(result[1], expected[1], rtol=1e-3, atol=1e-3)
+
+
+def test_invalid_precision():
+
+    with pytest.raises(ValueError):
+        set_precision('float16')
+
+    assert get_precision() == 'float64'
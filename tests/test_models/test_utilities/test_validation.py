@@ -0,0 +1,49 @@
+import os
+import subprocess
+import sys
+
+import pytest
+import jax.numpy as jnp
+from SPI2py.models.geometry.intersection import volume_intersection_two_spheres
+from SPI2py.models.utilities.validation import get_validation
+
+
+def run_with_validation(mode, code):
+
+    environment = dict(os.environ, SPI2PY_VALIDATION=mode)
+
+    return subprocess.run([sys.executable, '-c', code], env=environment, capture_output=True, text=True)
+
+
+def test_strict_validation_rejects_wrong_type():
+
+    radii = jnp.array([[1.0]], dtype='float32')
+    distances = jnp.array([[0.5]], dtype='float32')
+
+    assert get_validation() == 'strict'
+
+    with pytest.raises(AssertionError):
+        volume_intersection_two_spheres(radii, radii, distances)
+
+
+def test_validation_off_skips_checks():
+
+    code = ("import jax.numpy as jnp\n"
+            "from SPI2py.models.geometry.intersection import volume_intersection_two_spheres\n"
+            "from SPI2py.models.utilities import validation\n"
+            "radii = jnp.array([[1.0]], dtype='float32')\n"
+            "print(validation.get_validation(), validation.assert_shape is validation._skip_assertion,\n"
+            "      volume_intersection_two_spheres(radii, radii, radii).shape)\n")
+
+    result = run_with_validation('off', code)
+
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.split() == ['off', 'True', '(1,', '1)']
+
+
+def test_invalid_validation_mode():
+
+    result = run_with_validation('lenient', 'import SPI2py.models.utilities.validation')
+
+    assert result.returncode != 0
+    assert "ValueError: Invalid SPI2PY_VALIDATION value 'lenient'" in result.stderr